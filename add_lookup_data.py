@@ -7,19 +7,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
 from projects.models import LookupData
+from projects.lookups import replace_lookup_values
 
 # Add Project Court options
 courts = ['New', 'Rereview-QSS', 'Rereview-Illuminei']
-for court in courts:
-    obj, created = LookupData.objects.get_or_create(
-        lookup_type='court',
-        value=court,
-        defaults={'is_active': True}
-    )
-    if created:
-        print(f'✓ Added court: {court}')
-    else:
-        print(f'- Court already exists: {court}')
 
 # Add Reviewed By options
 reviewers = [
@@ -41,16 +32,10 @@ reviewers = [
     'Ravisankar H'
 ]
 
-for reviewer in reviewers:
-    obj, created = LookupData.objects.get_or_create(
-        lookup_type='reviewer',
-        value=reviewer,
-        defaults={'is_active': True}
-    )
-    if created:
-        print(f'✓ Added reviewer: {reviewer}')
-    else:
-        print(f'- Reviewer already exists: {reviewer}')
+# One transaction and one bulk insert per type; existing values are kept
+for lookup_type, values in (('court', courts), ('reviewer', reviewers)):
+    result = replace_lookup_values(lookup_type, values, deactivate_missing=False)
+    print(f"✓ {lookup_type}: {result['added']} added, {result['reactivated']} reactivated")
 
 court_count = LookupData.objects.filter(lookup_type='court', is_active=True).count()
 reviewer_count = LookupData.objects.filter(lookup_type='reviewer', is_active=True).count()
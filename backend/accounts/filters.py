@@ -0,0 +1,33 @@
+"""
+Django filters for the user directory.
+"""
+from django.db.models import Q
+from django_filters import rest_framework as filters
+from .models import User
+
+
+class UserFilter(filters.FilterSet):
+    """Prefix search plus team / role / active filters."""
+    
+    q = filters.CharFilter(method='filter_prefix')
+    team = filters.CharFilter(lookup_expr='exact')
+    role = filters.ChoiceFilter(choices=User.ROLE_CHOICES)
+    is_active = filters.BooleanFilter()
+    
+    class Meta:
+        model = User
+        fields = ['q', 'team', 'role', 'is_active']
+    
+    def filter_prefix(self, queryset, name, value):
+        """
+        Match the start of username, first or last name. A leading-anchored
+        LIKE can seek the indexes on these columns; a contains search can't.
+        """
+        value = value.strip()
+        if not value:
+            return queryset
+        return queryset.filter(
+            Q(username__istartswith=value) |
+            Q(first_name__istartswith=value) |
+            Q(last_name__istartswith=value)
+        )
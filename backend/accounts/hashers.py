@@ -0,0 +1,20 @@
+"""
+Password hasher with a deploy-time work factor.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with iterations taken from PASSWORD_PBKDF2_ITERATIONS.
+
+    The algorithm name is unchanged, so existing hashes keep verifying; a
+    hash stored with a different iteration count is re-encoded with the
+    configured count on the user's next successful login. Choose the
+    value with `manage.py bench_password_hash`.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
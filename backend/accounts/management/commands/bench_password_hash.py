@@ -0,0 +1,52 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, get_random_string
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        'Time PBKDF2 password verification at several iteration counts and '
+        'suggest PASSWORD_PBKDF2_ITERATIONS for a per-login latency target. '
+        'Run on the production host type: results depend on the CPU.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations', default='100000,200000,320000,600000,870000',
+            help='Comma-separated iteration counts to time',
+        )
+        parser.add_argument('--target-ms', type=float, default=100.0, help='Per-login hash budget')
+        parser.add_argument('--rounds', type=int, default=5, help='Hashes timed per count')
+
+    def handle(self, *args, **options):
+        hasher = PBKDF2PasswordHasher()
+        password = get_random_string(16)
+        salt = hasher.salt()
+        counts = sorted(int(count) for count in options['iterations'].split(','))
+
+        self.stdout.write(f'Current PASSWORD_PBKDF2_ITERATIONS: {settings.PASSWORD_PBKDF2_ITERATIONS}')
+        self.stdout.write(f'{"iterations":>12}{"median ms":>12}{"logins/s/core":>16}')
+        best = None
+        for count in counts:
+            timings = []
+            for _ in range(options['rounds']):
+                started = time.perf_counter()
+                hasher.encode(password, salt, count)
+                timings.append((time.perf_counter() - started) * 1000)
+            median = statistics.median(timings)
+            self.stdout.write(f'{count:>12}{median:>12.1f}{1000 / median:>16.1f}')
+            if median <= options['target_ms']:
+                best = count
+
+        if best is None:
+            self.stdout.write(self.style.WARNING(
+                f'No tested count verifies within {options["target_ms"]:.0f} ms'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Highest tested count within {options["target_ms"]:.0f} ms: '
+                f'PASSWORD_PBKDF2_ITERATIONS={best}'
+            ))
@@ -0,0 +1,60 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.provisioning import read_roster, provision_users, summarize
+
+
+class Command(BaseCommand):
+    help = (
+        'Create or update users from a CSV or JSON roster (matched by username). '
+        'Columns: username, email, first_name, last_name, password, role, team, '
+        'managed_teams, is_active. Columns a row leaves out are not changed on existing users.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('roster', help='Path to a .csv or .json roster')
+        parser.add_argument('--format', choices=['csv', 'json'], help='Override detection by file suffix')
+        parser.add_argument(
+            '--reset-passwords', action='store_true',
+            help='Also set passwords of existing users (rows with a password only)',
+        )
+        parser.add_argument('--workers', type=int, help='Password hashing processes (default USER_PROVISION_WORKERS)')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help='Validate and report without writing')
+        parser.add_argument('--json', action='store_true', help='Print per-row results as JSON lines')
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['roster'], 'rb') as stream:
+                rows = read_roster(stream, options['format'], options['roster'])
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Could not read roster: {e}')
+
+        started = time.perf_counter()
+        results = provision_users(
+            rows,
+            reset_passwords=options['reset_passwords'],
+            batch_size=options['batch_size'],
+            workers=options['workers'],
+            dry_run=options['dry_run'],
+        )
+        elapsed = time.perf_counter() - started
+
+        for result in results:
+            if options['json']:
+                self.stdout.write(json.dumps(result))
+            elif result['status'] == 'error':
+                self.stdout.write(self.style.ERROR(
+                    f'row {result["row"]} ({result["username"]}): {json.dumps(result["errors"])}'
+                ))
+            else:
+                self.stdout.write(f'row {result["row"]} ({result["username"]}): {result["status"]}')
+
+        summary = summarize(results)
+        prefix = 'Dry run: ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}{summary["created"]} created, {summary["updated"]} updated, '
+            f'{summary["unchanged"]} unchanged, {summary["error"]} failed in {elapsed:.1f}s'
+        ))
@@ -32,6 +32,13 @@ class User(AbstractUser):
         help_text='Team name for team-based filtering'
     )
     
+    managed_teams = models.CharField(
+        max_length=255,
+        blank=True,
+        null=True,
+        help_text='Comma-separated teams a team lead oversees (in addition to their own team)'
+    )
+    
     is_active = models.BooleanField(
         default=True,
         help_text='Designates whether this user should be treated as active.'
@@ -43,6 +50,12 @@ class User(AbstractUser):
     class Meta:
         db_table = 'users'
         ordering = ['username']
+        indexes = [
+            # Prefix search in the user directory (username is already unique)
+            models.Index(fields=['first_name']),
+            models.Index(fields=['last_name']),
+            models.Index(fields=['team', 'role']),
+        ]
     
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
@@ -57,6 +70,31 @@ class User(AbstractUser):
         """Check if user is a team lead."""
         return self.role == 'team_lead'
     
+    @property
+    def lead_teams(self):
+        """Teams this user oversees as a team lead (own team first)."""
+        return self.resolve_lead_teams(self.role, self.team, self.managed_teams)
+    
+    @staticmethod
+    def resolve_lead_teams(role, team, managed_teams):
+        """Lead teams from raw column values (used without loading a User)."""
+        if role != 'team_lead':
+            return []
+        teams = [team] if team else []
+        for managed in (managed_teams or '').split(','):
+            managed = managed.strip()
+            if managed and managed not in teams:
+                teams.append(managed)
+        return teams
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the team-related fields of loaded rows (see accounts.teams)."""
+        from .teams import remember_loaded_state
+        instance = super().from_db(db, field_names, values)
+        remember_loaded_state(instance, field_names)
+        return instance
+    
     def save(self, *args, **kwargs):
         """Override save to set is_staff for admin users."""
         if self.role == 'admin':
@@ -0,0 +1,15 @@
+"""
+Pagination for the user directory.
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """
+    Keyset pagination on the unique username: each page is an index seek
+    past the last username seen, with no COUNT(*) or OFFSET scan.
+    """
+    ordering = 'username'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
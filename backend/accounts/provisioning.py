@@ -0,0 +1,238 @@
+"""
+Bulk user provisioning from a CSV or JSON roster.
+
+Rows are validated up front, passwords are hashed in a process pool
+(PBKDF2 is CPU-bound, so threads would not help), and users are upserted
+by username in batches: new users with bulk_create, existing users with
+bulk_update. Columns a row leaves out are left alone on existing users
+and take CREATE_DEFAULTS on new ones. Every row gets a result entry.
+"""
+import csv
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth.base_user import BaseUserManager
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from .models import User
+from . import teams
+
+ROSTER_FIELDS = [
+    'username', 'email', 'first_name', 'last_name', 'password',
+    'role', 'team', 'managed_teams', 'is_active',
+]
+
+# Values for columns a roster row leaves out, applied to new users only
+CREATE_DEFAULTS = {
+    'email': '', 'first_name': '', 'last_name': '', 'password': '',
+    'role': 'user', 'team': '', 'managed_teams': '', 'is_active': True,
+}
+
+# Below this many passwords the pool start-up costs more than it saves
+MIN_PARALLEL_HASHES = 8
+
+
+class RosterRowSerializer(serializers.Serializer):
+    """
+    One roster row. Uniqueness is not checked: username is the upsert key.
+    No defaults here, so validated_data holds only the columns the row has.
+    """
+
+    username = serializers.CharField(max_length=150)
+    email = serializers.EmailField(required=False, allow_blank=True)
+    first_name = serializers.CharField(max_length=150, required=False, allow_blank=True)
+    last_name = serializers.CharField(max_length=150, required=False, allow_blank=True)
+    password = serializers.CharField(required=False, allow_blank=True)
+    role = serializers.ChoiceField(choices=User.ROLE_CHOICES, required=False)
+    team = serializers.CharField(max_length=100, required=False, allow_blank=True, allow_null=True)
+    managed_teams = serializers.CharField(max_length=255, required=False, allow_blank=True, allow_null=True)
+    is_active = serializers.BooleanField(required=False)
+
+
+def read_roster(stream, fmt=None, name=''):
+    """
+    Parse a roster from a text or binary file object into a list of dicts.
+    `fmt` is 'csv' or 'json'; when omitted it is taken from `name`'s suffix.
+    JSON may be a list of objects or {"users": [...]}.
+    """
+    fmt = fmt or ('json' if name.lower().endswith('.json') else 'csv')
+    content = stream.read()
+    if isinstance(content, bytes):
+        content = content.decode('utf-8-sig')
+
+    if fmt == 'json':
+        rows = json.loads(content)
+        if isinstance(rows, dict):
+            rows = rows.get('users', [])
+        if not isinstance(rows, list):
+            raise ValueError('JSON roster must be a list of users or {"users": [...]}')
+        return rows
+
+    reader = csv.DictReader(io.StringIO(content))
+    # Blank CSV cells mean "use the default", not "empty string"
+    return [{key: value for key, value in row.items() if key and value != ''} for row in reader]
+
+
+def _init_worker(settings_module):
+    # Spawned workers (Windows/macOS) start without Django configured
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    django.setup()
+
+
+def hash_passwords(passwords, workers=None):
+    """Hash `passwords` with the default hasher, in parallel when worthwhile."""
+    workers = workers or settings.USER_PROVISION_WORKERS
+    if workers <= 1 or len(passwords) < MIN_PARALLEL_HASHES:
+        return [make_password(password) for password in passwords]
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings'),),
+    ) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+def _validate(rows):
+    """Split raw rows into ({index: cleaned row}, [error results])."""
+    valid = {}
+    failed = []
+    seen = {}
+    for index, row in enumerate(rows, start=1):
+        serializer = RosterRowSerializer(data=row)
+        if not serializer.is_valid():
+            failed.append({
+                'row': index, 'username': row.get('username') if isinstance(row, dict) else None,
+                'status': 'error', 'errors': serializer.errors,
+            })
+            continue
+        data = serializer.validated_data
+        data['username'] = User.normalize_username(data['username'])
+        if 'email' in data:
+            data['email'] = BaseUserManager.normalize_email(data['email'])
+        if data['username'] in seen:
+            failed.append({
+                'row': index, 'username': data['username'], 'status': 'error',
+                'errors': {'username': [f'Duplicate of row {seen[data["username"]]}.']},
+            })
+            continue
+        seen[data['username']] = index
+        valid[index] = data
+    return valid, failed
+
+
+def count_passwords(rows):
+    """Upper bound on the passwords provision_users() would hash for `rows`."""
+    return sum(1 for row in rows if isinstance(row, dict) and row.get('password'))
+
+
+def _apply(user, data, now):
+    """Copy the row's columns onto `user`; return the names of fields that changed."""
+    changed = []
+    for field in ROSTER_FIELDS:
+        if field in ('username', 'password') or field not in data:
+            continue
+        if getattr(user, field) != data[field]:
+            setattr(user, field, data[field])
+            changed.append(field)
+    # Same rule as User.save()
+    if user.role == 'admin' and not user.is_staff:
+        user.is_staff = True
+        changed.append('is_staff')
+    if changed:
+        # bulk_update skips auto_now, so updated_at is set explicitly
+        user.updated_at = now
+        changed.append('updated_at')
+    return changed
+
+
+def provision_users(rows, reset_passwords=False, batch_size=500, workers=None, dry_run=False):
+    """
+    Upsert users from roster rows by username.
+
+    New users get the row's password (or an unusable one when it is
+    blank); existing users keep theirs unless `reset_passwords` is set.
+    Only the columns present in a row are written to existing users.
+    Returns a list of {'row', 'username', 'status', ...} dicts in roster
+    order, with status 'created', 'updated', 'unchanged' or 'error'. A
+    batch whose write fails (e.g. a username created concurrently) is
+    rolled back and its rows reported as errors.
+    """
+    valid, results = _validate(rows)
+    indexes = list(valid)
+    now = timezone.now()
+    written = False
+
+    for start in range(0, len(indexes), batch_size):
+        batch = indexes[start:start + batch_size]
+        usernames = [valid[index]['username'] for index in batch]
+        existing = User.objects.in_bulk(usernames, field_name='username')
+
+        # Hash only the passwords that will actually be written
+        to_hash = [
+            index for index in batch
+            if valid[index]['username'] not in existing
+            or (reset_passwords and valid[index].get('password'))
+        ]
+        hashes = dict(zip(to_hash, hash_passwords(
+            [valid[index].get('password') or None for index in to_hash], workers
+        )))
+
+        created, updated, update_fields, batch_results = [], [], set(), []
+        for index in batch:
+            data = valid[index]
+            user = existing.get(data['username'])
+            if user is None:
+                user = User(username=data['username'], is_staff=False)
+                _apply(user, {**CREATE_DEFAULTS, **data}, now)
+                created.append(user)
+                status = 'created'
+            else:
+                changed = _apply(user, data, now)
+                if index in hashes:
+                    changed += ['password', 'updated_at']
+                    user.updated_at = now
+                if changed:
+                    updated.append(user)
+                    update_fields.update(changed)
+                status = 'updated' if changed else 'unchanged'
+            if index in hashes:
+                user.password = hashes[index]
+            batch_results.append({'row': index, 'username': data['username'], 'status': status})
+
+        if not dry_run and (created or updated):
+            try:
+                with transaction.atomic():
+                    User.objects.bulk_create(created)
+                    if updated:
+                        User.objects.bulk_update(updated, sorted(update_fields))
+            except IntegrityError as e:
+                for result in batch_results:
+                    if result['status'] != 'unchanged':
+                        result['status'] = 'error'
+                        result['errors'] = {'non_field_errors': [f'Batch not saved: {e}']}
+            else:
+                written = True
+        results.extend(batch_results)
+
+    if written:
+        # bulk_create/bulk_update don't send post_save
+        teams.invalidate()
+
+    results.sort(key=lambda result: result['row'])
+    return results
+
+
+def summarize(results):
+    """Count results by status."""
+    summary = {'created': 0, 'updated': 0, 'unchanged': 0, 'error': 0}
+    for result in results:
+        summary[result['status']] += 1
+    return summary
@@ -15,6 +15,13 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
+class UserCompactSerializer(serializers.Serializer):
+    """id/username pairs for dropdowns (reads `.values('id', 'username')` rows)."""
+    
+    id = serializers.IntegerField(read_only=True)
+    username = serializers.CharField(read_only=True)
+
+
 class LoginSerializer(serializers.Serializer):
     """Serializer for user login."""
     
@@ -25,18 +32,18 @@ class LoginSerializer(serializers.Serializer):
         username = data.get('username')
         password = data.get('password')
         
-        logger.info(f"Validating login for username: {username}")
+        logger.info("Validating login for username: %s", username)
         
         if username and password:
             user = authenticate(username=username, password=password)
-            logger.info(f"Authentication result for {username}: {user}")
+            logger.info("Authentication result for %s: %s", username, user)
             if user:
                 if not user.is_active:
-                    logger.warning(f"User {username} is not active")
+                    logger.warning("User %s is not active", username)
                     raise serializers.ValidationError('User account is disabled.')
                 data['user'] = user
             else:
-                logger.error(f"Authentication failed for username: {username}")
+                logger.error("Authentication failed for username: %s", username)
                 raise serializers.ValidationError('Invalid username or password.')
         else:
             raise serializers.ValidationError('Must include "username" and "password".')
@@ -0,0 +1,22 @@
+"""
+Signal handlers for the accounts app.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import User
+from . import teams
+
+
+@receiver(post_save, sender=User)
+def invalidate_team_directory(sender, instance, created, update_fields=None, **kwargs):
+    """Team membership or roles changed (not on logins or password rehashes)."""
+    if teams.membership_changed(instance, created, update_fields):
+        teams.invalidate()
+    instance._membership_state = teams.membership_state(instance)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_team_directory_on_delete(sender, **kwargs):
+    """A member left their team."""
+    teams.invalidate()
@@ -0,0 +1,125 @@
+"""
+In-memory team membership index, cached per worker process.
+
+Maps each team to the ids of its members and each user to their team, so
+"projects visible to this user" becomes `created_by_id IN (...)` on an
+indexed column with no join to users. The index is rebuilt when a
+User is created or deleted, or saved with a changed MEMBERSHIP_FIELDS
+value (see accounts.signals), so logins and password rehashes leave it
+alone. It is rebuilt locally at once, and in other workers when they
+notice the version bump in the shared cache (or after TEAM_DIRECTORY_TTL
+seconds when the cache is per-process).
+"""
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import User
+
+VERSION_KEY = 'accounts:team_directory_version'
+
+# User fields that decide which projects someone may see
+MEMBERSHIP_FIELDS = ('team', 'role', 'managed_teams', 'is_active')
+
+
+class TeamDirectory:
+    """Immutable snapshot of team membership."""
+
+    def __init__(self, rows):
+        members = defaultdict(set)
+        self.teams_by_user = {}
+        for user_id, team in rows:
+            self.teams_by_user[user_id] = team
+            if team:
+                members[team].add(user_id)
+        self.members_by_team = {team: frozenset(ids) for team, ids in members.items()}
+
+    def team_of(self, user_id):
+        return self.teams_by_user.get(user_id)
+
+    def members(self, team):
+        return self.members_by_team.get(team, frozenset())
+
+    @staticmethod
+    def visible_teams(user):
+        """Teams whose projects `user` may see: all lead teams for team leads."""
+        if user.is_team_lead:
+            return user.lead_teams
+        return [user.team] if user.team else []
+
+    def visible_creator_ids(self, user):
+        """
+        Ids of users whose projects `user` may see, or None for "everyone" (admins).
+        Users without a team see only their own projects.
+        """
+        if user.is_admin:
+            return None
+        ids = {user.id}
+        for team in self.visible_teams(user):
+            ids |= self.members(team)
+        return frozenset(ids)
+
+
+def membership_state(user):
+    return tuple(getattr(user, field) for field in MEMBERSHIP_FIELDS)
+
+
+def remember_loaded_state(user, field_names):
+    """Called from User.from_db with the loaded column names."""
+    if all(field in field_names for field in MEMBERSHIP_FIELDS):
+        user._membership_state = membership_state(user)
+
+
+def membership_changed(user, created, update_fields):
+    """Whether saving `user` may have changed what anyone can see."""
+    if created:
+        return True
+    if update_fields is not None and not set(update_fields) & set(MEMBERSHIP_FIELDS):
+        return False
+    loaded = getattr(user, '_membership_state', None)
+    return loaded is None or loaded != membership_state(user)
+
+
+_lock = threading.Lock()
+_directory = None
+_version = None
+_loaded_at = 0.0
+_checked_at = 0.0
+
+
+def _load():
+    return TeamDirectory(list(User.objects.values_list('id', 'team')))
+
+
+def get_directory():
+    """Return the current directory, rebuilding it if stale."""
+    global _directory, _version, _loaded_at, _checked_at
+
+    now = time.monotonic()
+    directory = _directory
+    if directory is not None and now - _checked_at < settings.TEAM_DIRECTORY_CHECK_SECONDS:
+        return directory
+
+    version = cache.get(VERSION_KEY, 0)
+    with _lock:
+        _checked_at = now
+        expired = now - _loaded_at > settings.TEAM_DIRECTORY_TTL
+        if _directory is None or version != _version or expired:
+            _directory = _load()
+            _version = version
+            _loaded_at = now
+        return _directory
+
+
+def invalidate():
+    """Drop this worker's copy and tell other workers to rebuild theirs."""
+    global _directory
+    with _lock:
+        _directory = None
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, timeout=None)
@@ -0,0 +1,74 @@
+"""
+Login rate limiting and lockout, kept in the cache rather than the database.
+
+Two DRF throttles cap attempts per client IP and per username before any
+password is hashed. Separately, repeated failures lock a username for
+LOGIN_LOCKOUT_SECONDS. With REDIS_URL set, the counters are shared by
+all workers; otherwise each worker counts on its own.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import SimpleRateThrottle
+
+
+def _username_key(username):
+    # Usernames compare case-insensitively under the SQL Server collation
+    return str(username).strip().lower()
+
+
+class LoginIPThrottle(SimpleRateThrottle):
+    """Login attempts per client IP (rate 'login_ip')."""
+    scope = 'login_ip'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class LoginUsernameThrottle(SimpleRateThrottle):
+    """Login attempts per username, from any IP (rate 'login_username')."""
+    scope = 'login_username'
+
+    def get_cache_key(self, request, view):
+        username = request.data.get('username')
+        if not username:
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': _username_key(username)}
+
+
+def locked_for(username):
+    """Seconds until `username` may try again, or 0 if not locked."""
+    if not username:
+        return 0
+    until = cache.get(f'login:locked:{_username_key(username)}')
+    return max(0, int(until - time.time()) + 1) if until else 0
+
+
+def record_failure(username):
+    """Count a failed login; lock the username once the limit is reached."""
+    if not username:
+        return
+    key = _username_key(username)
+    failures_key = f'login:failures:{key}'
+    if cache.add(failures_key, 1, timeout=settings.LOGIN_FAILURE_WINDOW):
+        failures = 1
+    else:
+        try:
+            failures = cache.incr(failures_key)
+        except ValueError:
+            # Expired between add() and incr()
+            cache.set(failures_key, 1, timeout=settings.LOGIN_FAILURE_WINDOW)
+            failures = 1
+    if failures >= settings.LOGIN_LOCKOUT_FAILURES:
+        cache.set(
+            f'login:locked:{key}',
+            time.time() + settings.LOGIN_LOCKOUT_SECONDS,
+            timeout=settings.LOGIN_LOCKOUT_SECONDS,
+        )
+        cache.delete(failures_key)
+
+
+def clear_failures(username):
+    """Reset the failure count after a successful login."""
+    cache.delete(f'login:failures:{_username_key(username)}')
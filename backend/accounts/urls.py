@@ -4,6 +4,8 @@ from .views import (
     logout_view,
     current_user_view,
     UserListCreateView,
+    UserDirectoryView,
+    bulk_provision_view,
     UserDetailView,
 )
 
@@ -12,5 +14,7 @@ urlpatterns = [
     path('logout/', logout_view, name='logout'),
     path('me/', current_user_view, name='current-user'),
     path('users/', UserListCreateView.as_view(), name='user-list-create'),
+    path('users/bulk/', bulk_provision_view, name='user-bulk-provision'),
+    path('users/directory/', UserDirectoryView.as_view(), name='user-directory'),
     path('users/<int:pk>/', UserDetailView.as_view(), name='user-detail'),
 ]
@@ -1,13 +1,20 @@
 from rest_framework import status, generics
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
+from django.conf import settings
 from django.contrib.auth import login, logout
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from .models import User
-from .serializers import UserSerializer, LoginSerializer, UserCreateSerializer
+from django_filters.rest_framework import DjangoFilterBackend
+from .serializers import UserSerializer, LoginSerializer, UserCreateSerializer, UserCompactSerializer
 from .permissions import IsAdmin
+from .filters import UserFilter
+from .pagination import UserCursorPagination
+from .provisioning import count_passwords, read_roster, provision_users, summarize
+from .throttling import LoginIPThrottle, LoginUsernameThrottle, locked_for, record_failure, clear_failures
+from .teams import get_directory
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,23 +23,39 @@ logger = logging.getLogger(__name__)
 @csrf_exempt
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([LoginIPThrottle, LoginUsernameThrottle])
 def login_view(request):
     """
     User login endpoint.
     Creates a session for authenticated user.
+    Rate limited per IP and per username; repeated failures lock the
+    username for a while (see accounts.throttling).
     """
-    logger.info(f"Login attempt for username: {request.data.get('username')}")
+    username = request.data.get('username')
+    logger.info("Login attempt for username: %s", username)
+    
+    retry_after = locked_for(username)
+    if retry_after:
+        logger.warning("Login rejected for locked username: %s", username)
+        return Response(
+            {'error': 'Too many failed login attempts. Try again later.'},
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={'Retry-After': str(retry_after)},
+        )
+    
     serializer = LoginSerializer(data=request.data)
     if serializer.is_valid():
         user = serializer.validated_data['user']
+        clear_failures(username)
         login(request, user)
         user_data = UserSerializer(user).data
-        logger.info(f"Login successful for user: {user.username}")
+        logger.info("Login successful for user: %s", user.username)
         return Response({
             'message': 'Login successful',
             'user': user_data
         }, status=status.HTTP_200_OK)
-    logger.error(f"Login failed: {serializer.errors}")
+    logger.error("Login failed: %s", serializer.errors)
+    record_failure(username)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -60,11 +83,15 @@ def current_user_view(request):
 class UserListCreateView(generics.ListCreateAPIView):
     """
     List all users or create a new user (admin only).
-    GET: List all users
+    GET: List users, cursor-paginated by username
+         (?q=<prefix>&team=&role=&is_active=&page_size=)
     POST: Create new user
     """
     queryset = User.objects.all()
     permission_classes = [IsAuthenticated, IsAdmin]
+    pagination_class = UserCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = UserFilter
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -76,8 +103,72 @@ class UserListCreateView(generics.ListCreateAPIView):
         user = self.request.user
         if user.is_admin:
             return User.objects.all()
-        # Regular users can only see users in their team
-        return User.objects.filter(team=user.team)
+        # Others only see users in the teams they can see (see accounts.teams)
+        return User.objects.filter(id__in=get_directory().visible_creator_ids(user))
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def bulk_provision_view(request):
+    """
+    Create or update users in bulk (admin only).
+    Body: {"users": [...], "reset_passwords": false, "dry_run": false},
+    or a multipart upload with a CSV/JSON roster in `file`.
+    Users are matched by username; the response has one result per row.
+    Passwords are hashed in the request, so at most
+    USER_PROVISION_API_MAX_PASSWORDS rows may carry one; larger rosters
+    go through `manage.py import_users`.
+    """
+    upload = request.FILES.get('file')
+    try:
+        if upload is not None:
+            rows = read_roster(upload, name=upload.name)
+        else:
+            rows = request.data.get('users')
+    except ValueError as e:
+        return Response({'error': f'Invalid roster: {e}'}, status=status.HTTP_400_BAD_REQUEST)
+    if not isinstance(rows, list) or not rows:
+        return Response({'error': 'No users provided'}, status=status.HTTP_400_BAD_REQUEST)
+    if count_passwords(rows) > settings.USER_PROVISION_API_MAX_PASSWORDS:
+        return Response({
+            'error': (
+                f'At most {settings.USER_PROVISION_API_MAX_PASSWORDS} rows with a password per request; '
+                'split the roster or use `manage.py import_users`.'
+            ),
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    results = provision_users(
+        rows,
+        reset_passwords=str(request.data.get('reset_passwords')).lower() in ('true', '1'),
+        dry_run=str(request.data.get('dry_run')).lower() in ('true', '1'),
+    )
+    logger.info("Bulk provisioning by %s: %s", request.user.username, summarize(results))
+    
+    return Response({
+        'summary': summarize(results),
+        'results': results,
+    })
+
+
+class UserDirectoryView(generics.ListAPIView):
+    """
+    Compact id/username listing for dropdowns, cursor-paginated by username.
+    Admin: all users
+    Others: users in the teams they can see (see accounts.teams)
+    Accepts the same filters as the user list.
+    """
+    serializer_class = UserCompactSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = UserCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = UserFilter
+    
+    def get_queryset(self):
+        user = self.request.user
+        queryset = User.objects.all()
+        if not user.is_admin:
+            queryset = queryset.filter(id__in=get_directory().visible_creator_ids(user))
+        return queryset.values('id', 'username')
 
 
 class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
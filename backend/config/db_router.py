@@ -0,0 +1,72 @@
+"""
+Read-replica routing.
+
+Writes always go to `default`. Reads of REPLICA_APPS models go to the
+`replica` database (when configured) only while replica reads are
+enabled for the current request or block; ReplicaRoutingMiddleware
+enables them for read-only requests that aren't pinned to the primary.
+Sessions, users and other auth tables are always read from `default`,
+so a just-created session or user is never missed because of lag.
+"""
+import contextvars
+from contextlib import contextmanager
+
+from django.conf import settings
+
+REPLICA_ALIAS = 'replica'
+
+_replica_reads = contextvars.ContextVar('replica_reads', default=False)
+
+
+def replica_configured():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def enable_replica_reads():
+    """Enable replica reads until reset_replica_reads(token)."""
+    return _replica_reads.set(True)
+
+
+def reset_replica_reads(token):
+    _replica_reads.reset(token)
+
+
+@contextmanager
+def replica_reads():
+    """Send reads in this block to the replica (if configured)."""
+    token = enable_replica_reads()
+    try:
+        yield
+    finally:
+        reset_replica_reads(token)
+
+
+def use_replica(view):
+    """Mark a POST view as read-only so its reads may use the replica (e.g. exports)."""
+    view.replica_reads = True
+    return view
+
+
+class ReplicaRouter:
+    """Route REPLICA_APPS reads to the replica while replica reads are enabled."""
+
+    def db_for_read(self, model, **hints):
+        if (
+            _replica_reads.get()
+            and model._meta.app_label in settings.REPLICA_APPS
+            and replica_configured()
+        ):
+            return REPLICA_ALIAS
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # A real replica gets its schema through replication; a local SQLite
+        # replica is created with `migrate --database replica`
+        return True
@@ -0,0 +1,167 @@
+"""
+Logging handlers for IE LOGS.
+
+Request threads only put records on an in-memory queue (AsyncLogHandler);
+a background listener thread per process formats them and does the disk
+and console I/O. The log file is JSON lines with size-based rotation.
+"""
+import atexit
+import copy
+import itertools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+# Attributes every LogRecord has; anything else came from `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; `extra=` fields are included as keys."""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S%z'),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'process': record.process,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        if record.stack_info:
+            entry['stack'] = record.stack_info
+        return json.dumps(entry, default=str)
+
+
+class SharedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that several worker processes can share: the file
+    is opened on the first record (creating its directory), and reopened
+    when another process has rotated it away.
+    """
+
+    def __init__(self, filename, max_bytes=0, backup_count=0, encoding='utf-8'):
+        self.dev, self.ino = -1, -1
+        super().__init__(
+            filename, maxBytes=max_bytes, backupCount=backup_count,
+            encoding=encoding, delay=True,
+        )
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        stream = super()._open()
+        stat = os.fstat(stream.fileno())
+        self.dev, self.ino = stat.st_dev, stat.st_ino
+        return stream
+
+    def setStream(self, stream):
+        previous = super().setStream(stream)
+        stat = os.fstat(stream.fileno())
+        self.dev, self.ino = stat.st_dev, stat.st_ino
+        return previous
+
+    def emit(self, record):
+        if self.stream is not None:
+            try:
+                stat = os.stat(self.baseFilename)
+                rotated = (stat.st_dev, stat.st_ino) != (self.dev, self.ino)
+            except FileNotFoundError:
+                rotated = True
+            if rotated:
+                self.stream.close()
+                self.stream = None
+        super().emit(record)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep one in every `1 / rate` INFO-or-lower records from `loggers`
+    (name prefixes). Warnings and errors always pass.
+    """
+
+    def __init__(self, rate=1.0, loggers=()):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self.loggers = tuple(loggers)
+        self._counter = itertools.count()
+
+    def filter(self, record):
+        if record.levelno > logging.INFO or self.every == 1:
+            return True
+        if self.loggers and not record.name.startswith(self.loggers):
+            return True
+        return self.every and next(self._counter) % self.every == 0
+
+
+class AsyncLogHandler(logging.handlers.QueueHandler):
+    """
+    Queue-backed handler: emit() is a non-blocking put and a QueueListener
+    thread writes JSON lines to `filename` (rotated at `max_bytes`) and
+    plain text to stderr. The listener starts lazily in each process, so
+    it also works in workers forked from a preloaded gunicorn master.
+    """
+
+    def __init__(self, filename, max_bytes=10 * 1024 * 1024, backup_count=5, console=True):
+        super().__init__(queue.SimpleQueue())
+        file_handler = SharedRotatingFileHandler(filename, max_bytes, backup_count)
+        file_handler.setFormatter(JsonFormatter())
+        self.targets = [file_handler]
+        if console:
+            console_handler = logging.StreamHandler(sys.stderr)
+            console_handler.setFormatter(
+                logging.Formatter('{levelname} {asctime} {module} {message}', style='{')
+            )
+            self.targets.append(console_handler)
+        self._listener = None
+        self._listener_pid = None
+        atexit.register(self.stop)
+
+    def _ensure_listener(self):
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        # Threads don't survive fork: start a fresh queue and listener here
+        self.queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            self.queue, *self.targets, respect_handler_level=True
+        )
+        self._listener.start()
+        self._listener_pid = pid
+
+    def prepare(self, record):
+        """
+        Render the message (so later mutation of args can't change it) and
+        the traceback; all other formatting happens on the listener thread.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record):
+        self._ensure_listener()
+        super().emit(record)
+
+    def stop(self):
+        """Flush queued records (called at interpreter exit)."""
+        if self._listener is not None and self._listener_pid == os.getpid():
+            self._listener.stop()
+            self._listener = None
+            self._listener_pid = None
+        for target in self.targets:
+            target.flush()
@@ -0,0 +1,239 @@
+"""
+Prometheus metrics for IE LOGS, served in text format at /metrics.
+
+Under gunicorn every worker writes its samples to memory-mapped files in
+PROMETHEUS_MULTIPROC_DIR (prometheus_client multiprocess mode, set up in
+gunicorn.conf.py) and /metrics aggregates the files of all workers, so
+any worker can answer a scrape. Without that variable (runserver,
+management commands) samples stay in this process's default registry.
+
+Updating a sample is an in-process counter/mmap write behind an
+uncontended lock, a few microseconds at most; label children that are
+hit on every request or query are resolved once and cached.
+"""
+import hmac
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+    generate_latest, multiprocess,
+)
+
+NAMESPACE = 'ielogs'
+
+REQUESTS = Counter(
+    'http_requests_total', 'HTTP requests by view, method and status code',
+    ['view', 'method', 'status'], namespace=NAMESPACE,
+)
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'Request latency by view and method',
+    ['view', 'method'], namespace=NAMESPACE,
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+REQUEST_QUERIES = Histogram(
+    'http_request_db_queries', 'Database queries per request, by view',
+    ['view'], namespace=NAMESPACE,
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144),
+)
+
+# Its _count series is the query count, so queries need no separate counter
+DB_QUERY_LATENCY = Histogram(
+    'db_query_duration_seconds', 'Database query duration by connection alias',
+    ['alias'], namespace=NAMESPACE,
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DB_QUERY_ERRORS = Counter(
+    'db_query_errors_total', 'Database queries that raised, by connection alias',
+    ['alias'], namespace=NAMESPACE,
+)
+
+EXPORTS = Counter(
+    'export_jobs_total', 'Export jobs by format and outcome',
+    ['format', 'outcome'], namespace=NAMESPACE,
+)
+EXPORT_LATENCY = Histogram(
+    'export_duration_seconds', 'Export job duration by format',
+    ['format'], namespace=NAMESPACE,
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+EXPORT_ROWS = Counter(
+    'export_rows_total', 'Rows written by export jobs, by format',
+    ['format'], namespace=NAMESPACE,
+)
+
+CACHE_LOOKUPS = Counter(
+    'cache_lookups_total',
+    'Cache lookups by cache and result (hit rate = hit / (hit + miss))',
+    ['cache', 'result'], namespace=NAMESPACE,
+)
+
+# Gunicorn worker stats, updated from the hooks in gunicorn.conf.py
+WORKERS = Gauge(
+    'gunicorn_workers', 'Live gunicorn worker processes',
+    namespace=NAMESPACE, multiprocess_mode='livesum',
+)
+WORKER_STARTED = Gauge(
+    'gunicorn_worker_start_time_seconds', 'Start time of each live worker (unix time)',
+    namespace=NAMESPACE, multiprocess_mode='liveall',
+)
+WORKER_EXITS = Counter(
+    'gunicorn_worker_exits_total', 'Worker process exits (any reason)',
+    namespace=NAMESPACE,
+)
+WORKER_TIMEOUTS = Counter(
+    'gunicorn_worker_timeouts_total', 'Workers aborted by the master for exceeding the request timeout',
+    namespace=NAMESPACE,
+)
+
+
+def multiprocess_enabled():
+    # Same test prometheus_client applies when choosing its value class
+    return 'PROMETHEUS_MULTIPROC_DIR' in os.environ
+
+
+def render():
+    """Text exposition of all worker processes (or of this one)."""
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
+
+
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint. When METRICS_TOKEN is set the scraper must
+    send it as `Authorization: Bearer <token>`.
+    """
+    from django.conf import settings
+    from django.http import HttpResponse
+
+    token = settings.METRICS_TOKEN
+    if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponse(status=401)
+    return HttpResponse(render(), content_type=CONTENT_TYPE_LATEST)
+
+
+class _Children(dict):
+    """label values -> bound metric child, resolved once per process."""
+
+    def __init__(self, metric):
+        super().__init__()
+        self.metric = metric
+
+    def __missing__(self, labels):
+        child = self[labels] = self.metric.labels(*labels)
+        return child
+
+
+_requests = _Children(REQUESTS)
+_request_latency = _Children(REQUEST_LATENCY)
+_request_queries = _Children(REQUEST_QUERIES)
+_db_latency = _Children(DB_QUERY_LATENCY)
+_cache_lookups = _Children(CACHE_LOOKUPS)
+
+# Per-thread query count of the request being served (None outside requests)
+_local = threading.local()
+
+
+def count_cache(cache, hit, amount=1):
+    """Record `amount` hits (or misses) for `cache`."""
+    if amount:
+        _cache_lookups[cache, 'hit' if hit else 'miss'].inc(amount)
+
+
+def observe_db_query(execute, sql, params, many, context):
+    """Connection.execute_wrapper that counts and times every query."""
+    alias = context['connection'].alias
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    except Exception:
+        DB_QUERY_ERRORS.labels(alias).inc()
+        raise
+    finally:
+        _db_latency[(alias,)].observe(time.perf_counter() - started)
+        queries = getattr(_local, 'queries', None)
+        if queries is not None:
+            _local.queries = queries + 1
+
+
+def _install_wrapper(sender, connection, **kwargs):
+    # execute_wrappers lives on the connection object, which outlives the
+    # database connection it reopens, so only add the wrapper once
+    if observe_db_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(observe_db_query)
+
+
+def install_db_instrumentation():
+    """Time queries on every database connection of this process."""
+    from django.db import connections
+    from django.db.backends.signals import connection_created
+
+    connection_created.connect(_install_wrapper, dispatch_uid='config.metrics.db')
+    for connection in connections.all(initialized_only=True):
+        _install_wrapper(None, connection)
+
+
+def start_request():
+    _local.queries = 0
+    return time.perf_counter()
+
+
+def finish_request(view, method, status, started):
+    """Record one served request; `started` is start_request()'s value."""
+    elapsed = time.perf_counter() - started
+    queries = _local.queries
+    _local.queries = None
+    _requests[view, method, str(status)].inc()
+    _request_latency[view, method].observe(elapsed)
+    _request_queries[(view,)].observe(queries)
+
+
+class ExportJob:
+    """Row count of a running export, set by the caller of track_export()."""
+
+    rows = 0
+
+
+@contextmanager
+def track_export(file_format):
+    """Time an export job and count its rows (`job.rows`) and outcome."""
+    job = ExportJob()
+    started = time.perf_counter()
+    try:
+        yield job
+    except BaseException:
+        EXPORTS.labels(file_format, 'error').inc()
+        raise
+    else:
+        EXPORTS.labels(file_format, 'ok').inc()
+        EXPORT_ROWS.labels(file_format).inc(job.rows)
+    finally:
+        EXPORT_LATENCY.labels(file_format).observe(time.perf_counter() - started)
+
+
+def worker_started():
+    """Called from gunicorn's post_fork hook in the new worker."""
+    WORKERS.set(1)
+    WORKER_STARTED.set(time.time())
+
+
+def worker_exited():
+    """Called from gunicorn's worker_exit hook in the exiting worker."""
+    WORKER_EXITS.inc()
+
+
+def worker_timed_out():
+    """Called from gunicorn's worker_abort hook (timeout) in the worker."""
+    WORKER_TIMEOUTS.inc()
+
+
+def mark_worker_dead(pid):
+    """Called from gunicorn's child_exit hook in the master."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)
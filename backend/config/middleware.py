@@ -0,0 +1,117 @@
+"""
+Custom middleware for IE LOGS.
+"""
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from accounts.permissions import IsAdmin
+
+from . import metrics, profiling
+from .db_router import replica_configured, enable_replica_reads, reset_replica_reads
+
+PIN_COOKIE = 'db_primary_until'
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Enables replica reads for read-only requests: safe methods, and POST
+    views marked with @use_replica. After a successful write (any other
+    request with a 2xx/3xx response, e.g. save-log/ or submit-log/) the
+    client is pinned to the primary for REPLICA_STICKY_SECONDS through a
+    cookie, so users always read their own writes.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.replica_reads = False
+        try:
+            response = self.get_response(request)
+        finally:
+            token = getattr(request, '_replica_token', None)
+            if token is not None:
+                reset_replica_reads(token)
+        if (
+            replica_configured()
+            and request.method not in SAFE_METHODS
+            and not request.replica_reads
+            and response.status_code < 400
+        ):
+            response.set_cookie(
+                PIN_COOKIE,
+                str(int(time.time()) + settings.REPLICA_STICKY_SECONDS),
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not replica_configured() or self._pinned(request):
+            return None
+        if request.method in SAFE_METHODS or getattr(view_func, 'replica_reads', False):
+            request.replica_reads = True
+            request._replica_token = enable_replica_reads()
+        return None
+
+    @staticmethod
+    def _pinned(request):
+        try:
+            return int(request.COOKIES.get(PIN_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+
+
+KNOWN_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'POST', 'PUT', 'PATCH', 'DELETE'))
+
+
+class MetricsMiddleware:
+    """
+    Counts and times every request, and the database queries it runs, by
+    URL name (config.metrics). Placed first so latency covers the whole
+    middleware stack. Disabled with METRICS_ENABLED=False.
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        metrics.install_db_instrumentation()
+
+    def __call__(self, request):
+        started = metrics.start_request()
+        status = 500
+        try:
+            response = self.get_response(request)
+            status = response.status_code
+            return response
+        finally:
+            match = request.resolver_match
+            # URL names, not paths, keep the label set small
+            view = (match.view_name if match else None) or 'unmatched'
+            method = request.method if request.method in KNOWN_METHODS else 'other'
+            metrics.finish_request(view, method, status, started)
+
+
+class ProfilingMiddleware:
+    """
+    Runs a request under the profiler when an admin asks for it with the
+    X-Profile header or `?_profile=` (config.profiling). The flag is
+    ignored for everyone else. Disabled with PROFILING_ENABLED=False.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode = profiling.requested_mode(request)
+        if mode is None or not IsAdmin().has_permission(request, None):
+            return self.get_response(request)
+        return profiling.profile_request(request, self.get_response, mode)
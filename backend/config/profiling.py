@@ -0,0 +1,198 @@
+"""
+On-demand profiling of single requests, for admins.
+
+An admin sends `X-Profile: sample` (or `cprofile`) or adds
+`?_profile=sample` to any request. ProfilingMiddleware runs just that
+request under the profiler, saves the result in PROFILE_DIR and returns
+its id in the X-Profile-Id header:
+
+- sample: the request thread's stack is sampled every
+  PROFILE_SAMPLE_INTERVAL_MS and saved as collapsed stacks
+  (`frame;frame;frame count` lines) for flamegraph.pl or speedscope.
+  Wall-clock based, so time waiting on the database shows up.
+- cprofile: deterministic cProfile stats (`.prof`), for pstats/snakeviz.
+
+Artifacts are listed at /api/profiles/ and downloaded from
+/api/profiles/<id>/ (admin only). Requests without the flag only pay for
+a header lookup and a substring test on the query string.
+"""
+import cProfile
+import io
+import json
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from accounts.permissions import IsAdmin
+
+MODES = ('sample', 'cprofile')
+HEADER = 'HTTP_X_PROFILE'
+QUERY_FLAG = '_profile'
+
+EXTENSIONS = {'sample': 'collapsed', 'cprofile': 'prof'}
+
+
+def requested_mode(request):
+    """The profiling mode asked for by `request`, or None."""
+    value = request.META.get(HEADER)
+    if value is None:
+        if QUERY_FLAG + '=' not in request.META.get('QUERY_STRING', ''):
+            return None
+        value = request.GET.get(QUERY_FLAG)
+    if not value:
+        return None
+    value = value.strip().lower()
+    return value if value in MODES else MODES[0]
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class StackSampler:
+    """Background thread counting the stacks of one thread, root first."""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_name(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def __enter__(self):
+        # The sampler needs the GIL on time; the default 5 ms switch
+        # interval would otherwise cap the sampling rate
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 4))
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def collapsed(self):
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common()).encode()
+
+
+def _run_profiled(mode, func):
+    """Call `func()` under `mode`; return (result, artifact bytes, sample count or None)."""
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        try:
+            result = profiler.runcall(func)
+        finally:
+            profiler.create_stats()
+        # Same bytes as Profile.dump_stats(), so pstats.Stats(path) loads it
+        return result, marshal.dumps(profiler.stats), None
+
+    interval = settings.PROFILE_SAMPLE_INTERVAL_MS / 1000
+    with StackSampler(threading.get_ident(), interval) as sampler:
+        result = func()
+    return result, sampler.collapsed(), sum(sampler.stacks.values())
+
+
+def profile_dir():
+    return Path(settings.PROFILE_DIR)
+
+
+def _prune(directory):
+    """Keep the PROFILE_KEEP newest profiles."""
+    metas = sorted(directory.glob('*.json'), key=os.path.getmtime, reverse=True)
+    for meta in metas[settings.PROFILE_KEEP:]:
+        for path in directory.glob(meta.stem + '.*'):
+            path.unlink(missing_ok=True)
+
+
+def profile_request(request, get_response, mode):
+    """Serve `request` under the profiler and save the artifact."""
+    started = time.perf_counter()
+    response, artifact, samples = _run_profiled(mode, lambda: get_response(request))
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    directory = profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    extension = EXTENSIONS[mode]
+    (directory / f'{profile_id}.{extension}').write_bytes(artifact)
+    match = request.resolver_match
+    (directory / f'{profile_id}.json').write_text(json.dumps({
+        'id': profile_id,
+        'mode': mode,
+        'file': f'{profile_id}.{extension}',
+        'method': request.method,
+        'path': request.get_full_path(),
+        'view': match.view_name if match else None,
+        'status': response.status_code,
+        'duration_ms': elapsed_ms,
+        'samples': samples,
+        'user': request.user.username,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }))
+    _prune(directory)
+
+    response['X-Profile-Id'] = profile_id
+    return response
+
+
+def _load_meta(path):
+    """A profile's metadata, or None if it was pruned meanwhile."""
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def profile_list_view(request):
+    """Saved request profiles, newest first (admin only)."""
+    directory = profile_dir()
+    paths = sorted(directory.glob('*.json'), key=os.path.getmtime, reverse=True) if directory.is_dir() else []
+    metas = (_load_meta(path) for path in paths)
+    return Response({'results': [meta for meta in metas if meta is not None]})
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def profile_download_view(request, profile_id):
+    """
+    Download one profile artifact (admin only). `?report=text` renders a
+    cProfile artifact as a pstats report sorted by cumulative time.
+    """
+    meta = _load_meta(profile_dir() / f'{profile_id}.json')
+    path = profile_dir() / meta['file'] if meta else None
+    if path is None or not path.is_file():
+        raise Http404
+
+    if meta['mode'] == 'cprofile' and request.query_params.get('report') == 'text':
+        stats = pstats.Stats(str(path), stream=io.StringIO())
+        stats.sort_stats('cumulative').print_stats(settings.PROFILE_TEXT_LINES)
+        return HttpResponse(stats.stream.getvalue(), content_type='text/plain; charset=utf-8')
+
+    content_type = 'text/plain; charset=utf-8' if meta['mode'] == 'sample' else 'application/octet-stream'
+    return FileResponse(path.open('rb'), as_attachment=True, filename=meta['file'], content_type=content_type)
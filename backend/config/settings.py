@@ -43,12 +43,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'config.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     # 'django.middleware.csrf.CsrfViewMiddleware',  # Disabled for API
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'config.middleware.ProfilingMiddleware',
+    'config.middleware.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -92,6 +95,42 @@ DATABASES = {
     }
 }
 
+# Optional read replica (see config/db_router.py): same credentials as the
+# primary unless overridden
+if os.environ.get('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': os.environ.get('DB_REPLICA_NAME', DATABASES['default']['NAME']),
+        'HOST': os.environ['DB_REPLICA_HOST'],
+        'PORT': os.environ.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'USER': os.environ.get('DB_REPLICA_USER', DATABASES['default']['USER']),
+        'PASSWORD': os.environ.get('DB_REPLICA_PASSWORD', DATABASES['default']['PASSWORD']),
+    }
+
+# Local two-SQLite mode for trying replica routing without SQL Server;
+# refresh the replica copy with `manage.py sync_sqlite_replica`
+if os.environ.get('DB_SQLITE_PATH'):
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ['DB_SQLITE_PATH'],
+        },
+    }
+    if os.environ.get('DB_REPLICA_SQLITE_PATH'):
+        DATABASES['replica'] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ['DB_REPLICA_SQLITE_PATH'],
+        }
+
+DATABASE_ROUTERS = ['config.db_router.ReplicaRouter']
+
+# Apps whose reads may go to the replica; auth and session tables always
+# read from the primary
+REPLICA_APPS = ['projects']
+
+# Seconds a client reads from the primary after its own write
+REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', '15'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -112,6 +151,27 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# PBKDF2 work factor (Django 4.2 default: 600000). Stored hashes with a
+# different count are re-encoded on the next login. Benchmark candidates
+# with `manage.py bench_password_hash --target-ms ...`.
+PASSWORD_PBKDF2_ITERATIONS = int(os.environ.get('PASSWORD_PBKDF2_ITERATIONS', '600000'))
+
+PASSWORD_HASHERS = [
+    'accounts.hashers.TunablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# Login lockout (accounts.throttling): this many failures for one username
+# within LOGIN_FAILURE_WINDOW seconds locks it for LOGIN_LOCKOUT_SECONDS.
+LOGIN_LOCKOUT_FAILURES = int(os.environ.get('LOGIN_LOCKOUT_FAILURES', '5'))
+LOGIN_FAILURE_WINDOW = int(os.environ.get('LOGIN_FAILURE_WINDOW', '900'))
+LOGIN_LOCKOUT_SECONDS = int(os.environ.get('LOGIN_LOCKOUT_SECONDS', '900'))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -149,6 +209,79 @@ AUTHENTICATION_BACKENDS = [
 ]
 
 
+# Cache
+# Per-process memory cache by default; set REDIS_URL (requires the `redis`
+# package) to share cached state and invalidations between workers.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Filter and group projects by LookupData keys (court_ref / reviewer_ref)
+# instead of the court/reviewer text columns. Keys are maintained either
+# way; run `manage.py backfill_lookup_refs` before turning this on.
+PROJECTS_NORMALIZED_LOOKUPS = os.environ.get('PROJECTS_NORMALIZED_LOOKUPS', 'False') == 'True'
+
+# Serialized project list rows (projects.row_cache): per-worker LRU size
+# (0 disables), and an optional shared cache alias such as 'default' when
+# REDIS_URL is set
+PROJECT_ROW_CACHE_SIZE = int(os.environ.get('PROJECT_ROW_CACHE_SIZE', '5000'))
+PROJECT_ROW_CACHE_SHARED = os.environ.get('PROJECT_ROW_CACHE_SHARED', '')
+PROJECT_ROW_CACHE_TTL = int(os.environ.get('PROJECT_ROW_CACHE_TTL', '3600'))
+
+# Prometheus metrics (config.metrics) served at /metrics; when METRICS_TOKEN
+# is set scrapers must send it as a bearer token. Under gunicorn, workers
+# share samples through PROMETHEUS_MULTIPROC_DIR (see gunicorn.conf.py).
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True') == 'True'
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Single-request profiling for admins (config.profiling): artifacts are
+# written to PROFILE_DIR, keeping the PROFILE_KEEP newest
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'True') == 'True'
+PROFILE_DIR = Path(os.environ.get('PROFILE_DIR', BASE_DIR / 'profiles'))
+PROFILE_KEEP = int(os.environ.get('PROFILE_KEEP', '50'))
+PROFILE_SAMPLE_INTERVAL_MS = float(os.environ.get('PROFILE_SAMPLE_INTERVAL_MS', '2'))
+PROFILE_TEXT_LINES = int(os.environ.get('PROFILE_TEXT_LINES', '60'))
+
+# Exports sent with `parallel: true` (projects.parallel_export) are split
+# into one shard per worker process once they reach EXPORT_PARALLEL_MIN_ROWS.
+# Each runs its own process pool inside a gunicorn worker, so at most
+# EXPORT_PARALLEL_MAX_CONCURRENT run at once (across workers with REDIS_URL);
+# the rest are exported serially.
+EXPORT_PARALLEL_WORKERS = int(os.environ.get('EXPORT_PARALLEL_WORKERS', '2'))
+EXPORT_PARALLEL_MIN_ROWS = int(os.environ.get('EXPORT_PARALLEL_MIN_ROWS', '5000'))
+EXPORT_PARALLEL_MAX_CONCURRENT = int(os.environ.get('EXPORT_PARALLEL_MAX_CONCURRENT', '1'))
+
+# Reporting snapshot (projects.snapshot): SQLite copy refreshed by
+# `manage.py sync_reporting_snapshot`; rows updated up to
+# REPORTING_SNAPSHOT_OVERLAP_SECONDS before the watermark are re-copied
+REPORTING_SNAPSHOT_PATH = Path(os.environ.get('REPORTING_SNAPSHOT_PATH', BASE_DIR / 'snapshots' / 'reporting.sqlite3'))
+REPORTING_SNAPSHOT_OVERLAP_SECONDS = int(os.environ.get('REPORTING_SNAPSHOT_OVERLAP_SECONDS', '300'))
+
+# Processes used to hash passwords during bulk user provisioning
+USER_PROVISION_WORKERS = int(os.environ.get('USER_PROVISION_WORKERS', os.cpu_count() or 1))
+# Most passwords one POST /api/auth/users/bulk/ may hash: hashing runs inside
+# the request, which must finish within GUNICORN_TIMEOUT. Larger rosters go
+# through `manage.py import_users`.
+USER_PROVISION_API_MAX_PASSWORDS = int(os.environ.get('USER_PROVISION_API_MAX_PASSWORDS', '25'))
+
+# Team membership index (accounts.teams): how often a worker checks the
+# shared cache for invalidations, and the maximum age of its copy. Without
+# REDIS_URL other workers never see invalidations, and project access is
+# authorized from this index, so revoked team access lasts up to the TTL.
+TEAM_DIRECTORY_CHECK_SECONDS = int(os.environ.get('TEAM_DIRECTORY_CHECK_SECONDS', '5'))
+TEAM_DIRECTORY_TTL = int(os.environ.get('TEAM_DIRECTORY_TTL', '300' if os.environ.get('REDIS_URL') else '30'))
+
+
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -164,6 +297,13 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
+    # Rates for the login throttles in accounts.throttling
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': os.environ.get('LOGIN_RATE_PER_IP', '30/min'),
+        'login_username': os.environ.get('LOGIN_RATE_PER_USERNAME', '10/min'),
+    },
+    # Proxies in front of the app (nginx) whose X-Forwarded-For is trusted
+    'NUM_PROXIES': int(os.environ['NUM_PROXIES']) if os.environ.get('NUM_PROXIES') else None,
     'DATETIME_FORMAT': '%Y-%m-%d %H:%M:%S',
     'DATE_FORMAT': '%Y-%m-%d',
 }
@@ -206,44 +346,53 @@ SESSION_COOKIE_AGE = 86400  # 24 hours
 
 
 # Logging Configuration
+# Request threads only enqueue records; a listener thread per process writes
+# JSON lines to logs/django.log (rotated) and text to the console.
+LOG_DIR = Path(os.environ.get('DJANGO_LOG_DIR', BASE_DIR / 'logs'))
+LOG_LEVEL = os.environ.get('DJANGO_LOG_LEVEL', 'INFO')
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
-    'formatters': {
-        'verbose': {
-            'format': '{levelname} {asctime} {module} {message}',
-            'style': '{',
+    'filters': {
+        # Keep 1 in N INFO records from high-volume loggers (1.0 = keep all)
+        'sample_info': {
+            '()': 'config.log_handlers.SamplingFilter',
+            'rate': float(os.environ.get('LOG_INFO_SAMPLE_RATE', '1.0')),
+            'loggers': ['accounts', 'django.server'],
         },
     },
     'handlers': {
-        'console': {
-            'class': 'logging.StreamHandler',
-            'formatter': 'verbose',
-        },
-        'file': {
-            'class': 'logging.FileHandler',
-            'filename': BASE_DIR / 'logs' / 'django.log',
-            'formatter': 'verbose',
+        'async': {
+            '()': 'config.log_handlers.AsyncLogHandler',
+            'filename': LOG_DIR / 'django.log',
+            'max_bytes': int(os.environ.get('LOG_MAX_BYTES', 10 * 1024 * 1024)),
+            'backup_count': int(os.environ.get('LOG_BACKUP_COUNT', '5')),
+            'filters': ['sample_info'],
         },
     },
     'root': {
-        'handlers': ['console', 'file'],
-        'level': 'INFO',
+        'handlers': ['async'],
+        'level': LOG_LEVEL,
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
-            'level': 'INFO',
+            'handlers': ['async'],
+            'level': LOG_LEVEL,
             'propagate': False,
         },
     },
 }
 
-# Create logs directory if it doesn't exist
-os.makedirs(BASE_DIR / 'logs', exist_ok=True)
-
 
 # MST Display Timezone (for frontend)
 # Frontend will display times in MST (America/Phoenix)
 # Backend stores in IST with +12.5hr offset for correct display
 MST_TIMEZONE = 'America/Phoenix'
+
+
+# Project archival (see `python manage.py archive_projects`)
+# Soft-deleted rows older than the retention window and completed rows older
+# than N months are moved from `projects` into `projects_archive`.
+PROJECT_ARCHIVE_DELETED_DAYS = int(os.environ.get('PROJECT_ARCHIVE_DELETED_DAYS', '90'))
+PROJECT_ARCHIVE_COMPLETED_MONTHS = int(os.environ.get('PROJECT_ARCHIVE_COMPLETED_MONTHS', '24'))
@@ -14,3 +14,17 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_wsgi_application()
+
+
+def warm_up():
+    """
+    Finish app initialisation before workers fork (gunicorn --preload).
+    Imports every view module via the URL resolver and drops any database
+    connection, so forked workers share these pages copy-on-write and each
+    opens its own connection.
+    """
+    from django.db import connections
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+    connections.close_all()
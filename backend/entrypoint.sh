@@ -37,4 +37,4 @@ python manage.py createsuperuser --noinput --username admin --email admin@exampl
 
 # Step 5: Start Gunicorn
 echo "[5/5] Starting Gunicorn server..."
-exec gunicorn config.wsgi:application --bind 0.0.0.0:8000
+exec gunicorn config.wsgi:application -c gunicorn.conf.py
@@ -0,0 +1,73 @@
+"""
+Gunicorn configuration for IE LOGS.
+Usage: gunicorn config.wsgi:application -c gunicorn.conf.py
+
+With preload_app the Django app is imported once in the master and shared
+copy-on-write by the workers.
+
+Prometheus metrics run in multiprocess mode: each worker writes samples to
+files in PROMETHEUS_MULTIPROC_DIR and /metrics sums them (config.metrics).
+The variable has to be set before the app imports prometheus_client.
+"""
+import gc
+import os
+import shutil
+import tempfile
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', '1'))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True') == 'True'
+
+metrics_dir = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'ielogs-metrics')
+)
+os.makedirs(metrics_dir, exist_ok=True)
+
+
+def on_starting(server):
+    """
+    Runs once in the master (after preloading the app, which only defines
+    metrics): drop sample files left by a previous run.
+    """
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def when_ready(server):
+    """Runs in the master after the app is loaded, before workers fork."""
+    if not preload_app:
+        return
+    from config.wsgi import warm_up
+    warm_up()
+    # Move everything allocated so far out of the GC's reach so collections
+    # in the workers don't touch (and copy) the shared pages.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """Never let a worker reuse a database socket opened by the master."""
+    from config import metrics
+    metrics.worker_started()
+    if not preload_app:
+        return
+    from django.db import connections
+    connections.close_all()
+
+
+def worker_exit(server, worker):
+    """Runs in a worker as it exits, whatever the reason."""
+    from config import metrics
+    metrics.worker_exited()
+
+
+def worker_abort(worker):
+    """Runs in a worker killed by the master for exceeding `timeout`."""
+    from config import metrics
+    metrics.worker_timed_out()
+
+
+def child_exit(server, worker):
+    """Runs in the master: drop the dead worker's live gauges."""
+    from config import metrics
+    metrics.mark_worker_dead(worker.pid)
@@ -1,25 +1,75 @@
-from django.contrib import admin
-from .models import Project, LookupData
+from django.contrib import admin, messages
+from django.db import transaction
+from django.utils import timezone
+from .models import Project, ArchivedProject, LookupData
+from .pagination import EstimatedCountPaginator
+from . import counters, lookups
+
+
+class LookupValueFilter(admin.SimpleListFilter):
+    """
+    List filter whose options come from the small LookupData table instead
+    of a DISTINCT over the projects table.
+    """
+    lookup_type = None
+    
+    def lookups(self, request, model_admin):
+        values = LookupData.objects.filter(
+            lookup_type=self.lookup_type, is_active=True
+        ).values_list('value', flat=True)
+        return [(value, value) for value in values]
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.parameter_name: self.value()})
+        return queryset
+
+
+class ProjectCourtFilter(LookupValueFilter):
+    title = 'project court'
+    parameter_name = 'project_court'
+    lookup_type = 'court'
+
+
+class ReviewedByFilter(LookupValueFilter):
+    title = 'reviewed by'
+    parameter_name = 'reviewed_by'
+    lookup_type = 'reviewer'
 
 
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
-    """Admin interface for Project model."""
+    """
+    Admin interface for Project model.
+    Tuned for large tables: creators are joined in the changelist query,
+    unfiltered pages use an estimated count, court/reviewer filters read
+    LookupData, and bulk actions run as single UPDATE statements.
+    """
     
     list_display = [
         'application_number', 'account_name', 'project_court', 
         'reviewed_by', 'project_status', 'stage', 'total_time',
         'created_by', 'created_at', 'is_deleted'
     ]
+    list_select_related = ['created_by']
     
     list_filter = [
         'stage', 'project_status', 'is_deleted', 'created_at',
-        'project_court', 'reviewed_by'
+        ProjectCourtFilter, ReviewedByFilter
     ]
     
+    # '^' = prefix match, '=' = exact match; both can use an index
     search_fields = [
-        'application_number', 'account_name', 'project_court',
-        'reviewed_by', 'created_by__username'
+        '^application_number', '^account_name', '=created_by__username'
+    ]
+    
+    date_hierarchy = 'created_at'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    actions = [
+        'soft_delete_selected',
+        'mark_approve', 'mark_conditional_approve', 'mark_reject', 'mark_review',
     ]
     
     readonly_fields = ['created_at', 'updated_at', 'deleted_at', 'total_time']
@@ -47,6 +97,66 @@ class ProjectAdmin(admin.ModelAdmin):
             'fields': ('is_deleted', 'deleted_at', 'deleted_by')
         }),
     )
+    
+    def get_queryset(self, request):
+        # The admin shows soft-deleted projects too (Project.objects hides them)
+        queryset = Project.all_objects.get_queryset()
+        ordering = self.get_ordering(request)
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return queryset
+    
+    @admin.action(description='Soft delete selected projects')
+    def soft_delete_selected(self, request, queryset):
+        now = timezone.now()
+        updated = counters.bulk_update(
+            queryset.live(),
+            is_deleted=True, deleted_at=now, deleted_by=request.user, updated_at=now
+        )
+        self.message_user(request, f'Soft deleted {updated} project(s).', messages.SUCCESS)
+    
+    def _set_status(self, request, queryset, project_status):
+        updated = counters.bulk_update(
+            queryset, project_status=project_status, updated_at=timezone.now()
+        )
+        self.message_user(
+            request, f'Set status to "{project_status}" on {updated} project(s).', messages.SUCCESS
+        )
+    
+    @admin.action(description='Set status: Approve')
+    def mark_approve(self, request, queryset):
+        self._set_status(request, queryset, 'Approve')
+    
+    @admin.action(description='Set status: Conditional Approve')
+    def mark_conditional_approve(self, request, queryset):
+        self._set_status(request, queryset, 'Conditional Approve')
+    
+    @admin.action(description='Set status: Reject')
+    def mark_reject(self, request, queryset):
+        self._set_status(request, queryset, 'Reject')
+    
+    @admin.action(description='Set status: Review')
+    def mark_review(self, request, queryset):
+        self._set_status(request, queryset, 'Review')
+
+
+@admin.register(ArchivedProject)
+class ArchivedProjectAdmin(admin.ModelAdmin):
+    """Read-only admin for projects moved to the archive table."""
+    
+    list_display = [
+        'id', 'application_number', 'account_name', 'project_status',
+        'stage', 'completed_date', 'created_by', 'is_deleted', 'archived_at'
+    ]
+    list_select_related = ['created_by']
+    list_filter = ['stage', 'is_deleted']
+    search_fields = ['application_number', 'account_name']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
 
 
 @admin.register(LookupData)
@@ -56,3 +166,19 @@ class LookupDataAdmin(admin.ModelAdmin):
     list_display = ['lookup_type', 'value', 'is_active', 'created_at']
     list_filter = ['lookup_type', 'is_active']
     search_fields = ['value']
+    actions = ['activate_selected', 'deactivate_selected']
+    
+    def _set_active(self, request, queryset, is_active):
+        with transaction.atomic():
+            updated = queryset.update(is_active=is_active, updated_at=timezone.now())
+            if updated:
+                lookups.bump_version()
+        self.message_user(request, f'{updated} value(s) updated.')
+    
+    @admin.action(description='Activate selected values')
+    def activate_selected(self, request, queryset):
+        self._set_active(request, queryset, True)
+    
+    @admin.action(description='Deactivate selected values')
+    def deactivate_selected(self, request, queryset):
+        self._set_active(request, queryset, False)
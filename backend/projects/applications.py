@@ -0,0 +1,62 @@
+"""
+Application-number lookups and duplicate detection.
+
+Numbers are compared in normalized form (upper case, spaces removed),
+stored in Project.application_number_normalized and indexed together
+with created_at, so exact and prefix probes are index seeks.
+"""
+from django.db.models import Count
+
+from .models import Project
+
+# Columns returned for matches (enough to recognise the project)
+MATCH_FIELDS = (
+    'id', 'application_number', 'account_name', 'stage', 'project_status',
+    'created_by_id', 'created_by__username', 'created_at',
+)
+
+
+def normalize_application_number(value):
+    """Canonical form used for lookups (migration 0010 backfills the same in SQL)."""
+    return (value or '').replace(' ', '').upper()
+
+
+def find_matches(queryset, number, prefix=False, limit=20):
+    """Projects in `queryset` whose number equals (or starts with) `number`."""
+    normalized = normalize_application_number(number)
+    if not normalized:
+        return []
+    lookup = 'application_number_normalized__startswith' if prefix else 'application_number_normalized'
+    return list(
+        queryset.filter(**{lookup: normalized})
+        .order_by('application_number_normalized', '-created_at')
+        .values(*MATCH_FIELDS)[:limit]
+    )
+
+
+def duplicates_of(project, queryset, limit=10):
+    """Other projects in `queryset` (live ones, from Project.objects) with the same normalized number."""
+    if not project.application_number_normalized:
+        return []
+    return list(
+        queryset.filter(
+            application_number_normalized=project.application_number_normalized,
+        )
+        .exclude(pk=project.pk)
+        .order_by('-created_at')
+        .values(*MATCH_FIELDS)[:limit]
+    )
+
+
+def duplicate_groups(queryset, min_count=2):
+    """
+    (normalized number, count) for numbers used at least `min_count` times,
+    from one GROUP BY over the index rather than a self-join.
+    """
+    return (
+        queryset.exclude(application_number_normalized='')
+        .values_list('application_number_normalized')
+        .annotate(n=Count('id'))
+        .filter(n__gte=min_count)
+        .order_by('-n', 'application_number_normalized')
+    )
@@ -0,0 +1,75 @@
+"""
+Archival helpers for moving cold projects out of the hot `projects` table.
+Rows are copied into `projects_archive` and removed from `projects` in
+small batches, one transaction per batch.
+"""
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Project, ArchivedProject
+from .counters import record_removal
+
+
+def subtract_months(day, months):
+    """Return `day` moved back by whole calendar months (clamped to month end)."""
+    month_index = day.year * 12 + (day.month - 1) - months
+    year, month = divmod(month_index, 12)
+    month += 1
+    next_month = date(year + (month == 12), month % 12 + 1, 1)
+    last_day = (next_month - timedelta(days=1)).day
+    return date(year, month, min(day.day, last_day))
+
+
+def archivable_deleted(deleted_days=None):
+    """Soft-deleted projects older than the retention window."""
+    if deleted_days is None:
+        deleted_days = settings.PROJECT_ARCHIVE_DELETED_DAYS
+    cutoff = timezone.now() - timedelta(days=deleted_days)
+    return Project.objects.deleted_only().filter(deleted_at__lt=cutoff)
+
+
+def archivable_completed(completed_months=None):
+    """Completed projects whose completion date is older than N months."""
+    if completed_months is None:
+        completed_months = settings.PROJECT_ARCHIVE_COMPLETED_MONTHS
+    cutoff = subtract_months(timezone.localdate(), completed_months)
+    return Project.objects.filter(
+        stage='Completed',
+        completed_date__lt=cutoff,
+    )
+
+
+def archive_batch(queryset, batch_size):
+    """
+    Move up to `batch_size` rows of `queryset` into the archive table.
+    Returns the number of rows moved (0 when nothing is left).
+    """
+    with transaction.atomic():
+        ids = list(queryset.order_by('id').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return 0
+        projects = Project.all_objects.filter(id__in=ids).select_for_update()
+        ArchivedProject.objects.bulk_create(
+            [ArchivedProject.from_project(project) for project in projects]
+        )
+        record_removal(Project.all_objects.filter(id__in=ids))
+        Project.all_objects.filter(id__in=ids).delete()
+    return len(ids)
+
+
+def archive_queryset(queryset, batch_size=500):
+    """Archive every row of `queryset`, yielding the size of each moved batch."""
+    while True:
+        moved = archive_batch(queryset, batch_size)
+        if not moved:
+            return
+        yield moved
+
+
+def archive_querysets(model_queryset, archived_queryset):
+    """Chain hot and archived rows for read paths that span both tables."""
+    yield from model_queryset.iterator()
+    yield from archived_queryset.iterator()
@@ -0,0 +1,130 @@
+"""
+MST calendar buckets for project timestamps.
+
+Timestamps are stored in IST/UTC, but users count days in Phoenix time, so
+"projects created on MST day X" used to need a per-row conversion that no
+index can serve. Projects persist the MST day, week (starting Monday) and
+month (1st) of created_at, and the MST day of start_time, in indexed date
+columns. Date filters then compare those columns with plain dates.
+"""
+import datetime
+from collections import defaultdict
+
+from django.db import models
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .timezones import mst_zone
+
+BUCKETS = ('day', 'week', 'month')
+
+# Ids per UPDATE in backfill_buckets (SQL Server allows 2100 parameters)
+BACKFILL_IDS_PER_UPDATE = 2000
+
+
+def mst_date(value):
+    """Phoenix calendar date of a datetime (naive values are in TIME_ZONE, as Django stores them)."""
+    if value is None:
+        return None
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value.astimezone(mst_zone()).date()
+
+
+def bucket_start(day, bucket):
+    """First day of the `bucket` ('day', 'week' or 'month') containing `day`."""
+    if day is None or bucket == 'day':
+        return day
+    if bucket == 'week':
+        return day - datetime.timedelta(days=day.weekday())
+    if bucket == 'month':
+        return day.replace(day=1)
+    raise ValueError(f'Unknown bucket {bucket!r}')
+
+
+def parse_mst_day(value):
+    """
+    MST day for a request value: a date, 'YYYY-MM-DD', or a datetime /
+    ISO datetime string (naive ones are MST wall time, as the UI sends them).
+    Returns None for empty values and raises ValueError for anything else.
+    """
+    if value in (None, ''):
+        return None
+    if isinstance(value, datetime.datetime):
+        moment = value
+    elif isinstance(value, datetime.date):
+        return value
+    else:
+        value = str(value).strip()
+        day = parse_date(value)
+        if day is not None:
+            return day
+        moment = parse_datetime(value.replace(' ', 'T', 1))
+        if moment is None:
+            raise ValueError(f'Invalid date: {value!r}')
+    if timezone.is_naive(moment):
+        return moment.date()
+    return moment.astimezone(mst_zone()).date()
+
+
+class MSTBucketField(models.DateField):
+    """
+    Read-only date column holding the MST `bucket` of the datetime field
+    `source`, recomputed in pre_save. Declare it after `source`: Django
+    calls pre_save in field order, so an auto_now_add source has already
+    been stamped when the bucket is computed.
+    """
+
+    def __init__(self, *args, source=None, bucket='day', **kwargs):
+        if bucket not in BUCKETS:
+            raise ValueError(f'Unknown bucket {bucket!r}')
+        self.source = source
+        self.bucket = bucket
+        kwargs.setdefault('null', True)
+        kwargs.setdefault('blank', True)
+        kwargs.setdefault('editable', False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['source'] = self.source
+        kwargs['bucket'] = self.bucket
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        value = bucket_start(mst_date(getattr(model_instance, self.source)), self.bucket)
+        setattr(model_instance, self.attname, value)
+        return value
+
+
+def bucket_fields(model):
+    """The MSTBucketFields of `model`, grouped by source field name."""
+    fields = defaultdict(list)
+    for field in model._meta.concrete_fields:
+        if isinstance(field, MSTBucketField):
+            fields[field.source].append(field)
+    return fields
+
+
+def backfill_buckets(model, ids_per_update=BACKFILL_IDS_PER_UPDATE):
+    """
+    Fill the bucket columns of existing `model` rows. Rows are grouped by
+    bucket value in Python, so each UPDATE sets constants for a batch of
+    ids instead of one statement per row. Returns the number of rows read.
+    """
+    by_source = bucket_fields(model)
+    groups = {source: defaultdict(list) for source in by_source}
+    total = 0
+    for row in model.objects.values_list('pk', *by_source).iterator(chunk_size=ids_per_update):
+        total += 1
+        for source, value in zip(by_source, row[1:]):
+            day = mst_date(value)
+            if day is not None:
+                groups[source][day].append(row[0])
+
+    for source, fields in by_source.items():
+        for day, ids in groups[source].items():
+            values = {field.attname: bucket_start(day, field.bucket) for field in fields}
+            for start in range(0, len(ids), ids_per_update):
+                model.objects.filter(pk__in=ids[start:start + ids_per_update]).update(**values)
+    return total
@@ -0,0 +1,198 @@
+"""
+Dashboard summary counters.
+Each live project is counted once in its creator's `user` scope and once
+in the creator's `team` scope (if any), bucketed by stage and status.
+Counts change by deltas in the same transaction as the write that caused
+them. There is no stored global row, which every write would have to
+lock: the `all` scope is summed from the user rows when it is read.
+"""
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+
+from accounts import teams
+from .models import Project, ProjectCounter
+
+TRACKED_FIELDS = ('created_by_id', 'stage', 'project_status', 'is_deleted')
+
+# Read-only scope covering every project (see counter_rows)
+ALL_SCOPE = ('all', '')
+
+# Marker for rows loaded with some tracked fields deferred
+UNKNOWN = object()
+
+
+def project_state(project):
+    """The counted state of an in-memory project."""
+    return tuple(getattr(project, attname) for attname in TRACKED_FIELDS)
+
+
+def remember_loaded_state(project, field_names):
+    """Called from Project.from_db with the loaded column names."""
+    if all(attname in field_names for attname in TRACKED_FIELDS):
+        project._counter_state = project_state(project)
+    else:
+        project._counter_state = UNKNOWN
+
+
+def counter_keys(created_by_id, team, stage, project_status):
+    """Counter rows a live project with these values contributes to."""
+    project_status = project_status or ''
+    keys = [('user', str(created_by_id), stage, project_status)]
+    if team:
+        keys.append(('team', team, stage, project_status))
+    return keys
+
+
+def _team_of(project, user_id):
+    if user_id == project.created_by_id and Project.created_by.is_cached(project):
+        return project.created_by.team
+    return teams.get_directory().team_of(user_id)
+
+
+def _state_deltas(project, state, sign, deltas):
+    created_by_id, stage, project_status, is_deleted = state
+    if is_deleted or created_by_id is None:
+        return
+    team = _team_of(project, created_by_id)
+    for key in counter_keys(created_by_id, team, stage, project_status):
+        deltas[key] += sign
+
+
+def apply_deltas(deltas):
+    """Add each non-zero delta to its counter row, creating rows as needed."""
+    for (scope, scope_key, stage, project_status), delta in deltas.items():
+        if not delta:
+            continue
+        lookup = dict(scope=scope, scope_key=scope_key, stage=stage, project_status=project_status)
+        if ProjectCounter.objects.filter(**lookup).update(count=F('count') + delta):
+            continue
+        try:
+            with transaction.atomic():
+                ProjectCounter.objects.create(count=delta, **lookup)
+        except IntegrityError:
+            # Created concurrently by another writer
+            ProjectCounter.objects.filter(**lookup).update(count=F('count') + delta)
+
+
+def record_save(project):
+    """Apply counter deltas for a project that was just saved."""
+    old_state = getattr(project, '_counter_state', None)
+    new_state = project_state(project)
+    if old_state == new_state:
+        return
+
+    deltas = Counter()
+    if old_state is not None:
+        _state_deltas(project, old_state, -1, deltas)
+    _state_deltas(project, new_state, 1, deltas)
+    apply_deltas(deltas)
+    project._counter_state = new_state
+
+
+def load_state_before_save(project):
+    """Fetch the stored state for rows loaded with deferred tracked fields."""
+    if getattr(project, '_counter_state', None) is UNKNOWN:
+        row = Project.all_objects.filter(pk=project.pk).values_list(*TRACKED_FIELDS).first()
+        project._counter_state = tuple(row) if row else None
+
+
+def _grouped_live_counts(queryset):
+    return (
+        queryset.live()
+        .values('created_by_id', 'created_by__team', 'stage', 'project_status')
+        .annotate(n=Count('id'))
+        .order_by()
+    )
+
+
+def bulk_update(queryset, **changes):
+    """
+    Set-based `queryset.update(**changes)` that keeps counters in step.
+    Returns the number of updated rows.
+    """
+    with transaction.atomic():
+        groups = list(_grouped_live_counts(queryset))
+        updated = queryset.update(**changes)
+        deltas = Counter()
+        for group in groups:
+            old = (group['created_by_id'], group['stage'], group['project_status'], False)
+            new = (
+                group['created_by_id'],
+                changes.get('stage', group['stage']),
+                changes.get('project_status', group['project_status']),
+                changes.get('is_deleted', False),
+            )
+            if old == new:
+                continue
+            for key in counter_keys(group['created_by_id'], group['created_by__team'], *old[1:3]):
+                deltas[key] -= group['n']
+            if not new[3]:
+                for key in counter_keys(group['created_by_id'], group['created_by__team'], *new[1:3]):
+                    deltas[key] += group['n']
+        apply_deltas(deltas)
+    return updated
+
+
+def record_removal(queryset):
+    """Decrement counters for live rows about to be removed from `projects`."""
+    deltas = Counter()
+    for group in _grouped_live_counts(queryset):
+        for key in counter_keys(
+            group['created_by_id'], group['created_by__team'], group['stage'], group['project_status']
+        ):
+            deltas[key] -= group['n']
+    apply_deltas(deltas)
+
+
+def expected_counts():
+    """Recompute every counter from the projects table."""
+    expected = Counter()
+    for group in _grouped_live_counts(Project.all_objects.all()):
+        for key in counter_keys(
+            group['created_by_id'], group['created_by__team'], group['stage'], group['project_status']
+        ):
+            expected[key] += group['n']
+    return expected
+
+
+def counter_rows(scopes):
+    """
+    (scope, scope_key, stage, project_status, count) rows for the
+    (scope, scope_key) pairs in `scopes`. ALL_SCOPE is summed from the
+    user rows.
+    """
+    condition = Q()
+    for scope, scope_key in scopes:
+        if (scope, scope_key) != ALL_SCOPE:
+            condition |= Q(scope=scope, scope_key=scope_key)
+    rows = []
+    if condition:
+        rows.extend(ProjectCounter.objects.filter(condition).values_list(
+            'scope', 'scope_key', 'stage', 'project_status', 'count'
+        ))
+    if ALL_SCOPE in scopes:
+        totals = (
+            ProjectCounter.objects.filter(scope='user')
+            .values_list('stage', 'project_status')
+            .annotate(total=Sum('count'))
+            .order_by()
+        )
+        rows.extend((*ALL_SCOPE, stage, project_status, total) for stage, project_status, total in totals)
+    return rows
+
+
+def summarize(rows):
+    """Collapse counter rows into {'total', 'stages', 'statuses'}."""
+    stages = Counter()
+    statuses = Counter()
+    for stage, project_status, count in rows:
+        stages[stage] += count
+        if project_status:
+            statuses[project_status] += count
+    return {
+        'total': sum(stages.values()),
+        'stages': dict(stages),
+        'statuses': dict(statuses),
+    }
@@ -0,0 +1,87 @@
+"""
+Project durations: `total_time` is whole minutes from start_time to
+end_time, rounded half up from whole seconds (both times truncated to the
+second, as SQL Server's DATEDIFF counts second boundaries).
+
+minutes_between() is what Project.save() stores; MinutesBetween is the
+same rule as a database expression, so rows written by QuerySet.update(),
+bulk paths or direct SQL can be checked and fixed with set-based UPDATEs
+(recompute_total_time) instead of loading and saving every row.
+"""
+from django.db import NotSupportedError
+from django.db.models import Func, IntegerField, Max, Min, Q
+from django.utils import timezone
+
+RECOMPUTE_CHUNK_SIZE = 50000
+
+
+def minutes_between(start, end):
+    """Whole minutes from `start` to `end`, as MinutesBetween computes them."""
+    seconds = (end.replace(microsecond=0) - start.replace(microsecond=0)).total_seconds()
+    # int() truncates toward zero, like integer division in SQL
+    return int((seconds + 30) / 60)
+
+
+class MinutesBetween(Func):
+    """Whole minutes from the `start` to the `end` expression (see minutes_between)."""
+
+    arity = 2
+    output_field = IntegerField()
+
+    def _compile_pair(self, compiler):
+        (start_sql, start_params), (end_sql, end_params) = (
+            compiler.compile(expression) for expression in self.get_source_expressions()
+        )
+        return start_sql, start_params, end_sql, end_params
+
+    # mssql-django's vendor name
+    def as_microsoft(self, compiler, connection, **extra_context):
+        start_sql, start_params, end_sql, end_params = self._compile_pair(compiler)
+        return f'((DATEDIFF(second, {start_sql}, {end_sql}) + 30) / 60)', [*start_params, *end_params]
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        start_sql, start_params, end_sql, end_params = self._compile_pair(compiler)
+        return (
+            f"((CAST(strftime('%%s', {end_sql}) AS INTEGER)"
+            f" - CAST(strftime('%%s', {start_sql}) AS INTEGER) + 30) / 60)",
+            [*end_params, *start_params],
+        )
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f'MinutesBetween is not implemented for {connection.vendor}')
+
+
+def stale_total_time(queryset):
+    """Rows of `queryset` whose total_time doesn't match their start/end times."""
+    expected = MinutesBetween('start_time', 'end_time')
+    return queryset.filter(start_time__isnull=False, end_time__isnull=False).filter(
+        Q(total_time__isnull=True) | ~Q(total_time=expected)
+    )
+
+
+def recompute_total_time(model, chunk_size=RECOMPUTE_CHUNK_SIZE, dry_run=False, progress=None):
+    """
+    Fix stale total_time values of `model` with one UPDATE per id range
+    of `chunk_size` (only counting them when `dry_run`). Rows without
+    both times are left alone, as Project.save() leaves them. Models whose
+    updated_at is auto_now get it bumped, so caches and the reporting
+    snapshot pick the change up. `progress(last_id, max_id, count)` is
+    called after each chunk. Returns the number of stale rows.
+    """
+    manager = model._base_manager
+    bounds = manager.aggregate(low=Min('id'), high=Max('id'))
+    if bounds['low'] is None:
+        return 0
+
+    values = {'total_time': MinutesBetween('start_time', 'end_time')}
+    if model._meta.get_field('updated_at').auto_now:
+        values['updated_at'] = timezone.now()
+
+    total = 0
+    for start in range(bounds['low'], bounds['high'] + 1, chunk_size):
+        stale = stale_total_time(manager.filter(id__gte=start, id__lt=start + chunk_size))
+        count = stale.count() if dry_run else stale.update(**values)
+        total += count
+        if progress:
+            progress(min(start + chunk_size - 1, bounds['high']), bounds['high'], count)
+    return total
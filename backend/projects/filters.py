@@ -1,8 +1,11 @@
 """
 Django filters for Project model.
 """
+from django.conf import settings
 from django_filters import rest_framework as filters
-from .models import Project
+from .models import Project, ArchivedProject
+from .buckets import bucket_start
+from .lookups import REF_FIELDS, resolve_id
 
 
 class ProjectFilter(filters.FilterSet):
@@ -10,8 +13,8 @@ class ProjectFilter(filters.FilterSet):
     
     application_number = filters.CharFilter(lookup_expr='icontains')
     account_name = filters.CharFilter(lookup_expr='icontains')
-    project_court = filters.CharFilter(lookup_expr='exact')
-    reviewed_by = filters.CharFilter(lookup_expr='exact')
+    project_court = filters.CharFilter(method='filter_lookup_value')
+    reviewed_by = filters.CharFilter(method='filter_lookup_value')
     project_status = filters.CharFilter(lookup_expr='exact')
     stage = filters.CharFilter(lookup_expr='exact')
     created_by = filters.NumberFilter(field_name='created_by__id')
@@ -19,6 +22,13 @@ class ProjectFilter(filters.FilterSet):
     completed_date_to = filters.DateFilter(field_name='completed_date', lookup_expr='lte')
     created_at_from = filters.DateTimeFilter(field_name='created_at', lookup_expr='gte')
     created_at_to = filters.DateTimeFilter(field_name='created_at', lookup_expr='lte')
+    # MST calendar days, matched on the persisted bucket columns
+    created_date_from = filters.DateFilter(field_name='created_day', lookup_expr='gte')
+    created_date_to = filters.DateFilter(field_name='created_day', lookup_expr='lte')
+    start_date_from = filters.DateFilter(field_name='start_day', lookup_expr='gte')
+    start_date_to = filters.DateFilter(field_name='start_day', lookup_expr='lte')
+    created_week = filters.DateFilter(method='filter_bucket')
+    created_month = filters.DateFilter(method='filter_bucket')
     
     class Meta:
         model = Project
@@ -26,3 +36,31 @@ class ProjectFilter(filters.FilterSet):
             'application_number', 'account_name', 'project_court',
             'reviewed_by', 'project_status', 'stage', 'created_by'
         ]
+    
+    def filter_lookup_value(self, queryset, name, value):
+        """
+        Exact match on court/reviewer. In normalized mode a known lookup
+        value is matched by its integer key instead of the text column.
+        """
+        if settings.PROJECTS_NORMALIZED_LOOKUPS:
+            for lookup_type, (text_field, ref_field) in REF_FIELDS.items():
+                if text_field == name:
+                    lookup_id = resolve_id(lookup_type, value)
+                    if lookup_id is not None:
+                        return queryset.filter(**{f'{ref_field}_id': lookup_id})
+        return queryset.filter(**{name: value})
+    
+    def filter_bucket(self, queryset, name, value):
+        """Projects created in the MST week / month containing the given date."""
+        return queryset.filter(**{name: bucket_start(value, name.split('_')[1])})
+
+
+class ArchivedProjectFilter(ProjectFilter):
+    """Same filters as ProjectFilter, applied to the archive table."""
+    
+    # Archived rows keep only the text values
+    project_court = filters.CharFilter(lookup_expr='exact')
+    reviewed_by = filters.CharFilter(lookup_expr='exact')
+    
+    class Meta(ProjectFilter.Meta):
+        model = ArchivedProject
@@ -0,0 +1,233 @@
+"""
+Lookup data maintenance, the global lookup version and lookup keys.
+
+Any change to LookupData bumps LookupVersion in the same transaction:
+bulk replacements here bump it explicitly, and single-row saves (admin,
+shell) bump it through projects.signals.
+
+Projects carry integer keys (court_ref / reviewer_ref) next to the
+court/reviewer text. The keys are resolved through a per-worker
+value <-> id index that is rebuilt when the lookup version changes.
+With PROJECTS_NORMALIZED_LOOKUPS on, filters and filter options use
+the keys instead of the wide text columns. Renaming a lookup value
+rewrites the text of the projects keyed to it (rename_refs), so text
+and key never disagree.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, OuterRef, Subquery
+from django.utils import timezone
+
+from config import metrics
+from .models import Project, LookupData, LookupVersion
+
+VERSION_PK = 1
+
+# lookup_type -> (text field, key field) on Project
+REF_FIELDS = {
+    'court': ('project_court', 'court_ref'),
+    'reviewer': ('reviewed_by', 'reviewer_ref'),
+}
+
+# Seconds between lookup version checks by a worker's index
+INDEX_CHECK_SECONDS = 5
+
+
+def current_version():
+    """The current lookup version (0 before the first change)."""
+    return (
+        LookupVersion.objects.filter(pk=VERSION_PK).values_list('version', flat=True).first()
+        or 0
+    )
+
+
+def bump_version():
+    """Increment the lookup version, creating the row on first use."""
+    if LookupVersion.objects.filter(pk=VERSION_PK).update(
+        version=F('version') + 1, updated_at=timezone.now()
+    ):
+        return
+    try:
+        with transaction.atomic():
+            LookupVersion.objects.create(pk=VERSION_PK, version=1)
+    except IntegrityError:
+        # Created concurrently by another writer
+        LookupVersion.objects.filter(pk=VERSION_PK).update(version=F('version') + 1)
+
+
+class LookupIndex:
+    """Immutable value <-> id snapshot of all lookup rows (active or not)."""
+
+    def __init__(self, rows):
+        self.ids = {lookup_type: {} for lookup_type in REF_FIELDS}
+        self.values = {}
+        for lookup_id, lookup_type, value in rows:
+            self.ids.setdefault(lookup_type, {})[value] = lookup_id
+            self.values[lookup_id] = value
+
+
+_lock = threading.Lock()
+_index = None
+_index_version = None
+_checked_at = 0.0
+
+
+def get_index():
+    """Return this worker's lookup index, rebuilding it if the version moved."""
+    global _index, _index_version, _checked_at
+
+    now = time.monotonic()
+    index = _index
+    if index is not None and now - _checked_at < INDEX_CHECK_SECONDS:
+        metrics.count_cache('lookup_index', True)
+        return index
+
+    version = current_version()
+    with _lock:
+        _checked_at = now
+        stale = _index is None or version != _index_version
+        if stale:
+            _index = LookupIndex(LookupData.objects.values_list('id', 'lookup_type', 'value'))
+            _index_version = version
+        metrics.count_cache('lookup_index', not stale)
+        return _index
+
+
+def resolve_id(lookup_type, value):
+    """LookupData id for `value`, or None if it isn't a lookup value."""
+    if not value:
+        return None
+    lookup_id = get_index().ids.get(lookup_type, {}).get(value)
+    metrics.count_cache('lookup_resolve', lookup_id is not None)
+    if lookup_id is None:
+        # Index may be a few seconds stale, or the match only case-insensitive
+        lookup_id = LookupData.objects.filter(
+            lookup_type=lookup_type, value=value
+        ).values_list('id', flat=True).first()
+    return lookup_id
+
+
+def sync_refs(project):
+    """Point a project's lookup keys at the rows matching its text values."""
+    for lookup_type, (text_field, ref_field) in REF_FIELDS.items():
+        setattr(project, f'{ref_field}_id', resolve_id(lookup_type, getattr(project, text_field)))
+
+
+def backfill_refs(lookup_type, values=None, projects=None):
+    """
+    Set-based key fill for projects whose text matches a lookup value but
+    whose key is missing (rows saved before the value was added, or before
+    the keys existed). `values` / `projects` narrow the UPDATE.
+    Returns the number of updated projects.
+    """
+    text_field, ref_field = REF_FIELDS[lookup_type]
+    if projects is None:
+        projects = Project.all_objects.all()
+    lookup_values = LookupData.objects.filter(lookup_type=lookup_type).values('value')
+    projects = projects.filter(**{f'{ref_field}__isnull': True, f'{text_field}__in': lookup_values})
+    if values is not None:
+        projects = projects.filter(**{f'{text_field}__in': values})
+    match = LookupData.objects.filter(
+        lookup_type=lookup_type, value=OuterRef(text_field)
+    ).values('id')[:1]
+    return projects.update(**{ref_field: Subquery(match)})
+
+
+def rename_refs(lookup_type, lookup_id, value):
+    """
+    Set-based text update after lookup row `lookup_id` was renamed to
+    `value`: every project keyed to it gets the new text (and a new
+    updated_at, so row caches and the reporting snapshot pick it up).
+    Archived projects keep the text they were archived with.
+    Returns the number of updated projects.
+    """
+    text_field, ref_field = REF_FIELDS[lookup_type]
+    return Project.all_objects.filter(**{f'{ref_field}_id': lookup_id}).exclude(
+        **{text_field: value}
+    ).update(**{text_field: value, 'updated_at': timezone.now()})
+
+
+def facet_values(queryset, lookup_type):
+    """
+    Distinct court/reviewer values in `queryset`, sorted (None first), as
+    `values_list(text).distinct()` would return them. In normalized mode
+    the DISTINCT runs over the integer keys; only rows without a key fall
+    back to the text column.
+    """
+    text_field, ref_field = REF_FIELDS[lookup_type]
+    if not settings.PROJECTS_NORMALIZED_LOOKUPS:
+        return list(queryset.values_list(text_field, flat=True).distinct().order_by(text_field))
+
+    ids = set(
+        queryset.filter(**{f'{ref_field}__isnull': False})
+        .values_list(f'{ref_field}_id', flat=True).distinct().order_by()
+    )
+    index = get_index()
+    found = {lookup_id: index.values[lookup_id] for lookup_id in ids if lookup_id in index.values}
+    missing = ids - set(found)
+    metrics.count_cache('filter_option_values', True, len(found))
+    metrics.count_cache('filter_option_values', False, len(missing))
+    if missing:
+        found.update(LookupData.objects.filter(id__in=missing).values_list('id', 'value'))
+    unmatched = (
+        queryset.filter(**{f'{ref_field}__isnull': True})
+        .values_list(text_field, flat=True).distinct().order_by()
+    )
+    values = set(found.values()) | set(unmatched)
+    return sorted(values, key=lambda value: (value is not None, value or ''))
+
+
+def clean_values(values):
+    """Strip blanks and duplicates, keeping the given order."""
+    cleaned = []
+    for value in values:
+        value = str(value).strip()
+        if value and value not in cleaned:
+            cleaned.append(value)
+    return cleaned
+
+
+def replace_lookup_values(lookup_type, values, deactivate_missing=True):
+    """
+    Make `values` the active options of `lookup_type` in one transaction:
+    insert new values with a single bulk_create, reactivate inactive ones
+    and (unless `deactivate_missing` is False) deactivate every other
+    active value with one UPDATE. Rows are never deleted, since projects
+    store the text of old values.
+
+    Returns counts of added/reactivated/deactivated values and the
+    resulting version.
+    """
+    values = clean_values(values)
+    now = timezone.now()
+    with transaction.atomic():
+        rows = LookupData.objects.filter(lookup_type=lookup_type)
+        existing = set(rows.values_list('value', flat=True))
+        new_values = [value for value in values if value not in existing]
+        LookupData.objects.bulk_create(
+            [LookupData(lookup_type=lookup_type, value=value, is_active=True) for value in new_values],
+            ignore_conflicts=True,
+        )
+        reactivated = rows.filter(value__in=values, is_active=False).update(
+            is_active=True, updated_at=now
+        )
+        deactivated = 0
+        if deactivate_missing:
+            deactivated = rows.filter(is_active=True).exclude(value__in=values).update(
+                is_active=False, updated_at=now
+            )
+        if new_values:
+            backfill_refs(lookup_type, new_values)
+        if new_values or reactivated or deactivated:
+            bump_version()
+        version = current_version()
+
+    return {
+        'added': len(new_values),
+        'reactivated': reactivated,
+        'deactivated': deactivated,
+        'version': version,
+    }
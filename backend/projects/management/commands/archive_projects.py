@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from projects.archive import archivable_deleted, archivable_completed, archive_queryset
+
+
+class Command(BaseCommand):
+    help = 'Move old soft-deleted and completed projects into the archive table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--deleted-days', type=int, default=settings.PROJECT_ARCHIVE_DELETED_DAYS,
+            help='Archive soft-deleted projects deleted more than this many days ago',
+        )
+        parser.add_argument(
+            '--completed-months', type=int, default=settings.PROJECT_ARCHIVE_COMPLETED_MONTHS,
+            help='Archive completed projects completed more than this many months ago',
+        )
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--skip-completed', action='store_true',
+            help='Only archive soft-deleted projects',
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Report how many rows would be archived without moving them',
+        )
+
+    def handle(self, *args, **options):
+        targets = [('soft-deleted', archivable_deleted(options['deleted_days']))]
+        if not options['skip_completed']:
+            targets.append(('completed', archivable_completed(options['completed_months'])))
+
+        for label, queryset in targets:
+            if options['dry_run']:
+                self.stdout.write(f'{label}: {queryset.count()} project(s) would be archived')
+                continue
+
+            total = 0
+            for moved in archive_queryset(queryset, options['batch_size']):
+                total += moved
+                self.stdout.write(f'{label}: archived {total} project(s)...')
+            self.stdout.write(self.style.SUCCESS(f'✓ {label}: {total} project(s) archived'))
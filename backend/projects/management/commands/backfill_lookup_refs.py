@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max, Min
+
+from projects.lookups import REF_FIELDS, backfill_refs
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        'Fill court_ref / reviewer_ref on projects whose court/reviewer text matches '
+        'a LookupData value. Runs one UPDATE per id range and lookup type; safe to re-run.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=20000, help='Project ids per UPDATE')
+
+    def handle(self, *args, **options):
+        bounds = Project.all_objects.aggregate(low=Min('id'), high=Max('id'))
+        if bounds['low'] is None:
+            self.stdout.write('No projects')
+            return
+
+        batch_size = options['batch_size']
+        for lookup_type, (text_field, ref_field) in REF_FIELDS.items():
+            total = 0
+            for start in range(bounds['low'], bounds['high'] + 1, batch_size):
+                with transaction.atomic():
+                    total += backfill_refs(
+                        lookup_type,
+                        projects=Project.all_objects.filter(id__gte=start, id__lt=start + batch_size),
+                    )
+            unmatched = Project.all_objects.filter(
+                **{f'{ref_field}__isnull': True, f'{text_field}__isnull': False}
+            ).exclude(**{text_field: ''}).count()
+            self.stdout.write(self.style.SUCCESS(
+                f'{lookup_type}: {total} project(s) linked, {unmatched} with a value not in LookupData'
+            ))
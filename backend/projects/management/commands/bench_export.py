@@ -0,0 +1,96 @@
+import csv
+import datetime
+import io
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.models import User
+from projects import parallel_export
+from projects.models import Project
+from projects.views import EXPORT_HEADERS, _export_row
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark CSV/Excel export generation, serial vs parallel shards '
+        '(projects.parallel_export) per worker count. Inserts and commits '
+        'synthetic rows (needed by the worker processes) and deletes them '
+        'afterwards; run against a dev/staging database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000)
+        parser.add_argument('--workers', default='2,4,8', help='Comma-separated worker counts (2 or more)')
+        parser.add_argument('--formats', default='csv,xlsx')
+        parser.add_argument('--days', type=int, default=365, help='completed_date spread of the rows')
+
+    @staticmethod
+    def _serial(queryset, file_format):
+        """The serial export path: one process, one sheet."""
+        sink = tempfile.TemporaryFile()
+        if file_format == 'csv':
+            text = io.TextIOWrapper(sink, encoding='utf-8', newline='')
+            writer = csv.writer(text)
+            writer.writerow(EXPORT_HEADERS)
+            for project in queryset.iterator(chunk_size=2000):
+                writer.writerow(_export_row(project))
+            text.flush()
+        else:
+            import openpyxl
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet('Projects')
+            ws.append(EXPORT_HEADERS)
+            for project in queryset.iterator(chunk_size=2000):
+                ws.append(_export_row(project))
+            wb.save(sink)
+        sink.close()
+
+    @staticmethod
+    def _parallel(queryset, file_format, workers):
+        shards = parallel_export.plan_shards([queryset], workers=workers, min_rows=0)
+        write = parallel_export.write_csv if file_format == 'csv' else parallel_export.write_xlsx
+        with tempfile.TemporaryFile() as sink:
+            return write(shards, sink, EXPORT_HEADERS, _export_row, workers=workers)
+
+    def handle(self, *args, **options):
+        worker_counts = sorted(int(count) for count in options['workers'].split(',') if int(count) > 1)
+        formats = options['formats'].split(',')
+        today = datetime.date.today()
+
+        user = User.objects.create(username='bench_export')
+        try:
+            Project.objects.bulk_create(
+                [
+                    Project(
+                        application_number=f'BENCH-{i}', account_name=f'Bench account {i}',
+                        created_by=user, stage='Completed',
+                        completed_date=today - datetime.timedelta(days=i % options['days']),
+                        comments='Synthetic export benchmark row. ' * 8,
+                    )
+                    for i in range(options['rows'])
+                ],
+                batch_size=1000,
+            )
+            queryset = Project.objects.filter(created_by=user).select_related('created_by')
+            self.stdout.write(f'{options["rows"]} rows')
+            self.stdout.write(f'{"format":>8}{"workers":>10}{"seconds":>10}{"rows/s":>10}{"speedup":>10}')
+            for file_format in formats:
+                started = time.perf_counter()
+                self._serial(queryset, file_format)
+                serial = time.perf_counter() - started
+                self.stdout.write(
+                    f'{file_format:>8}{"serial":>10}{serial:>10.2f}{options["rows"] / serial:>10.0f}{1:>10.2f}'
+                )
+                for workers in worker_counts:
+                    started = time.perf_counter()
+                    self._parallel(queryset, file_format, workers)
+                    elapsed = time.perf_counter() - started
+                    self.stdout.write(
+                        f'{file_format:>8}{workers:>10}{elapsed:>10.2f}'
+                        f'{options["rows"] / elapsed:>10.0f}{serial / elapsed:>10.2f}'
+                    )
+        finally:
+            Project.all_objects.filter(created_by=user).delete()
+            user.delete()
@@ -0,0 +1,88 @@
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from config.log_handlers import AsyncLogHandler
+
+
+class SlowStream:
+    """File stream wrapper that sleeps on every flush to mimic a busy disk."""
+
+    def __init__(self, stream, latency):
+        self.stream = stream
+        self.latency = latency
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def flush(self):
+        self.stream.flush()
+        if self.latency:
+            time.sleep(self.latency)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark per-record logging latency on the request path: sync FileHandler vs AsyncLogHandler'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--records', type=int, default=20000)
+        parser.add_argument(
+            '--per-request', type=int, default=3,
+            help='Log calls per simulated request (a login logs 3 INFO records)',
+        )
+        parser.add_argument(
+            '--disk-latency-ms', type=float, default=0,
+            help='Extra delay per flush, to simulate a slow or contended log volume',
+        )
+
+    def _measure(self, handler, records, per_request):
+        logger = logging.Logger('bench_logging', logging.INFO)
+        if handler is not None:
+            logger.addHandler(handler)
+        timings = []
+        for i in range(records // per_request):
+            started = time.perf_counter()
+            for _ in range(per_request):
+                logger.info('Login attempt for username: %s', f'user{i}')
+            timings.append((time.perf_counter() - started) * 1_000_000)
+        if handler is not None:
+            handler.close()
+        return timings
+
+    def handle(self, *args, **options):
+        records = options['records']
+        per_request = options['per_request']
+        latency = options['disk_latency_ms'] / 1000
+
+        with tempfile.TemporaryDirectory() as log_dir:
+            sync_handler = logging.FileHandler(os.path.join(log_dir, 'sync.log'), delay=True)
+            sync_handler.setFormatter(
+                logging.Formatter('{levelname} {asctime} {module} {message}', style='{')
+            )
+            sync_handler.setStream(SlowStream(open(os.path.join(log_dir, 'sync.log'), 'a'), latency))
+            async_handler = AsyncLogHandler(
+                os.path.join(log_dir, 'async.log'), console=False
+            )
+            async_handler.targets[0].setStream(
+                SlowStream(open(os.path.join(log_dir, 'async.log'), 'a'), latency)
+            )
+
+            results = [
+                ('no handler', self._measure(None, records, per_request)),
+                ('sync FileHandler (before)', self._measure(sync_handler, records, per_request)),
+                ('AsyncLogHandler (after)', self._measure(async_handler, records, per_request)),
+            ]
+            async_handler.stop()
+
+        self.stdout.write(f'Logging overhead per request ({per_request} records), microseconds:')
+        self.stdout.write(f'{"":<28}{"p50":>10}{"p99":>10}{"max":>12}')
+        for label, timings in results:
+            timings.sort()
+            p99 = timings[int(len(timings) * 0.99) - 1]
+            self.stdout.write(
+                f'{label:<28}{statistics.median(timings):>10.1f}{p99:>10.1f}{timings[-1]:>12.1f}'
+            )
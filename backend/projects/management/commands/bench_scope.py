@@ -0,0 +1,72 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from django.http import Http404
+
+from accounts.models import User
+from projects.models import Project
+from projects.scopes import ProjectScope
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark single-project detail lookups (OR-join query vs primary-key seek '
+        '+ Python check) as the table grows. Inserts synthetic rows inside a '
+        'transaction that is rolled back; run against a dev/staging database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,50000', help='Comma-separated table sizes')
+        parser.add_argument('--lookups', type=int, default=300, help='Lookups timed per size')
+        parser.add_argument('--teams', type=int, default=20)
+
+    @staticmethod
+    def _or_join_lookup(user, pk):
+        return Project.objects.filter(
+            Q(created_by=user) | Q(created_by__team=user.team)
+        ).get(pk=pk)
+
+    @staticmethod
+    def _scope_lookup(user, pk):
+        return ProjectScope(user).get_visible(pk)
+
+    def _time(self, lookup, user, pks):
+        started = time.perf_counter()
+        for pk in pks:
+            try:
+                lookup(user, pk)
+            except (Project.DoesNotExist, Http404):
+                pass
+        return (time.perf_counter() - started) / len(pks) * 1_000_000
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options['sizes'].split(','))
+        self.stdout.write(f'{"rows":>10}{"OR join (us)":>16}{"pk seek (us)":>16}')
+
+        with transaction.atomic():
+            users = User.objects.bulk_create([
+                User(username=f'bench_scope_{i}', team=f'bench_team_{i % options["teams"]}')
+                for i in range(options['teams'] * 5)
+            ])
+            viewer = users[0]
+            inserted = 0
+            for size in sizes:
+                Project.objects.bulk_create(
+                    [
+                        Project(application_number=f'BENCH-{i}', created_by=random.choice(users))
+                        for i in range(inserted, size)
+                    ],
+                    batch_size=1000,
+                )
+                inserted = size
+                pks = random.sample(
+                    list(Project.objects.values_list('pk', flat=True)),
+                    min(options['lookups'], size),
+                )
+                or_join = self._time(self._or_join_lookup, viewer, pks)
+                pk_seek = self._time(self._scope_lookup, viewer, pks)
+                self.stdout.write(f'{size:>10}{or_join:>16.1f}{pk_seek:>16.1f}')
+            transaction.set_rollback(True)
@@ -0,0 +1,54 @@
+import csv
+import sys
+
+from django.core.management.base import BaseCommand
+
+from projects.applications import MATCH_FIELDS, duplicate_groups
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        'List application numbers logged more than once (ignoring case and spaces), '
+        'using one GROUP BY over the normalized-number index.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--include-deleted', action='store_true', help='Count soft-deleted projects too')
+        parser.add_argument('--min-count', type=int, default=2)
+        parser.add_argument('--limit', type=int, default=100, help='Maximum number of duplicate groups')
+        parser.add_argument('--csv', action='store_true', help='Write one CSV row per project to stdout')
+
+    def handle(self, *args, **options):
+        queryset = Project.objects.with_deleted() if options['include_deleted'] else Project.objects.all()
+
+        groups = list(duplicate_groups(queryset, options['min_count'])[:options['limit']])
+        if not groups:
+            self.stdout.write('No duplicate application numbers')
+            return
+
+        # One query for the member rows of every reported group
+        members = {}
+        for row in (
+            queryset.filter(application_number_normalized__in=[number for number, _ in groups])
+            .order_by('application_number_normalized', 'created_at')
+            .values('application_number_normalized', *MATCH_FIELDS)
+        ):
+            members.setdefault(row['application_number_normalized'], []).append(row)
+
+        if options['csv']:
+            writer = csv.writer(sys.stdout)
+            writer.writerow(['normalized_number', *MATCH_FIELDS])
+            for number, _ in groups:
+                for row in members.get(number, []):
+                    writer.writerow([number, *(row[field] for field in MATCH_FIELDS)])
+            return
+
+        for number, count in groups:
+            self.stdout.write(self.style.WARNING(f'{number}: {count} projects'))
+            for row in members.get(number, []):
+                self.stdout.write(
+                    f'  #{row["id"]} {row["application_number"]!r} {row["account_name"]} '
+                    f'({row["stage"]}, by {row["created_by__username"]}, {row["created_at"]:%Y-%m-%d})'
+                )
+        self.stdout.write(f'{len(groups)} duplicate application number(s)')
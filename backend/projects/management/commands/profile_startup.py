@@ -0,0 +1,105 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Boots the app the way a gunicorn worker does and reports wall time and RSS
+BOOT_SNIPPET = '''
+import time
+started = time.perf_counter()
+import os
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+from config.wsgi import warm_up
+warm_up()
+elapsed_ms = (time.perf_counter() - started) * 1000
+import json, resource, sys
+print(json.dumps({
+    'boot_ms': elapsed_ms,
+    'maxrss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'heavy_modules': {name: name in sys.modules for name in %r},
+}))
+'''
+
+# Modules that JSON endpoints should not need at boot
+HEAVY_MODULES = ('openpyxl', 'pyarrow', 'csv', 'pytz')
+
+
+class Command(BaseCommand):
+    help = 'Profile worker start-up: import times (python -X importtime), boot time and RSS'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='Boots to time (median is reported)')
+        parser.add_argument('--top', type=int, default=20, help='Slowest imports to list')
+        parser.add_argument('--label', default='', help='Release label stored with --output')
+        parser.add_argument(
+            '--output',
+            help='Append the result as one JSON line to this file, to track releases over time',
+        )
+
+    def _boot(self, importtime=False):
+        args = [sys.executable]
+        if importtime:
+            args += ['-X', 'importtime']
+        args += ['-c', BOOT_SNIPPET % (HEAVY_MODULES,)]
+        completed = subprocess.run(
+            args, cwd=settings.BASE_DIR, env=os.environ.copy(),
+            capture_output=True, text=True, check=True,
+        )
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        return result, completed.stderr
+
+    @staticmethod
+    def _parse_importtime(stderr):
+        imports = []
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or 'imported package' in line:
+                continue
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            # Nested imports are indented by two spaces per level
+            imports.append((int(cumulative_us), int(self_us), name.rstrip()[1:]))
+        return imports
+
+    def handle(self, *args, **options):
+        _, stderr = self._boot(importtime=True)
+        imports = self._parse_importtime(stderr)
+        top_level = [entry for entry in imports if not entry[2].startswith(' ')]
+        import_total_ms = sum(cumulative for cumulative, _, _ in top_level) / 1000
+
+        boots = [self._boot()[0] for _ in range(options['runs'])]
+        boot_ms = statistics.median(boot['boot_ms'] for boot in boots)
+        maxrss_kb = statistics.median(boot['maxrss_kb'] for boot in boots)
+        heavy_modules = boots[-1]['heavy_modules']
+
+        self.stdout.write(f'Boot time (median of {len(boots)}): {boot_ms:.1f} ms')
+        self.stdout.write(f'Peak RSS (median): {maxrss_kb / 1024:.1f} MiB')
+        self.stdout.write(f'Total import time: {import_total_ms:.1f} ms')
+        for name, loaded in heavy_modules.items():
+            self.stdout.write(f'  {name:<10} {"loaded at boot" if loaded else "lazy"}')
+
+        self.stdout.write(f'\nSlowest {options["top"]} imports (cumulative ms / self ms):')
+        slowest = sorted(imports, reverse=True)[:options['top']]
+        for cumulative, self_us, name in slowest:
+            self.stdout.write(f'{cumulative / 1000:9.1f} {self_us / 1000:9.1f}  {name.strip()}')
+
+        if options['output']:
+            record = {
+                'label': options['label'],
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': sys.version.split()[0],
+                'boot_ms': round(boot_ms, 1),
+                'maxrss_kb': maxrss_kb,
+                'import_total_ms': round(import_total_ms, 1),
+                'heavy_modules': heavy_modules,
+                'slowest_imports': [
+                    {'module': name.strip(), 'cumulative_ms': cumulative / 1000}
+                    for cumulative, _, name in slowest
+                ],
+            }
+            with open(options['output'], 'a') as output:
+                output.write(json.dumps(record) + '\n')
+            self.stdout.write(self.style.SUCCESS(f'✓ Result appended to {options["output"]}'))
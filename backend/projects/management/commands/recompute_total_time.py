@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from projects.durations import RECOMPUTE_CHUNK_SIZE, MinutesBetween, recompute_total_time, stale_total_time
+from projects.models import ArchivedProject, Project
+
+
+class Command(BaseCommand):
+    help = (
+        'Find projects whose total_time does not match start_time/end_time (rows '
+        'written by QuerySet.update, bulk paths or direct SQL) and recompute them '
+        'with one set-based UPDATE per id range.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only count and show stale rows')
+        parser.add_argument('--chunk-size', type=int, default=RECOMPUTE_CHUNK_SIZE, help='Ids per UPDATE')
+        parser.add_argument('--include-archived', action='store_true', help='Also check archived projects')
+        parser.add_argument('--show', type=int, default=10, help='Stale rows listed with --dry-run')
+
+    def handle(self, *args, **options):
+        models = [Project, ArchivedProject] if options['include_archived'] else [Project]
+        for model in models:
+            name = model._meta.db_table
+            if options['dry_run'] and options['show']:
+                sample = stale_total_time(model._base_manager.order_by('id')).annotate(
+                    expected=MinutesBetween('start_time', 'end_time')
+                ).values_list('id', 'total_time', 'expected')[:options['show']]
+                for pk, current, expected in sample:
+                    self.stdout.write(f'{name} #{pk}: total_time {current} -> {expected}')
+
+            started = time.perf_counter()
+
+            def progress(last_id, max_id, count):
+                self.stdout.write(
+                    f'{name}: ids <= {last_id} of {max_id} ({last_id / max_id:.0%}), '
+                    f'{count} {"stale" if options["dry_run"] else "fixed"}'
+                )
+
+            total = recompute_total_time(
+                model, chunk_size=options['chunk_size'], dry_run=options['dry_run'],
+                progress=progress if options['verbosity'] >= 1 else None,
+            )
+            verb = 'stale' if options['dry_run'] else 'recomputed'
+            self.stdout.write(self.style.SUCCESS(
+                f'{name}: {total} {verb} in {time.perf_counter() - started:.1f}s'
+            ))
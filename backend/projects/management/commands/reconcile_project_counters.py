@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from projects.counters import expected_counts
+from projects.models import ProjectCounter
+
+
+class Command(BaseCommand):
+    help = 'Recompute dashboard summary counters from the projects table and fix drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Report drifted counters without changing them',
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            expected = expected_counts()
+            existing = {
+                (row.scope, row.scope_key, row.stage, row.project_status): row
+                for row in ProjectCounter.objects.select_for_update()
+            }
+
+            to_create = []
+            to_update = []
+            to_delete = []
+            for key, count in expected.items():
+                row = existing.get(key)
+                if row is None:
+                    scope, scope_key, stage, project_status = key
+                    to_create.append(ProjectCounter(
+                        scope=scope, scope_key=scope_key, stage=stage,
+                        project_status=project_status, count=count,
+                    ))
+                elif row.count != count:
+                    self.stdout.write(f'{row}: expected {count}')
+                    row.count = count
+                    to_update.append(row)
+            for key, row in existing.items():
+                if key not in expected and row.count != 0:
+                    self.stdout.write(f'{row}: expected 0')
+                    to_delete.append(row.pk)
+
+            drift = len(to_create) + len(to_update) + len(to_delete)
+            if options['dry_run']:
+                self.stdout.write(f'{drift} counter(s) out of date')
+                transaction.set_rollback(True)
+                return
+
+            ProjectCounter.objects.bulk_create(to_create)
+            ProjectCounter.objects.bulk_update(to_update, ['count'])
+            ProjectCounter.objects.filter(pk__in=to_delete).delete()
+
+        self.stdout.write(self.style.SUCCESS(f'✓ {drift} counter(s) reconciled'))
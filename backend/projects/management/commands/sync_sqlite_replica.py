@@ -0,0 +1,32 @@
+import sqlite3
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from config.db_router import REPLICA_ALIAS
+
+
+class Command(BaseCommand):
+    help = (
+        'Copy the local SQLite primary into the SQLite replica (DB_SQLITE_PATH -> '
+        'DB_REPLICA_SQLITE_PATH), standing in for replication when testing '
+        'replica routing locally.'
+    )
+
+    def handle(self, *args, **options):
+        if REPLICA_ALIAS not in connections.databases:
+            raise CommandError('No replica database configured')
+        primary = connections['default'].settings_dict
+        replica = connections[REPLICA_ALIAS].settings_dict
+        if 'sqlite3' not in primary['ENGINE'] or 'sqlite3' not in replica['ENGINE']:
+            raise CommandError('Only for the local two-SQLite setup; real replicas replicate themselves')
+
+        connections[REPLICA_ALIAS].close()
+        source = sqlite3.connect(primary['NAME'])
+        target = sqlite3.connect(replica['NAME'])
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+        self.stdout.write(self.style.SUCCESS(f'Copied {primary["NAME"]} to {replica["NAME"]}'))
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:42
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('projects', '0004_add_redline_conditional_approve'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedProject',
+            fields=[
+                ('completed_date', models.DateField(blank=True, help_text='Project completion date (auto-set on submit)', null=True)),
+                ('application_number', models.CharField(help_text='Unique application identifier', max_length=100)),
+                ('account_name', models.CharField(blank=True, help_text='Customer/account name', max_length=255, null=True)),
+                ('project_court', models.CharField(blank=True, help_text='Project court/location', max_length=100, null=True)),
+                ('reviewed_by', models.CharField(blank=True, help_text='Reviewer name', max_length=100, null=True)),
+                ('project_status', models.CharField(blank=True, choices=[('Approve', 'Approve'), ('Conditional Approve', 'Conditional Approve'), ('Reject', 'Reject'), ('Review', 'Review')], help_text='Approval status', max_length=20, null=True)),
+                ('start_time', models.DateTimeField(blank=True, help_text='Project start time (auto-set when application number entered, stored in IST, displayed in MST)', null=True)),
+                ('end_time', models.DateTimeField(blank=True, help_text='Project end time (auto-set on submit, stored in IST, displayed in MST)', null=True)),
+                ('total_time', models.DecimalField(blank=True, decimal_places=2, help_text='Total time in hours (auto-calculated)', max_digits=10, null=True)),
+                ('partner_installer_account', models.CharField(blank=True, help_text='Partner installer account name', max_length=255, null=True)),
+                ('third_party_salesforce', models.CharField(blank=True, choices=[('YES', 'YES'), ('NO', 'NO')], help_text='Third party Salesforce integration', max_length=3, null=True)),
+                ('comments', models.TextField(blank=True, help_text='Additional comments', null=True)),
+                ('content', models.TextField(blank=True, help_text='Project content/description', null=True)),
+                ('is_new_learning', models.BooleanField(default=False, help_text='Flag for new learning projects')),
+                ('is_redline', models.BooleanField(default=False, help_text='Redline flag')),
+                ('stage', models.CharField(choices=[('Started', 'Started'), ('Completed', 'Completed')], default='Started', help_text='Project stage: Started (draft) or Completed (submitted)', max_length=20)),
+                ('id', models.BigIntegerField(help_text='Original project id', primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(help_text='Original creation timestamp')),
+                ('updated_at', models.DateTimeField(help_text='Last update timestamp before archival')),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True, help_text='When the row was moved to the archive')),
+                ('created_by', models.ForeignKey(help_text='User who created this project', on_delete=django.db.models.deletion.CASCADE, related_name='archived_projects', to=settings.AUTH_USER_MODEL)),
+                ('deleted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='deleted_archived_projects', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'projects_archive',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['created_by', '-created_at'], name='projects_ar_created_ee95e2_idx'), models.Index(fields=['completed_date'], name='projects_ar_complet_517169_idx'), models.Index(fields=['application_number'], name='projects_ar_applica_8b12e4_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_archivedproject'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-created_at'], name='projects_created_390fdd_idx'),
+        ),
+    ]
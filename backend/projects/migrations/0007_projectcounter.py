@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_project_created_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('user', 'User'), ('team', 'Team'), ('all', 'All projects')], max_length=10)),
+                ('scope_key', models.CharField(blank=True, default='', help_text='User id for user scope, team name for team scope, empty for all', max_length=100)),
+                ('stage', models.CharField(max_length=20)),
+                ('project_status', models.CharField(blank=True, default='', help_text='Empty when the project has no status yet', max_length=50)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'project_counters',
+                'unique_together': {('scope', 'scope_key', 'stage', 'project_status')},
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_projectcounter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LookupVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'lookup_version',
+            },
+        ),
+    ]
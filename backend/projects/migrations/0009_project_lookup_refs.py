@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_lookup_refs(apps, schema_editor):
+    """Point existing projects at the LookupData rows matching their text."""
+    Project = apps.get_model('projects', 'Project')
+    LookupData = apps.get_model('projects', 'LookupData')
+    for lookup_type, text_field, ref_field in (
+        ('court', 'project_court', 'court_ref'),
+        ('reviewer', 'reviewed_by', 'reviewer_ref'),
+    ):
+        match = LookupData.objects.filter(
+            lookup_type=lookup_type, value=models.OuterRef(text_field)
+        ).values('id')[:1]
+        Project.objects.filter(**{f'{text_field}__isnull': False}).update(
+            **{ref_field: models.Subquery(match)}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0008_lookupversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='court_ref',
+            field=models.ForeignKey(blank=True, help_text='LookupData row matching project_court', limit_choices_to={'lookup_type': 'court'}, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='projects.lookupdata'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='reviewer_ref',
+            field=models.ForeignKey(blank=True, help_text='LookupData row matching reviewed_by', limit_choices_to={'lookup_type': 'reviewer'}, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='projects.lookupdata'),
+        ),
+        migrations.RunPython(backfill_lookup_refs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:10
+
+from django.db import migrations, models
+from django.db.models.functions import Replace, Upper
+
+
+def backfill_normalized(apps, schema_editor):
+    """Upper-case, space-free copy of every application number, in one UPDATE."""
+    Project = apps.get_model('projects', 'Project')
+    Project.objects.update(
+        application_number_normalized=Upper(
+            Replace('application_number', models.Value(' '), models.Value(''))
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0009_project_lookup_refs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='application_number_normalized',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Normalized application number (set on save)', max_length=100),
+        ),
+        migrations.RunPython(backfill_normalized, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['application_number_normalized', '-created_at'], name='projects_applica_1f0ef5_idx'),
+        ),
+    ]
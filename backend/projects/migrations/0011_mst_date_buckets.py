@@ -0,0 +1,89 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:14
+
+from django.db import migrations, models
+import projects.buckets
+
+
+def backfill_buckets(apps, schema_editor):
+    """Compute the MST buckets of existing live and archived projects."""
+    for model_name in ('Project', 'ArchivedProject'):
+        projects.buckets.backfill_buckets(apps.get_model('projects', model_name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0010_application_number_normalized'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedproject',
+            name='created_day',
+            field=projects.buckets.MSTBucketField(blank=True, bucket='day', editable=False, help_text='MST day of created_at', null=True, source='created_at'),
+        ),
+        migrations.AddField(
+            model_name='archivedproject',
+            name='created_month',
+            field=projects.buckets.MSTBucketField(blank=True, bucket='month', editable=False, help_text='First day of the MST month of created_at', null=True, source='created_at'),
+        ),
+        migrations.AddField(
+            model_name='archivedproject',
+            name='created_week',
+            field=projects.buckets.MSTBucketField(blank=True, bucket='week', editable=False, help_text='Monday of the MST week of created_at', null=True, source='created_at'),
+        ),
+        migrations.AddField(
+            model_name='archivedproject',
+            name='start_day',
+            field=projects.buckets.MSTBucketField(blank=True, bucket='day', editable=False, help_text='MST day of start_time', null=True, source='start_time'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='created_day',
+            field=projects.buckets.MSTBucketField(blank=True, bucket='day', editable=False, help_text='MST day of created_at', null=True, source='created_at'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='created_month',
+            field=projects.buckets.MSTBucketField(blank=True, bucket='month', editable=False, help_text='First day of the MST month of created_at', null=True, source='created_at'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='created_week',
+            field=projects.buckets.MSTBucketField(blank=True, bucket='week', editable=False, help_text='Monday of the MST week of created_at', null=True, source='created_at'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='start_day',
+            field=projects.buckets.MSTBucketField(blank=True, bucket='day', editable=False, help_text='MST day of start_time', null=True, source='start_time'),
+        ),
+        migrations.RunPython(backfill_buckets, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='archivedproject',
+            index=models.Index(fields=['created_day'], name='projects_ar_created_8c3982_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedproject',
+            index=models.Index(fields=['start_day'], name='projects_ar_start_d_213ec6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['created_day'], name='projects_created_c88477_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['created_week'], name='projects_created_cef5a1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['created_month'], name='projects_created_be6840_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['start_day'], name='projects_start_d_0f1d03_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['completed_date'], name='projects_complet_9dd72c_idx'),
+        ),
+    ]
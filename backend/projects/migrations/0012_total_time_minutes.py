@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0011_mst_date_buckets'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='archivedproject',
+            name='total_time',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Total time in whole minutes (auto-calculated)', max_digits=10, null=True),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='total_time',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Total time in whole minutes (auto-calculated)', max_digits=10, null=True),
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:37
+
+from django.db import migrations, models
+import projects.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0012_total_time_minutes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_created_fc9bc6_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_stage_08f763_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_project_a519d8_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_is_dele_1ceccc_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_created_390fdd_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_applica_1f0ef5_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_created_c88477_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_created_cef5a1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_created_be6840_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_start_d_0f1d03_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_complet_9dd72c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(False))), fields=['created_by', '-created_at'], name='projects_live_creator_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(False))), fields=['stage', '-created_at'], name='projects_live_stage_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(False))), fields=['project_status', '-created_at'], name='projects_live_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(False))), fields=['-created_at'], name='projects_live_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(False))), fields=['application_number_normalized', '-created_at'], name='projects_live_appno_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(False))), fields=['created_day'], name='projects_live_cday_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(False))), fields=['created_week'], name='projects_live_cweek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(False))), fields=['created_month'], name='projects_live_cmonth_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(False))), fields=['start_day'], name='projects_live_sday_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(False))), fields=['completed_date'], name='projects_live_done_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', projects.models.InlineBoolean(True))), fields=['deleted_at'], name='projects_deleted_idx'),
+        ),
+    ]
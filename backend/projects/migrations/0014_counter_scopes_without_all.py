@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:12
+
+from django.db import migrations, models
+
+
+def delete_all_scope_counters(apps, schema_editor):
+    """The global totals are now summed from the user rows on read."""
+    ProjectCounter = apps.get_model('projects', 'ProjectCounter')
+    ProjectCounter.objects.filter(scope='all').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0013_live_filtered_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_all_scope_counters, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='projectcounter',
+            name='scope',
+            field=models.CharField(choices=[('user', 'User'), ('team', 'Team')], max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='projectcounter',
+            name='scope_key',
+            field=models.CharField(blank=True, default='', help_text='User id for user scope, team name for team scope', max_length=100),
+        ),
+    ]
@@ -2,14 +2,19 @@
 Project models for IE LOGS application.
 Includes all fields from legacy Flask app with timezone handling (IST storage, MST display).
 """
-from django.db import models
+from django.db import models, transaction
+from django.db.models.lookups import Exact
+from django.db.models.sql.where import AND
 from django.conf import settings
 from django.utils import timezone
 
+from .buckets import MSTBucketField
+from .durations import minutes_between
 
-class Project(models.Model):
+
+class ProjectBase(models.Model):
     """
-    Main Project/Log model with all fields from legacy system.
+    Fields shared by live projects and their archived copies.
     Times stored in IST, displayed in MST (Phoenix, Arizona).
     """
     
@@ -89,7 +94,7 @@ class Project(models.Model):
         decimal_places=2,
         null=True,
         blank=True,
-        help_text='Total time in hours (auto-calculated)'
+        help_text='Total time in whole minutes (auto-calculated)'
     )
     
     partner_installer_account = models.CharField(
@@ -137,6 +142,96 @@ class Project(models.Model):
         help_text='Project stage: Started (draft) or Completed (submitted)'
     )
     
+    class Meta:
+        abstract = True
+    
+    def __str__(self):
+        return f"{self.application_number} - {self.account_name}"
+
+
+class InlineBoolean(models.Value):
+    """
+    A boolean compared as a literal 0/1 instead of a query parameter: SQL
+    Server only uses a filtered index when the query's predicate matches
+    the index filter literally, and a parameter never does.
+    """
+
+    def as_sql(self, compiler, connection):
+        return ('1' if self.value else '0'), []
+
+
+# Soft-delete predicates; the filtered indexes on Project use the same ones
+LIVE = models.Q(is_deleted=InlineBoolean(False))
+DELETED = models.Q(is_deleted=InlineBoolean(True))
+
+
+def _is_live_predicate(node):
+    """Whether a WHERE child is the LIVE filter the default manager adds."""
+    return (
+        isinstance(node, Exact)
+        and getattr(node.lhs, 'target', None) is not None
+        and node.lhs.target.name == 'is_deleted'
+        and isinstance(node.rhs, InlineBoolean)
+        and node.rhs.value is False
+    )
+
+
+class ProjectQuerySet(models.QuerySet):
+    """
+    Project querysets with the soft-delete predicates the filtered indexes
+    match. Querysets from Project.objects start with the LIVE filter;
+    with_deleted() and deleted_only() replace it, wherever in the chain
+    they are called.
+    """
+    
+    # Set on querysets whose first WHERE condition is the default LIVE filter
+    _hides_deleted = False
+    
+    def _clone(self):
+        clone = super()._clone()
+        clone._hides_deleted = self._hides_deleted
+        return clone
+    
+    def live(self):
+        return self.filter(LIVE)
+    
+    def with_deleted(self):
+        clone = self._chain()
+        if not clone._hides_deleted:
+            return clone
+        where = clone.query.where
+        if (
+            where.connector != AND or where.negated
+            or not where.children or not _is_live_predicate(where.children[0])
+        ):
+            raise TypeError('Call with_deleted() / deleted_only() before combining Project querysets.')
+        where.children = where.children[1:]
+        clone._hides_deleted = False
+        return clone
+    
+    def deleted_only(self):
+        return self.with_deleted().filter(DELETED)
+
+
+class ProjectManager(models.Manager.from_queryset(ProjectQuerySet)):
+    """
+    Default manager: soft-deleted projects are left out unless asked for
+    with with_deleted() / deleted_only(). Project.all_objects sees every row.
+    """
+    
+    def get_queryset(self):
+        queryset = super().get_queryset().live()
+        queryset._hides_deleted = True
+        return queryset
+
+
+class Project(ProjectBase):
+    """
+    Main Project/Log model with all fields from legacy system.
+    Times stored in IST, displayed in MST (Phoenix, Arizona).
+    `objects` excludes soft-deleted rows; `all_objects` includes them.
+    """
+    
     # Audit fields
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -176,25 +271,100 @@ class Project(models.Model):
         help_text='User who deleted this project'
     )
     
+    # MST calendar buckets of created_at / start_time for index range
+    # scans on day, week and month (see projects.buckets); declared after
+    # created_at so they see its auto_now_add value
+    created_day = MSTBucketField(source='created_at', bucket='day', help_text='MST day of created_at')
+    created_week = MSTBucketField(source='created_at', bucket='week', help_text='Monday of the MST week of created_at')
+    created_month = MSTBucketField(source='created_at', bucket='month', help_text='First day of the MST month of created_at')
+    start_day = MSTBucketField(source='start_time', bucket='day', help_text='MST day of start_time')
+    
+    # application_number upper-cased without spaces, for indexed exact /
+    # prefix lookups and duplicate detection (see projects.applications)
+    application_number_normalized = models.CharField(
+        max_length=100,
+        blank=True,
+        default='',
+        editable=False,
+        help_text='Normalized application number (set on save)'
+    )
+    
+    # Integer keys for project_court / reviewed_by, kept in step on save
+    # (see projects.lookups); used for filtering and grouping when
+    # PROJECTS_NORMALIZED_LOOKUPS is on
+    court_ref = models.ForeignKey(
+        'LookupData',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='+',
+        limit_choices_to={'lookup_type': 'court'},
+        help_text='LookupData row matching project_court'
+    )
+    
+    reviewer_ref = models.ForeignKey(
+        'LookupData',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='+',
+        limit_choices_to={'lookup_type': 'reviewer'},
+        help_text='LookupData row matching reviewed_by'
+    )
+    
+    objects = ProjectManager()
+    all_objects = models.Manager.from_queryset(ProjectQuerySet)()
+    
     class Meta:
         db_table = 'projects'
         ordering = ['-created_at']
+        # Access paths for live rows are filtered indexes: soft-deleted rows
+        # (kept until archived) take no space in them and are never scanned
         indexes = [
-            models.Index(fields=['created_by', '-created_at']),
-            models.Index(fields=['stage', '-created_at']),
-            models.Index(fields=['project_status', '-created_at']),
-            models.Index(fields=['is_deleted']),
+            models.Index(fields=['created_by', '-created_at'], condition=LIVE, name='projects_live_creator_idx'),
+            models.Index(fields=['stage', '-created_at'], condition=LIVE, name='projects_live_stage_idx'),
+            models.Index(fields=['project_status', '-created_at'], condition=LIVE, name='projects_live_status_idx'),
+            models.Index(fields=['-created_at'], condition=LIVE, name='projects_live_created_idx'),
+            models.Index(
+                fields=['application_number_normalized', '-created_at'], condition=LIVE,
+                name='projects_live_appno_idx',
+            ),
+            models.Index(fields=['created_day'], condition=LIVE, name='projects_live_cday_idx'),
+            models.Index(fields=['created_week'], condition=LIVE, name='projects_live_cweek_idx'),
+            models.Index(fields=['created_month'], condition=LIVE, name='projects_live_cmonth_idx'),
+            models.Index(fields=['start_day'], condition=LIVE, name='projects_live_sday_idx'),
+            models.Index(fields=['completed_date'], condition=LIVE, name='projects_live_done_idx'),
+            # Tombstones, for archiving and deleted_only()
+            models.Index(fields=['deleted_at'], condition=DELETED, name='projects_deleted_idx'),
         ]
     
-    def __str__(self):
-        return f"{self.application_number} - {self.account_name}"
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the counted state of loaded rows (see projects.counters)."""
+        from .counters import remember_loaded_state
+        instance = super().from_db(db, field_names, values)
+        remember_loaded_state(instance, field_names)
+        return instance
     
     def save(self, *args, **kwargs):
-        """Auto-calculate total time if start and end times are provided."""
+        """
+        Auto-calculate total time (whole minutes, see durations.py) if
+        start and end times are provided.
+        The normalized application number and lookup keys follow their text;
+        MST date buckets are set by their fields' pre_save.
+        Dashboard counters are updated in the same transaction.
+        """
+        from .counters import load_state_before_save, record_save
+        from .applications import normalize_application_number
+        from .lookups import sync_refs
         if self.start_time and self.end_time:
-            time_diff = self.end_time - self.start_time
-            self.total_time = round(time_diff.total_seconds() / 60)  # Convert to whole minutes
-        super().save(*args, **kwargs)
+            self.total_time = minutes_between(self.start_time, self.end_time)
+        self.application_number_normalized = normalize_application_number(self.application_number)
+        sync_refs(self)
+        with transaction.atomic(using=kwargs.get('using')):
+            load_state_before_save(self)
+            super().save(*args, **kwargs)
+            record_save(self)
     
     def soft_delete(self, user):
         """Soft delete the project."""
@@ -204,6 +374,114 @@ class Project(models.Model):
         self.save()
 
 
+class ArchivedProject(ProjectBase):
+    """
+    Cold-storage copy of a project moved out of the hot `projects` table
+    by the `archive_projects` management command. Keeps the original id
+    and audit timestamps so archived rows can still be searched and exported.
+    """
+    
+    id = models.BigIntegerField(
+        primary_key=True,
+        help_text='Original project id'
+    )
+    
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_projects',
+        help_text='User who created this project'
+    )
+    
+    created_at = models.DateTimeField(help_text='Original creation timestamp')
+    updated_at = models.DateTimeField(help_text='Last update timestamp before archival')
+    
+    # Same MST buckets as Project, so exports can filter both tables alike
+    created_day = MSTBucketField(source='created_at', bucket='day', help_text='MST day of created_at')
+    created_week = MSTBucketField(source='created_at', bucket='week', help_text='Monday of the MST week of created_at')
+    created_month = MSTBucketField(source='created_at', bucket='month', help_text='First day of the MST month of created_at')
+    start_day = MSTBucketField(source='start_time', bucket='day', help_text='MST day of start_time')
+    
+    is_deleted = models.BooleanField(default=False)
+    deleted_at = models.DateTimeField(null=True, blank=True)
+    deleted_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='deleted_archived_projects',
+    )
+    
+    archived_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text='When the row was moved to the archive'
+    )
+    
+    class Meta:
+        db_table = 'projects_archive'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_by', '-created_at']),
+            models.Index(fields=['completed_date']),
+            models.Index(fields=['application_number']),
+            models.Index(fields=['created_day']),
+            models.Index(fields=['start_day']),
+        ]
+    
+    @classmethod
+    def from_project(cls, project):
+        """Build an (unsaved) archive row from a live project."""
+        archived = cls(id=project.pk)
+        archived_fields = {field.attname for field in cls._meta.concrete_fields}
+        for field in Project._meta.concrete_fields:
+            # Lookup keys stay behind; the archive keeps the text values
+            if field.primary_key or field.attname not in archived_fields:
+                continue
+            setattr(archived, field.attname, getattr(project, field.attname))
+        return archived
+
+
+class ProjectCounter(models.Model):
+    """
+    Precomputed count of live (non-deleted) projects per scope, stage and
+    status, so dashboard headers cost one indexed lookup instead of COUNT(*).
+    Maintained by projects.counters; `reconcile_project_counters` fixes drift.
+    Totals over all projects are summed from the user rows on read.
+    """
+    
+    SCOPE_CHOICES = [
+        ('user', 'User'),
+        ('team', 'Team'),
+    ]
+    
+    scope = models.CharField(max_length=10, choices=SCOPE_CHOICES)
+    
+    scope_key = models.CharField(
+        max_length=100,
+        blank=True,
+        default='',
+        help_text='User id for user scope, team name for team scope'
+    )
+    
+    stage = models.CharField(max_length=20)
+    
+    project_status = models.CharField(
+        max_length=50,
+        blank=True,
+        default='',
+        help_text='Empty when the project has no status yet'
+    )
+    
+    count = models.IntegerField(default=0)
+    
+    class Meta:
+        db_table = 'project_counters'
+        unique_together = ['scope', 'scope_key', 'stage', 'project_status']
+    
+    def __str__(self):
+        return f"{self.scope}:{self.scope_key} {self.stage}/{self.project_status or '-'} = {self.count}"
+
+
 class LookupData(models.Model):
     """
     Lookup data for dropdowns (courts, reviewers, etc.).
@@ -241,3 +519,20 @@ class LookupData(models.Model):
     
     def __str__(self):
         return f"{self.get_lookup_type_display()}: {self.value}"
+
+
+class LookupVersion(models.Model):
+    """
+    Single-row counter bumped whenever any LookupData changes, so clients
+    and caches can check whether dropdown data is stale with one pk lookup.
+    Maintained by projects.lookups.
+    """
+    
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'lookup_version'
+    
+    def __str__(self):
+        return f"Lookup data version {self.version}"
@@ -0,0 +1,48 @@
+"""
+Paginators for large project tables.
+"""
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimated_row_count(model, using='default'):
+    """
+    Return the database's row-count estimate for `model`'s table, or None
+    when the backend has no cheap statistics source (e.g. SQLite).
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+
+    if connection.vendor == 'microsoft':
+        sql = (
+            'SELECT SUM(row_count) FROM sys.dm_db_partition_stats '
+            'WHERE object_id = OBJECT_ID(%s) AND index_id IN (0, 1)'
+        )
+    elif connection.vendor == 'postgresql':
+        sql = 'SELECT reltuples::bigint FROM pg_class WHERE relname = %s'
+    else:
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [table])
+        row = cursor.fetchone()
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses table statistics instead of COUNT(*) for unfiltered
+    querysets. Filtered querysets still get an exact count.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if hasattr(queryset, 'query') and not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None:
+                return estimate
+        return super().count
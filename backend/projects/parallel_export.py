@@ -0,0 +1,209 @@
+"""
+Parallel sharded CSV / Excel export.
+
+Formatting export rows (serializer, MST conversion) costs far more than
+reading them, so large exports split the filtered querysets into
+contiguous created_at ranges of similar size (cut from the ordered
+created_at list) and format them in a process pool. Each shard keeps the
+queryset's ordering, so rows come out in the same order as the serial
+export: newest first, live projects before archived ones.
+
+Shard querysets are built in the request process, so scope, filters and
+replica routing are applied exactly once; workers receive the pickled
+query and run it on their own database connection. Results are merged in
+shard order: one CSV, or one workbook with a sheet per shard. At most
+EXPORT_PARALLEL_MAX_CONCURRENT parallel exports run at a time (see
+acquire_slot); the others are exported serially.
+"""
+import csv
+import io
+import os
+import shutil
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from .models import ArchivedProject
+from .timezones import mst_zone
+
+# Excel limits sheet titles to 31 characters
+SHEET_TITLE_LENGTH = 31
+MAX_COLUMN_WIDTH = 50
+
+SLOTS_KEY = 'projects:parallel_exports'
+# A crashed worker's slot is freed after this many seconds
+SLOT_TIMEOUT = 3600
+
+
+class Shard:
+    """One contiguous slice of an export queryset and its sheet title."""
+
+    def __init__(self, title, queryset):
+        self.title = title[:SHEET_TITLE_LENGTH]
+        self.queryset = queryset
+
+
+def _mst_day(value):
+    return value.astimezone(mst_zone()).date()
+
+
+def _shard_queryset(queryset, shard_count, prefix):
+    """Return (shards, row count) for one queryset."""
+    stamps = list(queryset.order_by('-created_at').values_list('created_at', flat=True))
+    size = max(1, -(-len(stamps) // shard_count))
+    # Index of each shard's newest row; rows with equal created_at stay in one shard
+    starts = []
+    for start in range(0, len(stamps), size):
+        while start and stamps[start - 1] == stamps[start]:
+            start -= 1
+        if not starts or start > starts[-1]:
+            starts.append(start)
+
+    shards, days = [], Counter()
+    for number, start in enumerate(starts):
+        end = starts[number + 1] if number + 1 < len(starts) else len(stamps)
+        shard = queryset.filter(created_at__lte=stamps[start])
+        if end < len(stamps):
+            shard = shard.filter(created_at__gt=stamps[end])
+        oldest, newest = _mst_day(stamps[end - 1]), _mst_day(stamps[start])
+        title = f'{prefix}{oldest}..{newest}' if oldest != newest else f'{prefix}{newest}'
+        # Only single-day shards can share a title
+        days[title] += 1
+        if days[title] > 1:
+            title = f'{title} #{days[title]}'
+        shards.append(Shard(title, shard))
+    return shards, len(stamps)
+
+
+def plan_shards(querysets, workers=None, min_rows=None):
+    """
+    Shards covering `querysets` in order, or None when a parallel export
+    is not worthwhile (one worker, or fewer than `min_rows` rows,
+    EXPORT_PARALLEL_MIN_ROWS by default).
+    """
+    workers = workers or settings.EXPORT_PARALLEL_WORKERS
+    min_rows = settings.EXPORT_PARALLEL_MIN_ROWS if min_rows is None else min_rows
+    if workers <= 1:
+        return None
+    shards, rows = [], 0
+    for queryset in querysets:
+        prefix = 'Archived ' if queryset.model is ArchivedProject else ''
+        queryset_shards, queryset_rows = _shard_queryset(queryset, workers, prefix)
+        shards.extend(queryset_shards)
+        rows += queryset_rows
+    return shards if shards and rows >= min_rows else None
+
+
+def acquire_slot():
+    """
+    Claim one of EXPORT_PARALLEL_MAX_CONCURRENT parallel export slots;
+    False when all are taken. Slots are counted in the cache, so the limit
+    is shared by all workers only when REDIS_URL is set.
+    """
+    cache.add(SLOTS_KEY, 0, timeout=SLOT_TIMEOUT)
+    try:
+        taken = cache.incr(SLOTS_KEY)
+    except ValueError:
+        # Expired between add() and incr()
+        cache.add(SLOTS_KEY, 1, timeout=SLOT_TIMEOUT)
+        taken = 1
+    if taken > settings.EXPORT_PARALLEL_MAX_CONCURRENT:
+        release_slot()
+        return False
+    return True
+
+
+def release_slot():
+    try:
+        cache.decr(SLOTS_KEY)
+    except ValueError:
+        pass
+
+
+def _init_worker(settings_module):
+    # Spawned workers (Windows/macOS) start without Django configured
+    if not apps.ready:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+        django.setup()
+
+
+def _format_shard(task):
+    """Worker: run one shard's query and format its rows."""
+    model_label, alias, query, format_row, kind = task
+    queryset = apps.get_model(model_label).objects.using(alias).all()
+    queryset.query = query
+    rows = (format_row(project) for project in queryset.iterator(chunk_size=2000))
+
+    if kind == 'csv':
+        count = 0
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='', encoding='utf-8', delete=False) as part:
+            writer = csv.writer(part)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        return part.name, count
+
+    rows = list(rows)
+    widths = [0] * (len(rows[0]) if rows else 0)
+    for row in rows:
+        for index, value in enumerate(row):
+            widths[index] = max(widths[index], len(str(value)))
+    return rows, widths
+
+
+def _run(shards, format_row, kind, workers):
+    """Yield (shard, result) in shard order while the pool formats ahead."""
+    tasks = [
+        (shard.queryset.model._meta.label, shard.queryset.db, shard.queryset.query, format_row, kind)
+        for shard in shards
+    ]
+    # Forked workers must not inherit (and share) this process's sockets
+    connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=min(workers or settings.EXPORT_PARALLEL_WORKERS, len(tasks)),
+        initializer=_init_worker,
+        initargs=(os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings'),),
+    ) as pool:
+        yield from zip(shards, pool.map(_format_shard, tasks))
+
+
+def write_csv(shards, sink, headers, format_row, workers=None):
+    """Write `headers` and all shard rows to the binary file `sink`; return the row count."""
+    header = io.StringIO()
+    csv.writer(header).writerow(headers)
+    sink.write(header.getvalue().encode('utf-8'))
+    total = 0
+    for _, (path, count) in _run(shards, format_row, 'csv', workers):
+        try:
+            with open(path, 'rb') as part:
+                shutil.copyfileobj(part, sink)
+        finally:
+            os.unlink(path)
+        total += count
+    return total
+
+
+def write_xlsx(shards, sink, headers, format_row, workers=None):
+    """Write one sheet per shard to `sink`; return the row count."""
+    import openpyxl
+    from openpyxl.utils import get_column_letter
+
+    wb = openpyxl.Workbook(write_only=True)
+    total = 0
+    for shard, (rows, widths) in _run(shards, format_row, 'rows', workers):
+        ws = wb.create_sheet(shard.title)
+        for index, header in enumerate(headers):
+            width = max(widths[index], len(header)) if index < len(widths) else len(header)
+            ws.column_dimensions[get_column_letter(index + 1)].width = min(width + 2, MAX_COLUMN_WIDTH)
+        ws.append(headers)
+        for row in rows:
+            ws.append(row)
+        total += len(rows)
+    wb.save(sink)
+    return total
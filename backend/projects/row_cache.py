@@ -0,0 +1,125 @@
+"""
+Cache of serialized project list rows.
+
+A row's representation only changes when the project or its creator
+changes, and both bump `updated_at` (auto_now, or set explicitly by the
+bulk update paths). So the cache key is
+(serializer, id, updated_at, created_by.updated_at), and stale entries
+are never read, just evicted. Each worker keeps a size-bounded LRU; an
+optional shared Django cache (PROJECT_ROW_CACHE_SHARED, e.g. Redis) is
+consulted with one get_many for the local misses.
+"""
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import serializers
+
+from config import metrics
+
+
+class LRUCache:
+    """Thread-safe, size-bounded mapping that evicts the least recently used key."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+_local = LRUCache(settings.PROJECT_ROW_CACHE_SIZE)
+_stats_lock = threading.Lock()
+_stats = {'local_hits': 0, 'shared_hits': 0, 'misses': 0}
+
+
+def _count(**increments):
+    with _stats_lock:
+        for name, value in increments.items():
+            _stats[name] += value
+
+
+def stats():
+    """Hit/miss counts and hit rate for this worker since start-up."""
+    with _stats_lock:
+        counts = dict(_stats)
+    lookups = sum(counts.values())
+    counts['hit_rate'] = round((counts['local_hits'] + counts['shared_hits']) / lookups, 4) if lookups else None
+    counts['local_size'] = len(_local)
+    counts['local_max_size'] = _local.maxsize
+    counts['shared_backend'] = settings.PROJECT_ROW_CACHE_SHARED or None
+    return counts
+
+
+def row_key(serializer, instance):
+    created_by = instance.created_by
+    return 'prow:{}:{}:{}:{}'.format(
+        type(serializer).__name__,
+        instance.pk,
+        instance.updated_at.timestamp() if instance.updated_at else '',
+        created_by.updated_at.timestamp() if created_by and created_by.updated_at else '',
+    )
+
+
+class CachedRowListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer that reuses cached row representations. The child's
+    queryset must select_related('created_by') so keys need no queries.
+    """
+
+    def to_representation(self, data):
+        instances = list(data.all() if hasattr(data, 'all') else data)
+        keys = [row_key(self.child, instance) for instance in instances]
+
+        rows = {}
+        for key in keys:
+            row = _local.get(key)
+            if row is not None:
+                rows[key] = row
+        local_hits = len(rows)
+
+        shared = caches[settings.PROJECT_ROW_CACHE_SHARED] if settings.PROJECT_ROW_CACHE_SHARED else None
+        missing = [key for key in keys if key not in rows]
+        shared_hits = 0
+        if shared is not None and missing:
+            found = shared.get_many(missing)
+            shared_hits = len(found)
+            for key, row in found.items():
+                rows[key] = row
+                _local.set(key, row)
+
+        fresh = {}
+        for key, instance in zip(keys, instances):
+            if key not in rows:
+                row = self.child.to_representation(instance)
+                rows[key] = fresh[key] = row
+                _local.set(key, row)
+        if shared is not None and fresh:
+            shared.set_many(fresh, timeout=settings.PROJECT_ROW_CACHE_TTL)
+
+        _count(local_hits=local_hits, shared_hits=shared_hits, misses=len(fresh))
+        metrics.count_cache('project_rows_local', True, local_hits)
+        metrics.count_cache('project_rows_local', False, len(keys) - local_hits)
+        if shared is not None:
+            metrics.count_cache('project_rows_shared', True, shared_hits)
+            metrics.count_cache('project_rows_shared', False, len(missing) - shared_hits)
+        return [rows[key] for key in keys]
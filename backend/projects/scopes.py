@@ -0,0 +1,79 @@
+"""
+Project visibility rules, shared by list, detail, filter-option and export views.
+
+Admin: all projects
+Team lead: projects created by anyone in their own and managed teams
+User with a team: projects created by anyone in the team
+User without a team: own projects only
+
+Team membership comes from the per-worker accounts.teams index, so list
+queries filter `created_by_id IN (...)` on an indexed column without
+joining users, and single rows are fetched by primary key and then
+authorised in Python.
+"""
+from django.http import Http404
+
+from accounts import teams
+from accounts.models import User
+from .models import Project
+
+# SQL Server accepts at most 2100 parameters per statement
+MAX_IN_IDS = 2000
+
+
+class ProjectScope:
+    """Projects visible to one user."""
+
+    def __init__(self, user):
+        self.user = user
+        self._creator_ids = None
+
+    @property
+    def sees_everything(self):
+        return self.user.is_admin
+
+    @property
+    def creator_ids(self):
+        """Ids of users whose projects are visible (None for admins)."""
+        if self._creator_ids is None and not self.sees_everything:
+            self._creator_ids = teams.get_directory().visible_creator_ids(self.user)
+        return self._creator_ids
+
+    def filter(self, queryset):
+        """Restrict `queryset` to projects this user may see."""
+        if self.sees_everything:
+            return queryset
+        creator_ids = self.creator_ids
+        if len(creator_ids) > MAX_IN_IDS:
+            # Too many ids for one statement: let the database semi-join users
+            visible_teams = teams.TeamDirectory.visible_teams(self.user)
+            creator_ids = User.objects.filter(team__in=visible_teams).values('id')
+        return queryset.filter(created_by_id__in=creator_ids)
+
+    def counter_scopes(self):
+        """The ProjectCounter (scope, scope_key) pairs whose totals match `filter()`."""
+        if self.sees_everything:
+            return [('all', '')]
+        scopes = [('team', team) for team in teams.TeamDirectory.visible_teams(self.user)]
+        if not self.user.team:
+            scopes.append(('user', str(self.user.id)))
+        return scopes
+
+    def can_view(self, project):
+        """Authorise an already-loaded project by its creator id (no join needed)."""
+        return self.sees_everything or project.created_by_id in self.creator_ids
+
+    def get_visible(self, pk, queryset=None):
+        """
+        Primary-key seek followed by an in-Python access check.
+        Raises Http404 for missing rows and rows outside the scope alike.
+        """
+        if queryset is None:
+            queryset = Project.objects.all()
+        try:
+            project = queryset.select_related('created_by').get(pk=pk)
+        except Project.DoesNotExist:
+            raise Http404
+        if not self.can_view(project):
+            raise Http404
+        return project
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+from django.db.models.functions import Left
 from django.utils import timezone
-import pytz
-from .models import Project, LookupData
+from .models import Project, ArchivedProject, LookupData
 from accounts.serializers import UserSerializer
+from .timezones import mst_zone, ist_zone
+from .row_cache import CachedRowListSerializer
 
 
 class ProjectSerializer(serializers.ModelSerializer):
@@ -32,7 +34,7 @@ class ProjectSerializer(serializers.ModelSerializer):
         data = super().to_representation(instance)
         
         # Convert datetime fields to MST
-        mst_tz = pytz.timezone('America/Phoenix')
+        mst_tz = mst_zone()
         
         # created_at and updated_at are stored in UTC (Django default with USE_TZ=True)
         # Direct conversion from model instance fields (already timezone-aware)
@@ -52,6 +54,69 @@ class ProjectSerializer(serializers.ModelSerializer):
         return data
 
 
+class ArchivedProjectSerializer(ProjectSerializer):
+    """Read-only serializer for archived projects (same MST display rules)."""
+    
+    class Meta(ProjectSerializer.Meta):
+        model = ArchivedProject
+        fields = ProjectSerializer.Meta.fields + ['deleted_at', 'archived_at']
+        read_only_fields = fields
+
+
+# Long text columns left out of list rows, and the preview length sent instead
+LIST_TEXT_FIELDS = ('comments', 'content')
+PREVIEW_CHARS = 200
+
+
+def with_text_previews(queryset):
+    """
+    Defer comments/content and select only their first characters, so list
+    queries don't read or transfer the NVARCHAR(MAX) values.
+    """
+    return queryset.defer(*LIST_TEXT_FIELDS).annotate(**{
+        f'{field}_preview': Left(field, PREVIEW_CHARS + 1) for field in LIST_TEXT_FIELDS
+    })
+
+
+class ProjectListSerializer(ProjectSerializer):
+    """
+    List rows: comments/content are replaced by truncated previews
+    (querysets must come from with_text_previews). Full text is on detail.
+    Serialized rows are cached (see projects.row_cache).
+    """
+    
+    comments_preview = serializers.SerializerMethodField()
+    content_preview = serializers.SerializerMethodField()
+    
+    class Meta(ProjectSerializer.Meta):
+        fields = [
+            field for field in ProjectSerializer.Meta.fields if field not in LIST_TEXT_FIELDS
+        ] + ['comments_preview', 'content_preview']
+        # Rows are reused until the project or its creator changes
+        list_serializer_class = CachedRowListSerializer
+    
+    @staticmethod
+    def _truncate(value):
+        if value and len(value) > PREVIEW_CHARS:
+            return value[:PREVIEW_CHARS].rstrip() + '…'
+        return value
+    
+    def get_comments_preview(self, obj):
+        return self._truncate(obj.comments_preview)
+    
+    def get_content_preview(self, obj):
+        return self._truncate(obj.content_preview)
+
+
+class ArchivedProjectListSerializer(ProjectListSerializer):
+    """List rows for archived projects."""
+    
+    class Meta(ProjectListSerializer.Meta):
+        model = ArchivedProject
+        fields = ProjectListSerializer.Meta.fields + ['deleted_at', 'archived_at']
+        read_only_fields = fields
+
+
 class ProjectCreateUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating/updating projects.
@@ -104,8 +169,8 @@ class ProjectCreateUpdateSerializer(serializers.ModelSerializer):
         internal_data = super().to_internal_value(data)
         
         # Convert datetime fields from MST to IST
-        mst_tz = pytz.timezone('America/Phoenix')
-        ist_tz = pytz.timezone('Asia/Kolkata')
+        mst_tz = mst_zone()
+        ist_tz = ist_zone()
         
         for field in ['start_time', 'end_time']:
             if internal_data.get(field):
@@ -139,3 +204,33 @@ class BulkDeleteSerializer(serializers.Serializer):
         allow_empty=False,
         help_text='List of project IDs to delete'
     )
+
+
+class BatchDetailSerializer(serializers.Serializer):
+    """Serializer for batch project detail requests."""
+    
+    MAX_IDS = 100
+    
+    project_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=MAX_IDS,
+        help_text='Project IDs to fetch (at most 100)'
+    )
+
+
+class LookupReplaceSerializer(serializers.Serializer):
+    """Serializer for replacing the values of one lookup type."""
+    
+    # Keeps the value IN (...) lists under SQL Server's parameter limit
+    MAX_VALUES = 1000
+    
+    values = serializers.ListField(
+        child=serializers.CharField(max_length=255, allow_blank=True),
+        max_length=MAX_VALUES,
+        help_text='The complete list of active values for this lookup type'
+    )
+    deactivate_missing = serializers.BooleanField(
+        default=True,
+        help_text='Deactivate active values not in the list (false = add only)'
+    )
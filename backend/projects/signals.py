@@ -0,0 +1,44 @@
+"""
+Signal handlers for the projects app.
+"""
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+
+from .models import LookupData
+from . import lookups
+
+
+@receiver(post_save, sender=LookupData)
+@receiver(post_delete, sender=LookupData)
+def bump_lookup_version(sender, **kwargs):
+    """Dropdown data changed outside replace_lookup_values (admin, shell)."""
+    lookups.bump_version()
+
+
+@receiver(post_save, sender=LookupData)
+def link_projects_to_new_value(sender, instance, created, **kwargs):
+    """Give existing projects with this text a key to the new row."""
+    if created and instance.lookup_type in lookups.REF_FIELDS:
+        lookups.backfill_refs(instance.lookup_type, [instance.value])
+
+
+@receiver(pre_save, sender=LookupData)
+def remember_previous_value(sender, instance, **kwargs):
+    """Note the stored value so post_save can tell a rename."""
+    instance._previous_value = None
+    if instance.pk is not None:
+        instance._previous_value = (
+            LookupData.objects.filter(pk=instance.pk).values_list('lookup_type', 'value').first()
+        )
+
+
+@receiver(post_save, sender=LookupData)
+def rename_project_values(sender, instance, created, **kwargs):
+    """Carry a renamed value over to the projects keyed to it."""
+    previous = getattr(instance, '_previous_value', None)
+    if (
+        not created and previous is not None
+        and instance.lookup_type in lookups.REF_FIELDS
+        and previous != (instance.lookup_type, instance.value)
+    ):
+        lookups.rename_refs(instance.lookup_type, instance.pk, instance.value)
@@ -0,0 +1,257 @@
+"""
+Local analytical snapshot for reporting.
+
+`manage.py sync_reporting_snapshot` copies projects, users and lookup data
+into a SQLite file (REPORTING_SNAPSHOT_PATH). Each run is incremental:
+rows whose updated_at is at or after the table's watermark (less
+REPORTING_SNAPSHOT_OVERLAP_SECONDS, for transactions that committed late)
+are upserted, and ids that no longer exist at the source (archived or
+hard-deleted rows) are dropped. Each table is replaced in one transaction
+and the file is in WAL mode, so readers never see a half-synced table.
+
+The reporting API (/api/reports/projects/) reads only this file, so its group-bys
+never reach SQL Server. Large text columns (comments, content) are not
+copied.
+"""
+import datetime
+import decimal
+import sqlite3
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+
+from accounts.models import User
+
+from .buckets import parse_mst_day
+from .models import LookupData, Project
+
+# Snapshot table -> (model, copied fields)
+SNAPSHOT_TABLES = {
+    'projects': (Project, [
+        'id', 'application_number', 'application_number_normalized', 'account_name',
+        'project_court', 'reviewed_by', 'project_status', 'stage', 'completed_date',
+        'start_time', 'end_time', 'total_time', 'partner_installer_account',
+        'third_party_salesforce', 'is_new_learning', 'is_redline', 'created_by_id',
+        'created_at', 'updated_at', 'is_deleted', 'deleted_at',
+        'created_day', 'created_week', 'created_month', 'start_day',
+    ]),
+    'users': (User, ['id', 'username', 'role', 'team', 'is_active', 'created_at', 'updated_at']),
+    'lookup_data': (LookupData, ['id', 'lookup_type', 'value', 'is_active', 'created_at', 'updated_at']),
+}
+
+SNAPSHOT_INDEXES = {
+    'projects': [
+        'created_by_id', 'project_status', 'stage', 'completed_date',
+        'created_day', 'created_week', 'created_month', 'start_day',
+    ],
+    'lookup_data': ['lookup_type'],
+}
+
+SYNC_CHUNK_SIZE = 2000
+
+# Report dimensions: request name -> snapshot column
+DIMENSIONS = {
+    'status': 'p.project_status',
+    'stage': 'p.stage',
+    'court': 'p.project_court',
+    'reviewer': 'p.reviewed_by',
+    'salesforce': 'p.third_party_salesforce',
+    'new_learning': 'p.is_new_learning',
+    'redline': 'p.is_redline',
+    'creator': 'u.username',
+    'team': 'u.team',
+    'created_day': 'p.created_day',
+    'created_week': 'p.created_week',
+    'created_month': 'p.created_month',
+    'completed_date': 'p.completed_date',
+    'start_day': 'p.start_day',
+}
+BOOLEAN_DIMENSIONS = {'new_learning', 'redline'}
+MAX_DIMENSIONS = 3
+
+# Date range filters: request name -> (column, comparison)
+DATE_FILTERS = {
+    'created_from': ('p.created_day', '>='),
+    'created_to': ('p.created_day', '<='),
+    'completed_from': ('p.completed_date', '>='),
+    'completed_to': ('p.completed_date', '<='),
+    'started_from': ('p.start_day', '>='),
+    'started_to': ('p.start_day', '<='),
+}
+
+
+class SnapshotMissing(Exception):
+    """The snapshot file has not been built yet."""
+
+
+def snapshot_path():
+    return Path(settings.REPORTING_SNAPSHOT_PATH)
+
+
+def connect(readonly=True):
+    """Open the snapshot; read-only connections fail if it doesn't exist."""
+    path = snapshot_path()
+    if readonly:
+        if not path.is_file():
+            raise SnapshotMissing(str(path))
+        return sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    return conn
+
+
+def _column(model, name):
+    field = model._meta.get_field(name[:-3] if name.endswith('_id') and name != 'id' else name)
+    internal = field.get_internal_type()
+    if internal in ('AutoField', 'BigAutoField', 'IntegerField', 'BigIntegerField', 'ForeignKey', 'BooleanField'):
+        return f'{name} INTEGER'
+    if internal in ('DecimalField', 'FloatField'):
+        return f'{name} REAL'
+    return f'{name} TEXT'
+
+
+def _value(value):
+    if isinstance(value, datetime.datetime):
+        return value.astimezone(datetime.timezone.utc).isoformat(' ') if timezone.is_aware(value) else value.isoformat(' ')
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def _ensure_schema(conn):
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS sync_state ('
+        'name TEXT PRIMARY KEY, watermark TEXT, synced_at TEXT, row_count INTEGER)'
+    )
+    for name, (model, fields) in SNAPSHOT_TABLES.items():
+        existing = [row[1] for row in conn.execute(f'PRAGMA table_info({name})')]
+        if existing and existing != fields:
+            # The copied columns changed: rebuild the table from scratch
+            conn.execute(f'DROP TABLE {name}')
+            conn.execute('DELETE FROM sync_state WHERE name = ?', (name,))
+        columns = ', '.join(_column(model, field) for field in fields[1:])
+        conn.execute(f'CREATE TABLE IF NOT EXISTS {name} (id INTEGER PRIMARY KEY, {columns})')
+        for column in SNAPSHOT_INDEXES.get(name, []):
+            conn.execute(f'CREATE INDEX IF NOT EXISTS {name}_{column} ON {name} ({column})')
+    conn.commit()
+
+
+def _watermark(conn, name):
+    row = conn.execute('SELECT watermark FROM sync_state WHERE name = ?', (name,)).fetchone()
+    return datetime.datetime.fromisoformat(row[0]) if row and row[0] else None
+
+
+def _sync_table(conn, name, full, chunk_size):
+    model, fields = SNAPSHOT_TABLES[name]
+    # _base_manager: the snapshot holds every row, whatever the default manager hides
+    source = model._base_manager.order_by()
+    watermark = None if full else _watermark(conn, name)
+    changed = source
+    if watermark is not None:
+        overlap = datetime.timedelta(seconds=settings.REPORTING_SNAPSHOT_OVERLAP_SECONDS)
+        changed = source.filter(updated_at__gte=watermark - overlap)
+
+    insert = 'INSERT OR REPLACE INTO {} ({}) VALUES ({})'.format(name, ', '.join(fields), ', '.join('?' * len(fields)))
+    updated_at = fields.index('updated_at')
+    newest = watermark
+    upserted = deleted = 0
+    with conn:
+        if watermark is None:
+            conn.execute(f'DELETE FROM {name}')
+        batch = []
+        for row in changed.values_list(*fields).iterator(chunk_size=chunk_size):
+            if row[updated_at] is not None and (newest is None or row[updated_at] > newest):
+                newest = row[updated_at]
+            batch.append([_value(value) for value in row])
+            if len(batch) >= chunk_size:
+                conn.executemany(insert, batch)
+                upserted += len(batch)
+                batch = []
+        conn.executemany(insert, batch)
+        upserted += len(batch)
+
+        if watermark is not None:
+            # Rows archived or deleted at the source since the last sync
+            conn.execute('CREATE TEMP TABLE IF NOT EXISTS live_ids (id INTEGER PRIMARY KEY)')
+            conn.execute('DELETE FROM live_ids')
+            ids = source.values_list('id').iterator(chunk_size=chunk_size * 5)
+            conn.executemany('INSERT INTO live_ids (id) VALUES (?)', ids)
+            deleted = conn.execute(f'DELETE FROM {name} WHERE id NOT IN (SELECT id FROM live_ids)').rowcount
+
+        row_count = conn.execute(f'SELECT COUNT(*) FROM {name}').fetchone()[0]
+        conn.execute(
+            'INSERT OR REPLACE INTO sync_state (name, watermark, synced_at, row_count) VALUES (?, ?, ?, ?)',
+            (name, newest.isoformat() if newest else None, timezone.now().isoformat(), row_count),
+        )
+    return {'upserted': upserted, 'deleted': deleted, 'rows': row_count}
+
+
+def sync(full=False, chunk_size=SYNC_CHUNK_SIZE):
+    """Bring the snapshot up to date; returns {table: counts}."""
+    conn = connect(readonly=False)
+    try:
+        _ensure_schema(conn)
+        return {name: _sync_table(conn, name, full, chunk_size) for name in SNAPSHOT_TABLES}
+    finally:
+        conn.close()
+
+
+def sync_state(conn):
+    """Watermark, sync time and row count per table."""
+    return {
+        name: {'watermark': watermark, 'synced_at': synced_at, 'rows': row_count}
+        for name, watermark, synced_at, row_count in conn.execute(
+            'SELECT name, watermark, synced_at, row_count FROM sync_state ORDER BY name'
+        )
+    }
+
+
+def project_report(conn, group_by, params):
+    """
+    Project count, total time and completed count grouped by the
+    `group_by` dimensions, filtered by dimension values (`status=Approve`,
+    `team=A`), DATE_FILTERS ranges and `include_deleted`. Raises
+    ValueError for unknown dimensions or bad dates.
+    """
+    unknown = [name for name in group_by if name not in DIMENSIONS]
+    if unknown:
+        raise ValueError(f"Unknown group_by: {', '.join(unknown)}. Choose from: {', '.join(DIMENSIONS)}.")
+    if len(group_by) > MAX_DIMENSIONS:
+        raise ValueError(f'group_by takes at most {MAX_DIMENSIONS} dimensions.')
+
+    where, args = [], []
+    if str(params.get('include_deleted', '')).lower() not in ('1', 'true'):
+        where.append('p.is_deleted = 0')
+    for name, column in DIMENSIONS.items():
+        if name in params:
+            value = params[name]
+            if name in BOOLEAN_DIMENSIONS:
+                value = int(str(value).lower() in ('1', 'true'))
+            where.append(f'{column} = ?')
+            args.append(value)
+    for name, (column, operator) in DATE_FILTERS.items():
+        day = parse_mst_day(params.get(name))
+        if day is not None:
+            where.append(f'{column} {operator} ?')
+            args.append(day.isoformat())
+
+    columns = [DIMENSIONS[name] for name in group_by]
+    select = columns + ['COUNT(*)', 'COALESCE(SUM(p.total_time), 0)', "SUM(p.stage = 'Completed')"]
+    sql = f"SELECT {', '.join(select)} FROM projects p LEFT JOIN users u ON u.id = p.created_by_id"
+    if where:
+        sql += ' WHERE ' + ' AND '.join(where)
+    if columns:
+        sql += ' GROUP BY {0} ORDER BY {0}'.format(', '.join(columns))
+
+    rows = []
+    for row in conn.execute(sql, args):
+        values = dict(zip(group_by, row))
+        values.update(projects=row[-3], total_time=round(row[-2], 2), completed=row[-1] or 0)
+        rows.append(values)
+    return rows
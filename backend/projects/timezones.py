@@ -0,0 +1,21 @@
+"""
+Timezone helpers: times are stored in IST and displayed in MST (Phoenix).
+Zone objects are built once per process.
+"""
+from functools import lru_cache
+
+from django.conf import settings
+
+
+@lru_cache(maxsize=None)
+def mst_zone():
+    """Display timezone (America/Phoenix)."""
+    import pytz
+    return pytz.timezone(settings.MST_TIMEZONE)
+
+
+@lru_cache(maxsize=None)
+def ist_zone():
+    """Storage timezone (Asia/Kolkata)."""
+    import pytz
+    return pytz.timezone(settings.TIME_ZONE)
@@ -2,18 +2,26 @@ from django.urls import path
 from .views import (
     MyProjectsListView,
     TeamProjectsListView,
+    ArchivedProjectsListView,
     ProjectDetailView,
+    batch_detail_view,
     ProjectCreateView,
     ProjectUpdateView,
     ProjectDeleteView,
     save_draft_view,
     submit_project_view,
     bulk_delete_view,
+    dashboard_summary_view,
+    row_cache_stats_view,
+    application_lookup_view,
     lookup_data_view,
+    lookup_replace_view,
     filter_options_view,
     team_filter_options_view,
     export_excel_view,
     export_csv_view,
+    export_columnar_view,
+    project_report_view,
 )
 
 urlpatterns = [
@@ -22,6 +30,11 @@ urlpatterns = [
     path('get-team-projects/', TeamProjectsListView.as_view(), name='team-projects'),
     path('get-log/<int:pk>/', ProjectDetailView.as_view(), name='project-detail'),
     path('get-team-project-detail/<int:pk>/', ProjectDetailView.as_view(), name='team-project-detail'),
+    path('dashboard-summary/', dashboard_summary_view, name='dashboard-summary'),
+    path('row-cache-stats/', row_cache_stats_view, name='row-cache-stats'),
+    path('get-logs-batch/', batch_detail_view, name='project-batch-detail'),
+    path('application-lookup/', application_lookup_view, name='application-lookup'),
+    path('get-archived-logs/', ArchivedProjectsListView.as_view(), name='archived-projects'),
     
     # Project CRUD
     path('submit-log/', submit_project_view, name='submit-project'),
@@ -32,10 +45,15 @@ urlpatterns = [
     
     # Lookup & Filter Data
     path('lookup-data/', lookup_data_view, name='lookup-data'),
+    path('lookup-data/<str:lookup_type>/', lookup_replace_view, name='lookup-replace'),
     path('filter-options/', filter_options_view, name='filter-options'),
     path('team-filter-options/', team_filter_options_view, name='team-filter-options'),
     
     # Export
     path('export-excel/', export_excel_view, name='export-excel'),
     path('export-csv/', export_csv_view, name='export-csv'),
+    path('export-parquet/', export_columnar_view, name='export-parquet'),
+    
+    # Reporting (snapshot)
+    path('reports/projects/', project_report_view, name='project-report'),
 ]
@@ -5,34 +5,49 @@ Implements all business logic from Flask app with role-based access control.
 from rest_framework import status, generics, filters
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
-import csv
 from datetime import datetime
-from io import StringIO
-from django.http import HttpResponse
-import openpyxl
-from openpyxl.utils import get_column_letter
+from django.http import HttpResponse, FileResponse
+import tempfile
 
-from .models import Project, LookupData
+from .models import Project, ArchivedProject, LookupData
 from .serializers import (
     ProjectSerializer, 
+    ProjectListSerializer,
+    ArchivedProjectListSerializer,
+    with_text_previews,
     ProjectCreateUpdateSerializer,
     LookupDataSerializer,
-    BulkDeleteSerializer
+    BulkDeleteSerializer,
+    BatchDetailSerializer,
+    LookupReplaceSerializer
 )
+from config import metrics
+from config.db_router import use_replica
+from accounts.models import User
 from accounts.permissions import IsAdmin, IsOwnerOrAdmin
-from .filters import ProjectFilter
+from accounts.serializers import UserCompactSerializer
+from .filters import ProjectFilter, ArchivedProjectFilter
+from .archive import archive_querysets
+from .arrow_export import write_export
+from .timezones import mst_zone
+from .buckets import parse_mst_day
+from .scopes import ProjectScope
+from .applications import find_matches, duplicates_of
+from .lookups import current_version, replace_lookup_values, facet_values
+from . import counters, parallel_export, row_cache, snapshot
 
 
 class MyProjectsListView(generics.ListAPIView):
     """
     Get user's own projects (My Projects tab).
     Excludes soft-deleted projects.
+    Rows carry comments/content previews; full text is on the detail endpoint.
     """
-    serializer_class = ProjectSerializer
+    serializer_class = ProjectListSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = ProjectFilter
@@ -42,20 +57,21 @@ class MyProjectsListView(generics.ListAPIView):
     
     def get_queryset(self):
         """Return only user's own non-deleted projects."""
-        return Project.objects.filter(
-            created_by=self.request.user,
-            is_deleted=False
-        ).select_related('created_by')
+        return with_text_previews(Project.objects.filter(
+            created_by=self.request.user
+        ).select_related('created_by'))
 
 
 class TeamProjectsListView(generics.ListAPIView):
     """
     Get all team projects (Team Projects tab).
     Admin: all projects
+    Team lead: projects from their own and managed teams
     User: team projects only
     Excludes soft-deleted projects.
+    Rows carry comments/content previews; full text is on the detail endpoint.
     """
-    serializer_class = ProjectSerializer
+    serializer_class = ProjectListSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = ProjectFilter
@@ -64,20 +80,30 @@ class TeamProjectsListView(generics.ListAPIView):
     ordering = ['-created_at']
     
     def get_queryset(self):
-        """Return team projects based on user role."""
-        user = self.request.user
-        queryset = Project.objects.filter(is_deleted=False).select_related('created_by')
-        
-        if user.role == 'admin':
-            # Admin sees all projects
-            return queryset
-        else:
-            # Regular user sees projects from their team
-            if user.team:
-                return queryset.filter(created_by__team=user.team)
-            else:
-                # If user has no team, show only their own projects
-                return queryset.filter(created_by=user)
+        """Return team projects based on user role (see ProjectScope)."""
+        queryset = Project.objects.select_related('created_by')
+        return with_text_previews(ProjectScope(self.request.user).filter(queryset))
+
+
+class ArchivedProjectsListView(generics.ListAPIView):
+    """
+    Search archived projects (admin only).
+    Reads from the archive table so hot-table queries stay small.
+    """
+    serializer_class = ArchivedProjectListSerializer
+    permission_classes = [IsAuthenticated, IsAdmin]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filterset_class = ArchivedProjectFilter
+    search_fields = ['application_number', 'account_name', 'project_court', 'reviewed_by']
+    ordering_fields = ['created_at', 'completed_date', 'application_number', 'archived_at']
+    ordering = ['-created_at']
+    
+    def get_queryset(self):
+        """Return archived projects that were live when archived."""
+        queryset = ArchivedProject.objects.select_related('created_by')
+        if self.request.query_params.get('include_deleted') not in ('true', '1'):
+            queryset = queryset.filter(is_deleted=False)
+        return with_text_previews(queryset)
 
 
 class ProjectDetailView(generics.RetrieveAPIView):
@@ -90,16 +116,52 @@ class ProjectDetailView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        """Filter based on user role and ownership."""
-        user = self.request.user
-        if user.is_admin:
-            return Project.objects.filter(is_deleted=False)
-        
-        # Users can view own projects or team projects
-        return Project.objects.filter(
-            Q(created_by=user) | Q(created_by__team=user.team),
-            is_deleted=False
+        return Project.objects.all()
+    
+    def get_object(self):
+        """Primary-key lookup, then a role check in Python (see ProjectScope)."""
+        project = ProjectScope(self.request.user).get_visible(
+            self.kwargs['pk'], self.get_queryset()
         )
+        self.check_object_permissions(self.request, project)
+        return project
+
+
+@use_replica
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def batch_detail_view(request):
+    """
+    Get details for several projects at once (multi-select, export, bulk delete).
+    Fetches all requested rows and their creators in one query, then checks
+    access per row: own projects, team projects, or everything for admins.
+    Returns results keyed by ID; missing/deleted IDs are marked 'not_found'
+    and IDs outside the user's scope 'forbidden'.
+    """
+    serializer = BatchDetailSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    scope = ProjectScope(request.user)
+    project_ids = serializer.validated_data['project_ids']
+    projects = {
+        project.id: project
+        for project in Project.objects.filter(
+            id__in=project_ids
+        ).select_related('created_by')
+    }
+    
+    results = {}
+    for project_id in project_ids:
+        project = projects.get(project_id)
+        if project is None:
+            results[project_id] = {'error': 'not_found'}
+        elif not scope.can_view(project):
+            results[project_id] = {'error': 'forbidden'}
+        else:
+            results[project_id] = ProjectSerializer(project).data
+    
+    return Response({'results': results})
 
 
 class ProjectCreateView(generics.CreateAPIView):
@@ -128,13 +190,12 @@ class ProjectUpdateView(generics.UpdateAPIView):
         """Filter based on user role and ownership."""
         user = self.request.user
         if user.is_admin:
-            return Project.objects.filter(is_deleted=False)
+            return Project.objects.all()
         
         # Users can only update their own drafts
         return Project.objects.filter(
             created_by=user,
-            stage='Started',
-            is_deleted=False
+            stage='Started'
         )
 
 
@@ -150,10 +211,10 @@ class ProjectDeleteView(generics.DestroyAPIView):
         """Filter based on user role and ownership."""
         user = self.request.user
         if user.is_admin:
-            return Project.objects.filter(is_deleted=False)
+            return Project.objects.all()
         
         # Users can only delete their own projects
-        return Project.objects.filter(created_by=user, is_deleted=False)
+        return Project.objects.filter(created_by=user)
     
     def perform_destroy(self, instance):
         """Soft delete instead of hard delete."""
@@ -167,6 +228,8 @@ def save_draft_view(request):
     Save project as draft (stage='Started' for new, preserve for existing).
     Minimal validation - only required fields.
     Admin can edit any project, users can only edit their own.
+    The response lists visible projects with the same application number
+    under 'duplicates'.
     """
     data = request.data.copy()
     
@@ -179,9 +242,9 @@ def save_draft_view(request):
         try:
             # Admin can edit any project, users can only edit their own
             if request.user.is_admin:
-                project = Project.objects.get(id=project_id, is_deleted=False)
+                project = Project.objects.get(id=project_id)
             else:
-                project = Project.objects.get(id=project_id, created_by=request.user, is_deleted=False)
+                project = Project.objects.get(id=project_id, created_by=request.user)
             
             # Preserve the existing stage if not provided in data
             if 'stage' not in data or not data['stage']:
@@ -205,10 +268,15 @@ def save_draft_view(request):
         else:
             serializer.save(created_by=request.user)
         
-        # Return full project data
+        # Return full project data, plus other projects logged with the same
+        # application number that this user can see (one indexed probe)
         project = Project.objects.get(id=serializer.instance.id)
+        data = ProjectSerializer(project).data
+        data['duplicates'] = duplicates_of(
+            project, ProjectScope(request.user).filter(Project.objects.all())
+        )
         return Response(
-            ProjectSerializer(project).data,
+            data,
             status=status.HTTP_200_OK if project_id else status.HTTP_201_CREATED
         )
     
@@ -223,15 +291,11 @@ def submit_project_view(request):
     Full validation - all required fields must be present.
     Auto-sets: completed_date (today), end_time (now in MST/IST).
     """
-    from django.utils import timezone as tz
-    import pytz
-    
     data = request.data.copy()
     data['stage'] = 'Completed'
     
     # Auto-set completed_date to today (in MST)
-    mst_tz = pytz.timezone('America/Phoenix')
-    now_mst = tz.now().astimezone(mst_tz)
+    now_mst = timezone.now().astimezone(mst_zone())
     data['completed_date'] = now_mst.date().isoformat()
     
     # Auto-set end_time to current time (will be converted to IST by serializer)
@@ -286,14 +350,12 @@ def bulk_delete_view(request):
     if serializer.is_valid():
         project_ids = serializer.validated_data['project_ids']
         
-        # Get projects to delete
-        projects = Project.objects.filter(id__in=project_ids, is_deleted=False)
-        
-        # Soft delete all
-        deleted_count = 0
-        for project in projects:
-            project.soft_delete(request.user)
-            deleted_count += 1
+        # Soft delete all in one UPDATE (dashboard counters adjusted alongside)
+        now = timezone.now()
+        deleted_count = counters.bulk_update(
+            Project.objects.filter(id__in=project_ids),
+            is_deleted=True, deleted_at=now, deleted_by=request.user, updated_at=now
+        )
         
         return Response({
             'message': f'Successfully deleted {deleted_count} project(s).',
@@ -303,22 +365,111 @@ def bulk_delete_view(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def dashboard_summary_view(request):
+    """
+    Get per-stage and per-status totals for My Projects and Team Projects.
+    Reads precomputed counter rows instead of counting the projects table.
+    Admin: team totals cover all projects
+    Team lead: team totals cover their own and managed teams
+    User: team totals cover their team (own projects if no team)
+    """
+    my_scope = ('user', str(request.user.id))
+    team_scopes = ProjectScope(request.user).counter_scopes()
+    
+    rows = counters.counter_rows([my_scope, *team_scopes])
+    
+    my_rows = []
+    team_rows = []
+    for scope, scope_key, stage, project_status, count in rows:
+        if (scope, scope_key) == my_scope:
+            my_rows.append((stage, project_status, count))
+        if (scope, scope_key) in team_scopes:
+            team_rows.append((stage, project_status, count))
+    
+    return Response({
+        'my_projects': counters.summarize(my_rows),
+        'team_projects': counters.summarize(team_rows),
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def row_cache_stats_view(request):
+    """
+    Serialized-row cache hit rates for the worker that answers (admin only).
+    """
+    return Response(row_cache.stats())
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def application_lookup_view(request):
+    """
+    Find projects by application number (?number=..., &prefix=true for a
+    prefix match). Matches ignore case and spaces and are limited to the
+    user's scope and to live projects.
+    """
+    number = request.query_params.get('number', '')
+    if not number.strip():
+        return Response({'error': 'number is required'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    queryset = ProjectScope(request.user).filter(Project.objects.all())
+    matches = find_matches(
+        queryset, number, prefix=request.query_params.get('prefix') in ('true', '1')
+    )
+    return Response({'results': matches})
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def lookup_data_view(request):
     """
     Get lookup data for dropdowns (courts, reviewers, etc.).
-    Returns all active lookup data.
+    Returns all active lookup data and the lookup version, also sent as
+    the ETag: a request with a matching If-None-Match gets 304 after a
+    single-row version lookup.
     """
+    version = current_version()
+    etag = f'"lookup-{version}"'
+    not_modified = request.headers.get('If-None-Match') == etag
+    metrics.count_cache('lookup_etag', not_modified)
+    if not_modified:
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    
     courts = LookupData.objects.filter(lookup_type='court', is_active=True).values_list('value', flat=True)
     reviewers = LookupData.objects.filter(lookup_type='reviewer', is_active=True).values_list('value', flat=True)
     
     return Response({
+        'version': version,
         'courts': list(courts),
         'reviewers': list(reviewers),
         'statuses': [choice[0] for choice in Project.STATUS_CHOICES],
         'third_party_options': [choice[0] for choice in Project.THIRD_PARTY_CHOICES],
-    })
+    }, headers={'ETag': etag})
+
+
+@api_view(['PUT'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def lookup_replace_view(request, lookup_type):
+    """
+    Replace the active values of one lookup type (admin only).
+    Body: {"values": [...], "deactivate_missing": true}
+    Runs in one transaction and bumps the lookup version if anything changed.
+    """
+    if lookup_type not in dict(LookupData.LOOKUP_TYPES):
+        return Response({'error': f'Unknown lookup type: {lookup_type}'}, status=status.HTTP_404_NOT_FOUND)
+    
+    serializer = LookupReplaceSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    
+    result = replace_lookup_values(
+        lookup_type,
+        serializer.validated_data['values'],
+        deactivate_missing=serializer.validated_data['deactivate_missing'],
+    )
+    return Response(result)
 
 
 @api_view(['GET'])
@@ -328,11 +479,11 @@ def filter_options_view(request):
     Get filter options for My Projects.
     Returns unique values for dropdowns based on user's projects.
     """
-    user_projects = Project.objects.filter(created_by=request.user, is_deleted=False)
+    user_projects = Project.objects.filter(created_by=request.user)
     
     return Response({
-        'courts': list(user_projects.values_list('project_court', flat=True).distinct().order_by('project_court')),
-        'reviewers': list(user_projects.values_list('reviewed_by', flat=True).distinct().order_by('reviewed_by')),
+        'courts': facet_values(user_projects, 'court'),
+        'reviewers': facet_values(user_projects, 'reviewer'),
         'statuses': list(user_projects.values_list('project_status', flat=True).distinct().order_by('project_status')),
         'stages': list(user_projects.values_list('stage', flat=True).distinct().order_by('stage')),
     })
@@ -344,47 +495,161 @@ def team_filter_options_view(request):
     """
     Get filter options for Team Projects.
     Admin: all projects
-    User: team projects
+    User: team projects (own projects if no team)
     """
-    user = request.user
-    if user.is_admin:
-        team_projects = Project.objects.filter(is_deleted=False)
-    else:
-        team_projects = Project.objects.filter(created_by__team=user.team, is_deleted=False)
+    team_projects = ProjectScope(request.user).filter(Project.objects.all())
     
-    # Get unique created_by users
-    creators = team_projects.values('created_by__id', 'created_by__username').distinct()
+    # Distinct creator ids come from the project index alone; names are then
+    # read for just those users
+    creator_ids = team_projects.values('created_by_id').distinct().order_by()
+    creators = User.objects.filter(id__in=creator_ids).values('id', 'username').order_by('username')
     
     return Response({
-        'courts': list(team_projects.values_list('project_court', flat=True).distinct().order_by('project_court')),
-        'reviewers': list(team_projects.values_list('reviewed_by', flat=True).distinct().order_by('reviewed_by')),
+        'courts': facet_values(team_projects, 'court'),
+        'reviewers': facet_values(team_projects, 'reviewer'),
         'statuses': list(team_projects.values_list('project_status', flat=True).distinct().order_by('project_status')),
         'stages': list(team_projects.values_list('stage', flat=True).distinct().order_by('stage')),
-        'creators': [{'id': c['created_by__id'], 'username': c['created_by__username']} for c in creators],
+        'creators': UserCompactSerializer(creators, many=True).data,
     })
 
 
+EXPORT_HEADERS = [
+    'Application #', 'Account Name', 'Project Court', 'Reviewed By',
+    'Status', 'Stage', 'Completed Date', 'Start Time (MST)', 'End Time (MST)',
+    'Total Time (mins)', 'Partner Installer Account', 'Third Party Salesforce',
+    'Comments', 'Content', 'Is New Learning', 'Created By', 'Created At (MST)'
+]
+
+
+# `date_field` values accepted by the exports -> indexed MST date column
+EXPORT_DATE_FIELDS = {
+    'completed': 'completed_date',
+    'created': 'created_day',
+    'started': 'start_day',
+}
+
+
+def _filter_export_queryset(queryset, data):
+    """
+    Apply the export date range / id filters from the request body.
+    start_date / end_date are MST days (times are ignored) compared with
+    a date column, completed_date unless `date_field` picks another.
+    """
+    date_field = EXPORT_DATE_FIELDS.get(data.get('date_field') or 'completed')
+    if date_field is None:
+        raise ValidationError({'error': f"date_field must be one of: {', '.join(EXPORT_DATE_FIELDS)}."})
+    try:
+        start_date = parse_mst_day(data.get('start_date'))
+        end_date = parse_mst_day(data.get('end_date'))
+    except ValueError as exc:
+        raise ValidationError({'error': str(exc)})
+    project_ids = data.get('project_ids', [])
+    
+    if start_date:
+        queryset = queryset.filter(**{f'{date_field}__gte': start_date})
+    if end_date:
+        queryset = queryset.filter(**{f'{date_field}__lte': end_date})
+    if project_ids:
+        queryset = queryset.filter(id__in=project_ids)
+    return queryset
+
+
+def _get_export_querysets(request):
+    """
+    Return the querysets to export: live projects, followed by matching
+    archived projects when `include_archived` is set.
+    """
+    scope = ProjectScope(request.user)
+    querysets = [_filter_export_queryset(
+        scope.filter(Project.objects.select_related('created_by')),
+        request.data
+    )]
+    if request.data.get('include_archived'):
+        querysets.append(_filter_export_queryset(
+            scope.filter(ArchivedProject.objects.filter(is_deleted=False).select_related('created_by')),
+            request.data
+        ))
+    return querysets
+
+
+def _get_export_projects(querysets):
+    """Return an iterable of projects to export from _get_export_querysets()."""
+    if len(querysets) == 1:
+        return querysets[0]
+    return archive_querysets(*querysets)
+
+
+def _plan_parallel_export(request, querysets):
+    """
+    Shards for an export sent with `parallel: true`, or None to export
+    serially. A returned plan holds a parallel export slot; release it
+    with parallel_export.release_slot().
+    """
+    if str(request.data.get('parallel')).lower() not in ('true', '1'):
+        return None
+    shards = parallel_export.plan_shards(querysets)
+    if shards and parallel_export.acquire_slot():
+        return shards
+    return None
+
+
+def _export_filename(extension):
+    return f'ie_logs_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{extension}'
+
+
+def _export_row(project):
+    """Build one export row (times in MST, matching EXPORT_HEADERS)."""
+    serialized = ProjectSerializer(project).data
+    return [
+        project.application_number,
+        project.account_name,
+        project.project_court,
+        project.reviewed_by,
+        project.project_status,
+        project.stage,
+        project.completed_date.strftime('%Y-%m-%d') if project.completed_date else '',
+        serialized.get('start_time', ''),
+        serialized.get('end_time', ''),
+        float(project.total_time) if project.total_time else 0,
+        project.partner_installer_account or '',
+        project.third_party_salesforce or '',
+        project.comments or '',
+        project.content or '',
+        'Yes' if project.is_new_learning else 'No',
+        project.created_by.username,
+        serialized.get('created_at', ''),
+    ]
+
+
+@use_replica
 @api_view(['POST'])
 @permission_classes([IsAuthenticated, IsAdmin])
 def export_excel_view(request):
     """
     Export projects to Excel (admin only).
     Supports date range filtering and exports all columns in MST timezone.
+    Pass `include_archived: true` to also export archived projects, and
+    `parallel: true` to format large exports in a process pool, one
+    sheet per shard.
     """
-    # Get filter parameters
-    start_date = request.data.get('start_date')
-    end_date = request.data.get('end_date')
-    project_ids = request.data.get('project_ids', [])
-    
-    # Build queryset
-    queryset = Project.objects.filter(is_deleted=False).select_related('created_by')
+    querysets = _get_export_querysets(request)
+    shards = _plan_parallel_export(request, querysets)
+    if shards:
+        sink = tempfile.TemporaryFile()
+        try:
+            with metrics.track_export('xlsx') as job:
+                job.rows = parallel_export.write_xlsx(shards, sink, EXPORT_HEADERS, _export_row)
+        finally:
+            parallel_export.release_slot()
+        sink.seek(0)
+        return FileResponse(
+            sink, as_attachment=True, filename=_export_filename('xlsx'),
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
     
-    if start_date:
-        queryset = queryset.filter(completed_date__gte=start_date)
-    if end_date:
-        queryset = queryset.filter(completed_date__lte=end_date)
-    if project_ids:
-        queryset = queryset.filter(id__in=project_ids)
+    # Imported here so JSON-only workers never load openpyxl
+    import openpyxl
+    from openpyxl.utils import get_column_letter
     
     # Create Excel workbook
     wb = openpyxl.Workbook()
@@ -392,120 +657,137 @@ def export_excel_view(request):
     ws.title = 'Projects'
     
     # Headers
-    headers = [
-        'Application #', 'Account Name', 'Project Court', 'Reviewed By',
-        'Status', 'Stage', 'Completed Date', 'Start Time (MST)', 'End Time (MST)',
-        'Total Time (hrs)', 'Partner Installer Account', 'Third Party Salesforce',
-        'Comments', 'Content', 'Is New Learning', 'Created By', 'Created At (MST)'
-    ]
-    ws.append(headers)
+    ws.append(EXPORT_HEADERS)
     
-    # Data rows
-    for project in queryset:
-        serialized = ProjectSerializer(project).data
-        row = [
-            project.application_number,
-            project.account_name,
-            project.project_court,
-            project.reviewed_by,
-            project.project_status,
-            project.stage,
-            project.completed_date.strftime('%Y-%m-%d') if project.completed_date else '',
-            serialized.get('start_time', ''),
-            serialized.get('end_time', ''),
-            float(project.total_time) if project.total_time else 0,
-            project.partner_installer_account or '',
-            project.third_party_salesforce or '',
-            project.comments or '',
-            project.content or '',
-            'Yes' if project.is_new_learning else 'No',
-            project.created_by.username,
-            serialized.get('created_at', ''),
-        ]
-        ws.append(row)
-    
-    # Auto-size columns
-    for column in ws.columns:
-        max_length = 0
-        column_letter = get_column_letter(column[0].column)
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
-    
-    # Save to response
-    response = HttpResponse(
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    response['Content-Disposition'] = f'attachment; filename=ie_logs_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-    wb.save(response)
+    projects = _get_export_projects(querysets)
+    with metrics.track_export('xlsx') as job:
+        # Data rows
+        for project in projects:
+            ws.append(_export_row(project))
+            job.rows += 1
+        
+        # Auto-size columns
+        for column in ws.columns:
+            max_length = 0
+            column_letter = get_column_letter(column[0].column)
+            for cell in column:
+                try:
+                    if len(str(cell.value)) > max_length:
+                        max_length = len(cell.value)
+                except:
+                    pass
+            adjusted_width = min(max_length + 2, 50)
+            ws.column_dimensions[column_letter].width = adjusted_width
+        
+        # Save to response
+        response = HttpResponse(
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
+        response['Content-Disposition'] = f'attachment; filename={_export_filename("xlsx")}'
+        wb.save(response)
     
     return response
 
 
+@use_replica
 @api_view(['POST'])
 @permission_classes([IsAuthenticated, IsAdmin])
 def export_csv_view(request):
     """
     Export projects to CSV (admin only).
     Supports date range filtering and exports all columns in MST timezone.
+    Pass `include_archived: true` to also export archived projects, and
+    `parallel: true` to format large exports in a process pool.
     """
-    # Get filter parameters
-    start_date = request.data.get('start_date')
-    end_date = request.data.get('end_date')
-    project_ids = request.data.get('project_ids', [])
-    
-    # Build queryset
-    queryset = Project.objects.filter(is_deleted=False).select_related('created_by')
+    import csv
     
-    if start_date:
-        queryset = queryset.filter(completed_date__gte=start_date)
-    if end_date:
-        queryset = queryset.filter(completed_date__lte=end_date)
-    if project_ids:
-        queryset = queryset.filter(id__in=project_ids)
+    querysets = _get_export_querysets(request)
+    shards = _plan_parallel_export(request, querysets)
+    if shards:
+        sink = tempfile.TemporaryFile()
+        try:
+            with metrics.track_export('csv') as job:
+                job.rows = parallel_export.write_csv(shards, sink, EXPORT_HEADERS, _export_row)
+        finally:
+            parallel_export.release_slot()
+        sink.seek(0)
+        return FileResponse(sink, as_attachment=True, filename=_export_filename('csv'), content_type='text/csv')
     
     # Create CSV
     response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename=ie_logs_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    response['Content-Disposition'] = f'attachment; filename={_export_filename("csv")}'
     
     writer = csv.writer(response)
     
     # Headers
-    headers = [
-        'Application #', 'Account Name', 'Project Court', 'Reviewed By',
-        'Status', 'Stage', 'Completed Date', 'Start Time (MST)', 'End Time (MST)',
-        'Total Time (hrs)', 'Partner Installer Account', 'Third Party Salesforce',
-        'Comments', 'Content', 'Is New Learning', 'Created By', 'Created At (MST)'
-    ]
-    writer.writerow(headers)
+    writer.writerow(EXPORT_HEADERS)
     
     # Data rows
-    for project in queryset:
-        serialized = ProjectSerializer(project).data
-        row = [
-            project.application_number,
-            project.account_name,
-            project.project_court,
-            project.reviewed_by,
-            project.project_status,
-            project.stage,
-            project.completed_date.strftime('%Y-%m-%d') if project.completed_date else '',
-            serialized.get('start_time', ''),
-            serialized.get('end_time', ''),
-            float(project.total_time) if project.total_time else 0,
-            project.partner_installer_account or '',
-            project.third_party_salesforce or '',
-            project.comments or '',
-            project.content or '',
-            'Yes' if project.is_new_learning else 'No',
-            project.created_by.username,
-            serialized.get('created_at', ''),
-        ]
-        writer.writerow(row)
+    projects = _get_export_projects(querysets)
+    with metrics.track_export('csv') as job:
+        for project in projects:
+            writer.writerow(_export_row(project))
+            job.rows += 1
     
     return response
+
+
+@use_replica
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def export_columnar_view(request):
+    """
+    Export projects as typed, compressed columnar data (admin only).
+    `format`: 'parquet' (default) or 'arrow' (Arrow IPC file).
+    Same filters as the Excel/CSV exports; timestamps are native MST columns.
+    """
+    file_format = request.data.get('format', 'parquet')
+    if file_format not in ('parquet', 'arrow'):
+        return Response(
+            {'error': "format must be 'parquet' or 'arrow'."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    querysets = _get_export_querysets(request)
+    sink = tempfile.TemporaryFile()
+    with metrics.track_export(file_format) as job:
+        job.rows = write_export(querysets, sink, file_format)
+    sink.seek(0)
+    
+    extension = 'parquet' if file_format == 'parquet' else 'arrow'
+    content_type = (
+        'application/vnd.apache.parquet' if file_format == 'parquet'
+        else 'application/vnd.apache.arrow.file'
+    )
+    return FileResponse(
+        sink,
+        as_attachment=True,
+        filename=f'ie_logs_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{extension}',
+        content_type=content_type,
+    )
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def project_report_view(request):
+    """
+    Grouped project counts and total time from the reporting snapshot
+    (admin only); never queries the main database. `group_by` is a
+    comma-separated list of dimensions, other parameters filter.
+    """
+    group_by = [name.strip() for name in request.query_params.get('group_by', '').split(',') if name.strip()]
+    try:
+        conn = snapshot.connect()
+    except snapshot.SnapshotMissing:
+        return Response(
+            {'error': 'The reporting snapshot has not been built yet.'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+    try:
+        rows = snapshot.project_report(conn, group_by, request.query_params)
+        state = snapshot.sync_state(conn)
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    finally:
+        conn.close()
+    return Response({'group_by': group_by, 'results': rows, 'snapshot': state})
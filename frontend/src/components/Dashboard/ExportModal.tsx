@@ -2,6 +2,7 @@ import { useState } from 'react'
 import { Modal, Form, DatePicker, Button, message, Radio, Space } from 'antd'
 import { exportAPI } from '../../services/api'
 import dayjs, { Dayjs } from 'dayjs'
+import { ExportDateField } from '../../types'
 
 interface ExportModalProps {
   visible: boolean
@@ -12,6 +13,7 @@ const ExportModal = ({ visible, onClose }: ExportModalProps) => {
   const [form] = Form.useForm()
   const [loading, setLoading] = useState(false)
   const [exportFormat, setExportFormat] = useState<'excel' | 'csv'>('excel')
+  const [dateField, setDateField] = useState<ExportDateField>('completed')
 
   const setDateRange = (startDate: Dayjs, endDate: Dayjs) => {
     form.setFieldsValue({
@@ -25,8 +27,9 @@ const ExportModal = ({ visible, onClose }: ExportModalProps) => {
     try {
       const values = await form.validateFields()
       const params = {
-        start_date: values.start_date?.format('YYYY-MM-DD HH:mm:ss'),
-        end_date: values.end_date?.format('YYYY-MM-DD HH:mm:ss'),
+        start_date: values.start_date?.format('YYYY-MM-DD'),
+        end_date: values.end_date?.format('YYYY-MM-DD'),
+        date_field: dateField,
       }
 
       const blob = exportFormat === 'excel' 
@@ -79,6 +82,17 @@ const ExportModal = ({ visible, onClose }: ExportModalProps) => {
           </Radio.Group>
         </Form.Item>
 
+        <Form.Item label="Date Range Applies To">
+          <Radio.Group
+            value={dateField}
+            onChange={(e) => setDateField(e.target.value)}
+          >
+            <Radio value="completed">Completed date</Radio>
+            <Radio value="created">Created date</Radio>
+            <Radio value="started">Start date</Radio>
+          </Radio.Group>
+        </Form.Item>
+
         <Form.Item label="Quick Date Range">
           <Space wrap>
             <Button 
@@ -102,18 +116,16 @@ const ExportModal = ({ visible, onClose }: ExportModalProps) => {
           </Space>
         </Form.Item>
 
-        <Form.Item name="start_date" label="Start Date & Time">
+        <Form.Item name="start_date" label="From (MST day)">
           <DatePicker 
-            showTime 
-            format="YYYY-MM-DD HH:mm" 
+            format="YYYY-MM-DD" 
             style={{ width: '100%' }} 
           />
         </Form.Item>
 
-        <Form.Item name="end_date" label="End Date & Time">
+        <Form.Item name="end_date" label="To (MST day, inclusive)">
           <DatePicker 
-            showTime 
-            format="YYYY-MM-DD HH:mm" 
+            format="YYYY-MM-DD" 
             style={{ width: '100%' }} 
           />
         </Form.Item>
@@ -126,8 +126,14 @@ const ProjectModal = ({ visible, project, onClose }: ProjectModalProps) => {
       })
       
       console.log('handleSaveDraft: Sending data:', formData)
-      await projectAPI.saveDraft(formData)
+      const saved = await projectAPI.saveDraft(formData)
       message.success('Draft saved successfully')
+      if (saved.duplicates?.length) {
+        const others = saved.duplicates
+          .map((d) => `#${d.id} (${d.created_by__username}, ${d.stage})`)
+          .join(', ')
+        message.warning(`Application ${saved.application_number} is already logged: ${others}`, 6)
+      }
       setTimeout(() => onClose(true), 500) // Small delay to ensure UI updates
     } catch (error: any) {
       console.error('Save draft error:', error)
@@ -2,7 +2,7 @@ import { useState, useEffect } from 'react'
 import { Layout, Tabs, Button, message, Space } from 'antd'
 import { LogoutOutlined, PlusOutlined, DownloadOutlined } from '@ant-design/icons'
 import { useNavigate } from 'react-router-dom'
-import { authAPI } from '../services/api'
+import { authAPI, projectAPI } from '../services/api'
 import { useAuthStore } from '../store/authStore'
 import MyProjectsTab from '../components/Dashboard/MyProjectsTab'
 import TeamProjectsTab from '../components/Dashboard/TeamProjectsTab'
@@ -90,9 +90,15 @@ const Dashboard = () => {
     setProjectModalVisible(true)
   }
 
-  const handleEditProject = (project: Project) => {
-    setSelectedProject(project)
-    setProjectModalVisible(true)
+  const handleEditProject = async (project: Project) => {
+    // List rows only carry comment/content previews; edit the full record
+    try {
+      const detail = await projectAPI.getProjectDetail(project.id)
+      setSelectedProject(detail)
+      setProjectModalVisible(true)
+    } catch (error) {
+      message.error('Failed to load project details')
+    }
   }
 
   const handleProjectModalClose = (refreshData?: boolean) => {
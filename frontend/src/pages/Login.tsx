@@ -32,7 +32,11 @@ const Login = () => {
       message.success('Login successful!')
       navigate('/dashboard')
     } catch (error: any) {
-      message.error(error.response?.data?.message || 'Login failed. Please check your credentials.')
+      if (error.response?.status === 429) {
+        message.error(error.response.data?.error || error.response.data?.detail || 'Too many login attempts. Please try again later.')
+      } else {
+        message.error(error.response?.data?.message || 'Login failed. Please check your credentials.')
+      }
     } finally {
       setLoading(false)
     }
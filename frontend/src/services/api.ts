@@ -1,5 +1,5 @@
 import apiClient from '../utils/api'
-import { User, Project, ProjectFormData, LookupData, FilterOptions, ExportParams } from '../types'
+import { ApplicationMatch, User, UserSummary, UserQuery, CursorPage, Project, ProjectFormData, LookupData, LookupReplaceResult, FilterOptions, ExportParams } from '../types'
 
 // Authentication APIs
 export const authAPI = {
@@ -18,8 +18,15 @@ export const authAPI = {
     return response.data
   },
 
-  getUsers: async (): Promise<User[]> => {
-    const response = await apiClient.get('/api/auth/users/')
+  // Admin user list, one cursor page at a time (pass `cursor` from `next`)
+  getUsers: async (params?: UserQuery): Promise<CursorPage<User>> => {
+    const response = await apiClient.get('/api/auth/users/', { params })
+    return response.data
+  },
+
+  // id/username pairs for dropdowns, limited to users the caller can see
+  getUserDirectory: async (params?: UserQuery): Promise<CursorPage<UserSummary>> => {
+    const response = await apiClient.get('/api/auth/users/directory/', { params })
     return response.data
   },
 
@@ -49,8 +56,24 @@ export const projectAPI = {
     return response.data
   },
 
+  // Find projects by application number (case/space-insensitive; prefix optional)
+  lookupApplication: async (number: string, prefix = false): Promise<{ results: ApplicationMatch[] }> => {
+    const response = await apiClient.get('/api/application-lookup/', { params: { number, prefix } })
+    return response.data
+  },
+
+  // Get details for several projects in one request
+  getProjectDetails: async (
+    project_ids: number[]
+  ): Promise<{ results: Record<number, Project | { error: 'not_found' | 'forbidden' }> }> => {
+    const response = await apiClient.post('/api/get-logs-batch/', { project_ids })
+    return response.data
+  },
+
   // Save draft
-  saveDraft: async (data: ProjectFormData): Promise<Project> => {
+  saveDraft: async (
+    data: ProjectFormData
+  ): Promise<Project & { duplicates: ApplicationMatch[] }> => {
     const response = await apiClient.post('/api/save-log/', data)
     return response.data
   },
@@ -88,6 +111,19 @@ export const lookupAPI = {
     return response.data
   },
 
+  // Replace the active values of one lookup type (admin only)
+  replaceLookupValues: async (
+    lookupType: 'court' | 'reviewer',
+    values: string[],
+    deactivateMissing = true
+  ): Promise<LookupReplaceResult> => {
+    const response = await apiClient.put(`/api/lookup-data/${lookupType}/`, {
+      values,
+      deactivate_missing: deactivateMissing,
+    })
+    return response.data
+  },
+
   // Get filter options for My Projects
   getFilterOptions: async (): Promise<FilterOptions> => {
     const response = await apiClient.get('/api/filter-options/')
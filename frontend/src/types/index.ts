@@ -4,12 +4,32 @@ export interface User {
   email: string
   first_name: string
   last_name: string
-  role: 'admin' | 'user'
+  role: 'admin' | 'team_lead' | 'user'
   team: string
   is_active: boolean
   created_at: string
 }
 
+export interface UserSummary {
+  id: number
+  username: string
+}
+
+export interface UserQuery {
+  q?: string
+  team?: string
+  role?: User['role']
+  is_active?: boolean
+  page_size?: number
+  cursor?: string
+}
+
+export interface CursorPage<T> {
+  next: string | null
+  previous: string | null
+  results: T[]
+}
+
 export interface Project {
   id: number
   completed_date: string
@@ -24,8 +44,10 @@ export interface Project {
   total_time?: number
   partner_installer_account?: string
   third_party_salesforce?: 'YES' | 'NO'
-  comments?: string
-  content?: string
+  comments?: string // detail only
+  content?: string // detail only
+  comments_preview?: string // list rows: first 200 characters
+  content_preview?: string // list rows: first 200 characters
   is_new_learning: boolean
   is_redline: boolean
   created_by: number
@@ -36,6 +58,17 @@ export interface Project {
   is_deleted: boolean
 }
 
+export interface ApplicationMatch {
+  id: number
+  application_number: string
+  account_name: string
+  stage: 'Started' | 'Completed'
+  project_status: Project['project_status'] | null
+  created_by_id: number
+  created_by__username: string
+  created_at: string
+}
+
 export interface ProjectFormData {
   id?: number
   completed_date?: string // Optional - auto-set by backend on submit
@@ -56,18 +89,26 @@ export interface ProjectFormData {
 }
 
 export interface LookupData {
+  version: number
   courts: string[]
   reviewers: string[]
   statuses: string[]
   third_party_options: string[]
 }
 
+export interface LookupReplaceResult {
+  added: number
+  reactivated: number
+  deactivated: number
+  version: number
+}
+
 export interface FilterOptions {
   courts: string[]
   reviewers: string[]
   statuses: string[]
   stages: string[]
-  creators?: { id: number; username: string }[]
+  creators?: UserSummary[]
 }
 
 export interface ProjectFilters {
@@ -80,10 +121,19 @@ export interface ProjectFilters {
   created_by?: number
   completed_date_from?: string
   completed_date_to?: string
+  created_date_from?: string
+  created_date_to?: string
+  start_date_from?: string
+  start_date_to?: string
+  created_week?: string
+  created_month?: string
 }
 
+export type ExportDateField = 'completed' | 'created' | 'started'
+
 export interface ExportParams {
   start_date?: string
   end_date?: string
+  date_field?: ExportDateField
   project_ids?: number[]
 }